@@ -1,11 +1,37 @@
 #!/usr/bin/env python3
 
+import argparse
+import io
+import mmap
+import os
 import sys
-from typing import List
-
-from SymbolTable import SymbolTable
-from Parser import Parser
-from Code import Code
+import time
+from array import array
+from contextlib import contextmanager, nullcontext
+from itertools import repeat
+
+try:
+    from .SymbolTable import SymbolTable
+    from .Parser import Parser
+    from .Code import Code
+    from .HackFile import HackFile
+    from .Cache import AssemblyCache
+    from .Profiler import Profile
+    from .Optimizer import Optimizer
+    from .Diagnostics import Diagnostic, AssemblyError
+    from .SourceMap import SourceMap
+except ImportError:  # Run as a script from inside the Assembler/ directory
+    from SymbolTable import SymbolTable
+    from Parser import Parser
+    from Code import Code
+    from HackFile import HackFile
+    from Cache import AssemblyCache
+    from Profiler import Profile
+    from Optimizer import Optimizer
+    from Diagnostics import Diagnostic, AssemblyError
+    from SourceMap import SourceMap
+
+__version__ = "1.2.0"
 
 
 class Assembler:
@@ -13,170 +39,487 @@ class Assembler:
     The Assembler class contains the main logic of the Hack Assembler.
     """
 
-    def __init__(self):
+    # Programs with fewer instruction records are encoded serially, even with jobs > 1: starting a pool of worker
+    # processes costs more than encoding them (about 0.6us per record, against 50-100ms to start the pool)
+    PARALLEL_MIN_INSTRUCTIONS = 200_000
+
+    # The modules whose code produces the output files, see Assembler.cache_version
+    OUTPUT_MODULES = ("Assembler.py", "Parser.py", "Code.py", "CodeTable.py", "SymbolTable.py", "HackFile.py",
+                      "Optimizer.py")
+
+    def __init__(self, profile=None, intern_symbols=False):
+        """
+        :param profile: an optional Profile to collect instrumentation of the assembly into. If it is not given, a
+        Profile is only collected if the HACK_ASM_PROFILE environment variable is set.
+        :param intern_symbols: if True, the tokenized instructions and the SymbolTable share a single interned string
+        per symbol, saving memory for programs with tens of thousands of labels
+        """
+        self.intern_symbols = intern_symbols
+        self.reset()
+        self.profile = profile if profile is not None else Profile.from_environment()
+
+    def reset(self):
+        """
+        Resets the state of the assembly (the SymbolTable and the next variable address), so that the Assembler can
+        assemble another program.
+        """
         self.symbol_address = 16
         self.symbol_table = SymbolTable()  # Initialise the default symbol table
 
-    def assemble(self, asm_infile):
+    @staticmethod
+    def cache_version():
+        """
+        :return: the version of the Assembler in the keys of the AssemblyCache: __version__, plus the content hash of
+        the modules producing the output files, so that entries cached by another build are never reused
+        """
+        here = os.path.dirname(os.path.abspath(__file__))
+        return __version__ + "+" + AssemblyCache.fingerprint(
+            os.path.join(here, module) for module in Assembler.OUTPUT_MODULES)
+
+    def assemble(self, asm_infile, out_format="hack", byteorder="little", stream=False, jobs=1, out_dir="out_hack/",
+                 verbose=True, cache=None, optimize=False, source_map=False, compress=None):
         """
-        The Assemble method of the assembler is where all of the magic happens. It contains four abstracted methods
-        to simply read the text file, conduct a first pass to parse all labels in the file, conduct a second pass to
-        translate A- and C- instructions to 16-bit binary code, then output to a '.hack' text file.
+        The Assemble method of the assembler is where all of the magic happens. It contains five abstracted methods
+        to simply read the text file, tokenize it once into instruction records, conduct a first pass to parse all
+        labels in the file, conduct a second pass to translate A- and C- instructions to 16-bit machine code words,
+        then output to a '.hack' text file (or a '.bin' binary ROM image).
+        :param asm_infile: the '.asm' file to be assembled
+        :param out_format: "hack" for the textual '.hack' format, or "bin" for a raw binary ROM image
+        :param byteorder: byte order of the words of a binary ROM image, "little" or "big"
+        :param stream: if True, stream both passes from a memory-mapped file instead of holding the source in memory
+        :param jobs: number of worker processes of the second pass (ignored when streaming, and for programs of fewer
+        than Assembler.PARALLEL_MIN_INSTRUCTIONS instruction records)
+        :param out_dir: out directory for which to write the output file to
+        :param verbose: if True, print when the assembly is completed
+        :param cache: an optional AssemblyCache; if the source is unchanged since it was cached, both passes are skipped
+        and the output file is only refreshed from the cache
+        :param optimize: if True, run the peephole Optimizer between the first pass and the second pass (ignored when
+        streaming)
+        :param source_map: if True, also write the SourceMap of the program next to the output file, as a '.map' file
+        (ignored when streaming). The cache only holds output files, so it is then bypassed.
+        :param compress: "gz" or "xz" to compress the output file as it is written, e.g. to 'Pong.hack.gz', or None.
+        Compressed '.asm.gz' and '.asm.xz' sources are always decompressed as they are read, whatever this option.
+        :raises AssemblyError: with the Diagnostics of every error of the program, if it is invalid
         :return:
         """
-        file: List[str] = self.read_file(asm_infile)
-        self.first_pass(file)
-        file = self.second_pass(file)
-        self.write_file(file, asm_infile)
-        print("Assembly completed.")
+        profile = self.profile
+        if profile is not None:
+            profile.program = asm_infile
+
+        extension = "." + out_format + ("." + compress if compress else "")
+        out_filename = self.get_out_filename(asm_infile, out_dir, extension=extension)
+        if source_map and not stream:
+            cache = None
+        if cache is not None:
+            key = cache.key(asm_infile, out_format, byteorder, optimize and not stream, compress)
+            hit = cache.fetch(key, out_filename)
+            if profile is not None:
+                profile.record_counter("cache_hits", cache.hits)
+                profile.record_counter("cache_misses", cache.misses)
+            if hit:
+                self.report_profile()
+                if verbose:
+                    print("Assembly completed (cached).")
+                return
+
+        c_table_size = len(Code._c_instruction_words)
+        try:
+            self.assemble_file(asm_infile, out_filename, byteorder, stream, jobs, verbose, optimize, source_map)
+        except ValueError as error:
+            if stream and os.path.exists(out_filename):
+                os.remove(out_filename)  # Streamed words were written up to the error
+            # The fast path stops at the first error: only then, scan the program again to diagnose all of them
+            raise self.diagnose(self.read_file(asm_infile), asm_infile) or error from None
+        if profile is not None:
+            profile.record_counter("c_table_misses", len(Code._c_instruction_words) - c_table_size)
+            profile.record_counter("variables", self.symbol_address - 16)
+        if cache is not None:
+            cache.store(key, out_filename)
+        self.report_profile()
+        if verbose:
+            print("Assembly completed.")
+
+    def assemble_file(self, asm_infile, out_filename, byteorder, stream, jobs, verbose, optimize, source_map=False):
+        """
+        The stages of Assembler.assemble, from reading the '.asm' file to writing the output file.
+        """
+        profile = self.profile
+        if stream:
+            words = self.iter_mapped_words(asm_infile)
+        else:
+            with self.stage("read_file"):
+                file: list[str] = self.read_file(asm_infile)
+            line_numbers = array("I") if source_map else None
+            with self.stage("tokenize"):
+                if profile is not None:
+                    file = profile.timed_lines(file)
+                instructions = Parser.tokenize(file, self.intern_symbols, line_numbers)
+                if profile is not None:
+                    instructions = list(profile.count_instructions(instructions))
+            with self.stage("first_pass"):
+                self.first_pass(instructions)
+            self.record_symbols("first_pass")
+            if optimize:
+                with self.stage("optimize"):
+                    instructions = self.optimize(instructions, verbose, line_numbers)
+            with self.stage("second_pass"):
+                if jobs > 1 and len(instructions) >= self.PARALLEL_MIN_INSTRUCTIONS:
+                    words = self.second_pass_parallel(instructions, jobs)
+                else:
+                    words = self.second_pass(instructions)
+            self.record_symbols("second_pass")
+            if source_map:
+                with self.stage("source_map"):
+                    SourceMap.from_program(asm_infile, instructions, line_numbers, self.symbol_table).write(
+                        SourceMap.map_filename(out_filename))
+
+        with self.stage("stream" if stream else "write_file"):  # Streamed words are encoded as they are written
+            self.write_file(words, asm_infile, out_filename=out_filename, byteorder=byteorder)
+
+    def assemble_source(self, source, optimize=False, filename="<source>"):
+        """
+        Assembles a program held in memory, without touching the disk. The Assembler is reset first, so the same
+        Assembler can serve any number of programs, one at a time (use one Assembler per concurrent program).
+        :param source: the Hack assembly program, either a string, a bytes-like buffer, or an iterable of lines
+        :param optimize: if True, run the peephole Optimizer between the first pass and the second pass
+        :param filename: the name of the program in its Diagnostics
+        :raises AssemblyError: with the Diagnostics of every error of the program, if it is invalid
+        :return: an array('H') of 16-bit machine code words
+        """
+        self.reset()
+        lines = self.source_lines(source)
+        if iter(lines) is lines:
+            lines = list(lines)  # A one-shot iterator of lines could not be scanned again to diagnose errors
+        try:
+            instructions = Parser.tokenize(lines, self.intern_symbols)
+            self.first_pass(instructions)
+            if optimize:
+                instructions = self.optimize(instructions, verbose=False)
+            return self.second_pass(instructions)
+        except ValueError as error:
+            raise self.diagnose(lines, filename) or error from None
+
+    def diagnose(self, lines, filename="<source>"):
+        """
+        Scans a program which failed to assemble, collecting the Diagnostics of all of its errors instead of stopping at
+        the first one. The source line numbers of the instructions are tracked in an array('I') alongside them, and the
+        columns are only located in the source lines of the errors.
+        :param lines: a sequence of the lines of the program
+        :param filename: the name of the program in the Diagnostics
+        :return: an AssemblyError of the Diagnostics, or None if no error is found
+        """
+        lines = list(self.decoded_lines(lines))
+        diagnostics = []
+
+        def error(line_number, column, code, message):
+            diagnostics.append(Diagnostic(filename, line_number, column, code, message))
+
+        line_numbers = array("I")
+        instructions = Parser.tokenize(lines, line_numbers=line_numbers, errors=error)
+        resolver = Assembler()  # Resolves the symbols again, to find those whose address does not fit
+        resolver.first_pass(instructions)
+        for instruction, line_number in zip(instructions, line_numbers):
+            if instruction[0] == Parser.A_SYMBOL:
+                try:
+                    resolver.a_instruction_to_symbol_table(instruction[1])
+                except ValueError as exception:
+                    error(line_number, Diagnostic.locate_column(lines[line_number - 1], 0), "E003", str(exception))
+            if instruction[0] != Parser.C:
+                continue
+            line, dest, comp, jump = instruction[1:]
+            offsets = {"dest": 0, "comp": len(dest) + 1 if dest else 0, "jump": len(line) - len(jump or "")}
+            for field, message in Code.invalid_fields(dest, comp, jump):
+                column = Diagnostic.locate_column(lines[line_number - 1], offsets[field])
+                error(line_number, column, Diagnostic.FIELD_CODES[field], message)
+        return AssemblyError(diagnostics) if diagnostics else None
+
+    def optimize(self, instructions, verbose=True, line_numbers=None):
+        """
+        Runs the peephole Optimizer over the program, after the first pass. Removing instructions moves the labels
+        after them, so the SymbolTable is then rebuilt by a new first pass over the optimized program.
+        :param instructions: the tokenized program, after the first pass
+        :param verbose: if True, print the number of instructions saved
+        :param line_numbers: an optional array('I') of the source line numbers of the records, which is updated in place
+        to the optimized records. A record made by the Optimizer (e.g. a collapsed sequence, or a jump target replaced
+        with a label) takes the line of the first record it replaces.
+        :return: the optimized list of instruction records
+        """
+        num_instructions = sum(instruction[0] != Parser.LABEL for instruction in instructions)
+        optimized, saved = Optimizer.optimize(instructions)
+        if line_numbers is not None and optimized is not instructions:
+            indices = {id(instruction): index for index, instruction in enumerate(instructions)}
+            optimized_lines = array("I")
+            next_index = 0  # Index of the first record after the records kept so far
+            for instruction in optimized:
+                index = indices.get(id(instruction))
+                if index is None:
+                    index = min(next_index, len(instructions) - 1)
+                else:
+                    next_index = index + 1
+                optimized_lines.append(line_numbers[index])
+            line_numbers[:] = optimized_lines
+        if optimized is not instructions:  # Even with nothing removed, literal jump targets may now be labels
+            self.reset()
+            self.first_pass(optimized)
+        instructions = optimized
+        if self.profile is not None:
+            self.profile.record_counter("instructions_saved", saved)
+        if verbose:
+            print(f"Optimized away {saved} of {num_instructions} instructions "
+                  f"({num_instructions - saved} words, {saved / max(num_instructions, 1):.1%} smaller).")
+        return instructions
+
+    def assemble_to(self, source, sink, out_format="hack", byteorder="little"):
+        """
+        Assembles a program held in memory into any file-like sink, e.g. an open file or an io.BytesIO.
+        :param source: the Hack assembly program, either a string, a bytes-like buffer, or an iterable of lines
+        :param sink: a file-like object with a write method
+        :param out_format: "hack" for the textual '.hack' format, or "bin" for a raw binary ROM image
+        :param byteorder: byte order of the words of a raw binary ROM image, "little" or "big"
+        :return: an array('H') of 16-bit machine code words
+        """
+        words = self.assemble_source(source)
+        HackFile.write(words, sink, out_format, byteorder)
+        return words
+
+    @staticmethod
+    def source_lines(source):
+        """
+        :param source: a Hack assembly program, either a string, a bytes-like buffer, or an iterable of lines
+        :return: an iterable of the lines of the program
+        """
+        if isinstance(source, str):
+            return source.splitlines()
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            return bytes(source).decode().splitlines()
+        return source
+
+    def iter_words(self, source):
+        """
+        Assembles a program held in memory as a stream: a generator chain of lines, to instruction records, to
+        machine code words, which yields each word as soon as it is encoded, so that a consumer can start before the
+        assembly finishes. Labels may be referenced before they are defined, so the first pass still has to scan the
+        whole program before the first word is yielded. Strings and bytes-like buffers are scanned twice without
+        being split into a list of lines; a one-shot iterator of lines can only be scanned once, so its (compact)
+        instruction records are kept for the second pass.
+        :param source: the Hack assembly program, either a string, a bytes-like buffer, or an iterable of lines
+        :return: a generator of 16-bit machine code words
+        """
+        self.reset()
+        if isinstance(source, (str, bytes, bytearray, memoryview)):
+            new_lines = io.StringIO if isinstance(source, str) else io.BytesIO
+            self.first_pass(Parser.iter_instructions(self.decoded_lines(new_lines(source))))
+            yield from self.iter_encode(Parser.iter_instructions(self.decoded_lines(new_lines(source))))
+        elif iter(source) is source:
+            instructions = Parser.tokenize(source, self.intern_symbols)
+            self.first_pass(instructions)
+            yield from self.iter_encode(instructions)
+        else:
+            self.first_pass(Parser.iter_instructions(source))
+            yield from self.iter_encode(Parser.iter_instructions(source))
+
+    @staticmethod
+    def decoded_lines(lines):
+        """
+        :param lines: an iterable of lines, either strings or bytes
+        :return: a generator of the lines as strings
+        """
+        for line in lines:
+            yield line if isinstance(line, str) else line.decode()
+
+    def assemble_mapped(self, asm_infile):
+        """
+        Assembles a memory-mapped file, for very large sources (see Assembler.iter_mapped_words).
+        :param asm_infile: the '.asm' file to be assembled
+        :return: an array('H') of 16-bit machine code words
+        """
+        return array("H", self.iter_mapped_words(asm_infile))
+
+    def iter_mapped_words(self, asm_infile):
+        """
+        Assembles a memory-mapped file as a stream, for very large sources. Neither the lines of the source nor its
+        instruction records are ever held as a whole: the first pass streams the mapped file to record only the label
+        positions, then the second pass streams it again, yielding each word as soon as it is encoded. Peak memory
+        scales with the SymbolTable, not with the size of the source. A compressed source cannot be mapped, so it is
+        decompressed as a stream twice instead.
+        :param asm_infile: the '.asm' file to be assembled
+        :return: a generator of 16-bit machine code words
+        """
+        with self.source_passes(asm_infile) as iter_lines:
+            with self.stage("first_pass"):
+                self.first_pass(Parser.iter_instructions(iter_lines()))
+            self.record_symbols("first_pass")
+
+            lines = iter_lines()
+            if self.profile is None:
+                yield from self.iter_encode(Parser.iter_instructions(lines))
+            else:
+                lines = self.profile.timed_lines(lines)
+                yield from self.iter_encode(self.profile.count_instructions(Parser.iter_instructions(lines)))
+            self.record_symbols("second_pass")
+
+    def stage(self, name):
+        """
+        :param name: name of a stage of the assembly, e.g. "first_pass"
+        :return: a context manager timing the stage into the Profile, or doing nothing when not profiling
+        """
+        if self.profile is None:
+            return nullcontext()
+        return self.profile.stage(name)
+
+    def record_symbols(self, stage):
+        """
+        Records the size of the SymbolTable after a stage of the assembly into the Profile, if profiling.
+        :param stage: name of the stage of the assembly
+        """
+        if self.profile is not None:
+            self.profile.record_symbols(stage, len(self.symbol_table))
+
+    def report_profile(self):
+        """
+        Prints the report of the Profile to stderr, if profiling.
+        """
+        if self.profile is not None:
+            print(self.profile.report(), file=sys.stderr)
 
-    def first_pass(self, file):
+    def first_pass(self, instructions):
         """
         In the first pass, the entire program is scanned. For each Label 'L instruction' (xxx), add the pair
         (xxx, line_num) to the symbol table.
-        :param: the input 'file' to be parsed (actually a List of strings).
+        :param instructions: the tokenized program to be scanned (an iterable of instruction records from Parser)
         """
         line_num = 0
-        for line in file:
-            line = Parser.clean_line(line)  # Strip comments and whitespace
-            if not line:  # If line is empty, then it is not an instruction
-                continue
-            if Parser.is_label_instruction(line):
-                self.label_instruction_to_symbol_table(line, line_num)
+        for instruction in instructions:
+            if instruction[0] == Parser.LABEL:
+                self.label_instruction_to_symbol_table(instruction[1], line_num)
                 continue  # To skip the line_num increment
-            line_num += 1  # Line number is only counted if line is A-/C-instruction (not blank or a label)
+            line_num += 1  # Line number is only counted if line is A-/C-instruction (not a label)
 
-    def second_pass(self, file):
+    def second_pass(self, instructions):
         """
-        In the second pass, the assembler iterates through all the script and parses only A and C instructions.
+        In the second pass, the assembler iterates through all the instruction records and translates only A and C
+        instructions.
 
-        For each line:
+        For each instruction:
         - If it is an A instruction variable, the program try to append the variable/symbol:address pair to the
         SymbolTable. The program then indexes into SymbolTable to get the address of the Symbol.
-        - If it is an A instruction address, the program simply gets the address of the Symbol.
-        - If it is a C instruction, the program parses the 'a' op code, comp, dest, and jump codes of the instruction.
+        - If it is an A instruction address, the program simply uses the parsed address.
+        - If it is a C instruction, the program looks up its machine code in the Code table of C instructions.
 
-        Each line is then appended to a list 'out_lines' containing a list of strings of machine code (binary numbers).
+        Each machine code word is then appended to an array('H') 'words' of 16-bit words.
 
-        :file:
-        :return: list of strings of 16-bit binary numbers sequentially representing the A- and C- instructions.
+        :param instructions: the tokenized program to be translated (an iterable of instruction records from Parser)
+        :return: an array('H') of 16-bit machine code words sequentially representing the A- and C- instructions.
         """
-        out_lines = []
-
-        line_num = 0
-        for line in file:
-            line = Parser.clean_line(line)
-            out_line = ""
+        words = array("H")
+        append = words.append
 
-            if not line:
-                continue
+        for instruction in instructions:
+            kind = instruction[0]
 
-            if Parser.is_label_instruction(line):
+            if kind == Parser.LABEL:
                 continue
 
-            if Parser.is_a_instruction(line):
-                self.a_instruction_to_symbol_table(line)
-                out_line = self.a_instruction_to_binary(line, out_line)
+            if kind == Parser.A_ADDRESS:
+                append(instruction[1])  # A instructions are a "0" followed by a 15-bit address
 
-            elif Parser.is_c_instruction(line):
-                out_line = self.c_instruction_to_binary(line, out_line)
+            elif kind == Parser.A_SYMBOL:
+                append(self.a_instruction_to_symbol_table(instruction[1]))
 
             else:
-                raise Exception(f"Line \"{line}\": Parser has not identified an A or C instruction")
-
-            line_num += 1
-            out_line += "\n"
-            out_lines.append(out_line)
+                append(Code.encode_c_instruction(instruction[1]))
 
-        return out_lines
+        return words
 
-    def a_instruction_to_symbol_table(self, line):
+    def iter_encode(self, instructions):
         """
-        Parses an A instruction (e.g. @21 or @LOOP). If it is an address, ignore. If it is a variable, add variable
-        and corresponding symbol address (maintained in self Assembly instance) to the self SymbolTable dictionary.
-        :param line: A instruction line to be parsed and appended to SymbolTable
-        :return: a Bool value representing whether the append to SymbolTable was a success.
+        The second pass as a generator: translates A and C instructions exactly as second_pass does, but yields each
+        16-bit machine code word as soon as it is encoded.
+        :param instructions: the tokenized program to be translated (an iterable of instruction records from Parser)
+        :return: a generator of 16-bit machine code words
         """
-        if Parser.is_a_instruction_is_address(line):
-            return True
-
-        elif Parser.is_a_instruction_is_variable(line):
-            variable_string = Parser.parse_a_instruction_variable(line)
-            symbol_added = self.symbol_table.add_symbol(variable_string, self.symbol_address)
-            if symbol_added:
-                self.symbol_address += 1
-            if self.symbol_table.get_address(variable_string):
-                return True
+        for instruction in instructions:
+            kind = instruction[0]
+            if kind == Parser.LABEL:
+                continue
+            if kind == Parser.A_ADDRESS:
+                yield instruction[1]
+            elif kind == Parser.A_SYMBOL:
+                yield self.a_instruction_to_symbol_table(instruction[1])
             else:
-                return False
-        else:
-            raise Exception("A instruction identified, but cannot parse address or variable.")
-
-    def label_instruction_to_symbol_table(self, line, line_num):
-        label_string = Parser.parse_label_instruction(line)
-        self.symbol_table.add_symbol(label_string, line_num)
+                yield Code.encode_c_instruction(instruction[1])
 
-    def a_instruction_to_binary(self, line, out_line):
+    def second_pass_parallel(self, instructions, jobs, chunks_per_job=4):
         """
-        Converts a line of A instruction to a 16-bit binary string
-        :param line: A instruction line to be converted
-        :param out_line: the output 16-bit binary string to be returned
-        :return: a 16-bit binary string representing the original assembly language A instruction
+        A parallel second pass, producing the same words as second_pass. Once the first pass has resolved all labels,
+        the only serial dependency left is the addresses of the variables, which are assigned in first-seen order. So
+        the variables are first allocated in a cheap serial scan, then the instructions are split into chunks which
+        are encoded by a pool of worker processes against the now frozen SymbolTable, and stitched back in order.
+        Pickling a record costs more than encoding it, so where worker processes can be forked, they inherit the
+        records and the SymbolTable, and are only sent the bounds of their chunks; elsewhere, each chunk of records is
+        sent with the SymbolTable.
+        :param instructions: the tokenized program to be translated (a list of instruction records)
+        :param jobs: number of worker processes
+        :param chunks_per_job: number of chunks per worker process, to balance the load across the pool
+        :return: an array('H') of 16-bit machine code words sequentially representing the A- and C- instructions.
         """
-
-        out_line += "0"  # A instructions begin with "0" and end with a 15-bit address.
-
-        if Parser.is_a_instruction_is_address(line):
-            address_string = Parser.parse_a_instruction_address(line)
-            address_int = int(address_string)
-            address_binary = self.to_binary_number(address_int, 15)
-
-        elif Parser.is_a_instruction_is_variable(line):
-            variable_string = Parser.parse_a_instruction_variable(line)
-            address_int = self.symbol_table.get_address(variable_string)
-            address_binary = self.to_binary_number(address_int, 15)
-
-        else:
-            raise Exception("A instruction identified, but cannot identify address or variable")
-
-        out_line += address_binary
-
-        return out_line
-
-    def c_instruction_to_binary(self, line, out_line):
+        import multiprocessing  # Imported on demand, only parallel passes use worker processes
+        from concurrent.futures import ProcessPoolExecutor
+
+        global _forked_program
+        self.allocate_variables(instructions)
+
+        chunk_size = max(1, -(-len(instructions) // (jobs * chunks_per_job)))
+        starts = range(0, len(instructions), chunk_size)
+
+        words = array("H")
+        if "fork" in multiprocessing.get_all_start_methods():
+            _forked_program = (instructions, self.symbol_table)  # The workers are forked within the with statement
+            try:
+                with ProcessPoolExecutor(max_workers=jobs, mp_context=multiprocessing.get_context("fork")) as pool:
+                    for chunk_words in pool.map(encode_forked_chunk, starts, repeat(chunk_size)):
+                        words.extend(chunk_words)
+            finally:
+                _forked_program = None
+            return words
+
+        chunks = [instructions[start:start + chunk_size] for start in starts]
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            for chunk_words in pool.map(encode_instructions, chunks, repeat(self.symbol_table)):
+                words.extend(chunk_words)
+        return words
+
+    def allocate_variables(self, instructions):
         """
-        Converts a line of C instruction to a 16-bit binary string
-        :param line: C instruction line to be converted
-        :param out_line: the output 16-bit binary string to be returned
-        :return: a 16-bit binary string representing the original assembly language C instruction
+        Adds every variable (an A instruction symbol which is not a label or a predefined symbol) to the SymbolTable,
+        assigning addresses from 16 upwards in the order the variables are first seen, exactly as the second pass does.
+        :param instructions: the tokenized program, after the first pass has added its labels to the SymbolTable
         """
-        out_line += "111"  # C instructions begin with "111" in binary, then end with 'a' op code, comp, dest, jump.
-
-        comp_code = Parser.parse_c_instruction_comp(line)
-        comp_binary = Code.decode_comp_code(comp_code)
+        for instruction in instructions:
+            if instruction[0] == Parser.A_SYMBOL:
+                self.a_instruction_to_symbol_table(instruction[1])
 
-        dest_code = Parser.parse_c_instruction_dest(line)
-        dest_int = Code.decode_dest_code(dest_code)
-        dest_binary = self.to_binary_number(dest_int, 3)
-
-        jump_code = Parser.parse_c_instruction_jump(line)
-        jump_int = Code.decode_jump_code(jump_code)
-        jump_binary = self.to_binary_number(jump_int, 3)
-
-        out_line += comp_binary + dest_binary + jump_binary
-
-        return out_line
-
-    def to_binary_number(self, integer: int, bits: int) -> str:
+    def a_instruction_to_symbol_table(self, symbol):
         """
-        Converts an integer to binary
-        :param integer: Int to be turned to binary
-        :param bits: Number of bits in binary number
-        :return: a string of an x-bit binary number representing the integer
+        Resolves the symbol of an A instruction (e.g. LOOP from @LOOP). If it is not yet in the SymbolTable, it is a
+        variable: add the variable and corresponding symbol address (maintained in self Assembly instance) to the self
+        SymbolTable dictionary.
+        :param symbol: A instruction symbol to be resolved and, if new, appended to SymbolTable
+        :raises ValueError: if the address of the symbol does not fit in the 15 bits of an A instruction, e.g. a label
+        past ROM[32767]
+        :return: the address of the symbol
         """
-        binary = bin(integer)[2:]
-        binary_fill = binary.zfill(bits)
-        return str(binary_fill)
+        symbol_added = self.symbol_table.add_symbol(symbol, self.symbol_address)
+        if symbol_added:
+            self.symbol_address += 1
+        address = self.symbol_table.get_address(symbol)
+        if address > Parser.MAX_ADDRESS:
+            raise ValueError(f"A instruction \"@{symbol}\": address {address} of the symbol is larger than "
+                             f"{Parser.MAX_ADDRESS}")
+        return address
+
+    def label_instruction_to_symbol_table(self, label, line_num):
+        self.symbol_table.add_symbol(label, line_num)
 
     def update_symbol_table(self, symbol, address=None):
         """
@@ -192,53 +535,273 @@ class Assembler:
         self.symbol_address += 1
         return symbol_added
 
-    def read_file(self, filename) -> List[str]:
+    def read_file(self, filename) -> list[str]:
         """
         :param filename: filename of the text file to be read
         :return: a list of strings for each line in the file.
         """
-        file = open(filename, "r")
-        lines = file.readlines()
-        file.close()
-        return lines
+        with HackFile.open_file(filename, "rt") as file:  # A compressed '.asm.gz' or '.asm.xz' file is decompressed
+            return file.readlines()
+
+    @contextmanager
+    def source_passes(self, filename):
+        """
+        Opens a source to be scanned in several passes, for the duration of a with statement: a plain file is
+        memory-mapped once, while a compressed file is decompressed again as a stream on each pass.
+        :param filename: filename of the text file to be scanned, which may be compressed
+        :return: a function returning a new generator of strings for each line in the file, on each call
+        """
+        if HackFile.compression(filename) is None:
+            with self.map_file(filename) as mapped:
+                yield lambda: self.iter_mapped_lines(mapped)
+        else:
+            yield lambda: self.iter_compressed_lines(filename)
+
+    @staticmethod
+    def iter_compressed_lines(filename):
+        """
+        :param filename: filename of a compressed text file
+        :return: a generator of strings for each line in the file, decompressing a chunk at a time
+        """
+        with HackFile.open_file(filename, "rt") as file:
+            yield from file
+
+    @contextmanager
+    def map_file(self, filename):
+        """
+        Memory-maps a file read-only, for the duration of a with statement.
+        :param filename: filename of the text file to be mapped
+        :return: a read-only mmap of the file, or None if the file is empty (empty files cannot be mapped)
+        """
+        with open(filename, "rb") as file:
+            if not file.seek(0, 2):
+                yield None
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield mapped
+
+    def iter_mapped_lines(self, mapped):
+        """
+        Iterates over the lines of a memory-mapped file from its start, decoding a single line at a time.
+        :param mapped: a mmap of the text file, as given by map_file
+        :return: a generator of strings for each line in the file.
+        """
+        if mapped is None:
+            return
+        mapped.seek(0)
+        for line in iter(mapped.readline, b""):
+            yield line.decode()
 
-    def write_file(self, lines, in_filename, out_filename="", out_dir="out_hack/"):
+    def write_file(self, words, in_filename, out_filename="", out_dir="out_hack/", byteorder="little"):
         """
-        :param lines: a list of lines to be written to a text file
+        :param words: an array('H') of 16-bit machine code words to be written
         :param in_filename: if out_filename is not defined, in_filename is used to generate the out_filename
-        :param out_filename: out_filename is an optional
+        :param out_filename: out_filename is an optional, either a '.hack' text file or a '.bin' binary ROM image, which
+        is compressed as it is written if it ends with '.gz' or '.xz' (e.g. 'Pong.hack.gz')
         :param out_dir: out directory for which to write output .hack file to
+        :param byteorder: byte order of the words of a '.bin' binary ROM image, "little" or "big"
         :return:
         """
         if not out_filename:
             out_filename = self.get_out_filename(in_filename, out_dir)
-        if not out_filename.endswith(".hack"):
-            raise Exception(f"Output filename {out_filename} must be a '.hack' file")
-        outfile = open(out_filename, "w")
-        outfile.writelines("%s" % i for i in lines)
-        outfile.close()
+        uncompressed_name = HackFile.uncompressed_name(out_filename)
+        if uncompressed_name.endswith(HackFile.TEXT_EXTENSION):
+            HackFile.write_text(words, out_filename)
+        elif uncompressed_name.endswith(HackFile.ROM_EXTENSION):
+            HackFile.write_rom(words, out_filename, byteorder)
+        else:
+            raise Exception(f"Output filename {out_filename} must be a '.hack' or '.bin' file")
 
-    def get_out_filename(self, in_filename: str, out_dir: str):
+    def get_out_filename(self, in_filename: str, out_dir: str, extension=".hack"):
         """
         :param in_filename: take the in_filename and auto-generate the out_filename with .hack extension
         :param out_dir: out directory for which to write output .hack file to
+        :param extension: extension of the out_filename, ".hack" or ".bin", or a compressed one such as ".hack.gz"
         :return: string of the out_filename
         """
+        in_filename = HackFile.uncompressed_name(in_filename)
         if in_filename.endswith(".asm"):
             in_filename = in_filename.replace(".asm", "")
         if "/" in in_filename:  # If filename contains a path
             filepath = in_filename.split("/")
             in_filename = filepath[-1]
-        out_filename = out_dir + in_filename + ".hack"
+        out_filename = out_dir + in_filename + extension
         return out_filename
 
 
-if __name__ == '__main__':
+# The (instructions, SymbolTable) of the program of Assembler.second_pass_parallel, inherited by its forked workers
+_forked_program = None
 
-    if len(sys.argv) != 2:
-        print("PROGRAM NOT RUN. Usage: python Assembler.py Program.asm")
-        exit()
 
-    asm_file = sys.argv[1]
-    hack_assembler = Assembler()
-    hack_assembler.assemble(asm_file)
+def encode_forked_chunk(start, chunk_size):
+    """
+    Encodes a chunk of the program inherited by a forked worker process, see Assembler.second_pass_parallel.
+    :param start: index of the first instruction record of the chunk
+    :param chunk_size: number of instruction records of the chunk
+    :return: an array('H') of 16-bit machine code words
+    """
+    instructions, symbol_table = _forked_program
+    return encode_instructions(instructions[start:start + chunk_size], symbol_table)
+
+
+def encode_instructions(instructions, symbol_table):
+    """
+    Encodes instruction records into machine code words against a complete SymbolTable, in which every label and
+    variable has already been resolved. Defined at module level so that it can be run by a pool of worker processes.
+    :param instructions: a list of instruction records
+    :param symbol_table: a SymbolTable resolving every A instruction symbol in the instructions
+    :return: an array('H') of 16-bit machine code words
+    """
+    words = array("H")
+    append = words.append
+    for instruction in instructions:
+        kind = instruction[0]
+        if kind == Parser.LABEL:
+            continue
+        if kind == Parser.A_ADDRESS:
+            append(instruction[1])
+        elif kind == Parser.A_SYMBOL:
+            append(symbol_table.get_address(instruction[1]))
+        else:
+            append(Code.encode_c_instruction(instruction[1]))
+    return words
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Assembles Hack assembly '.asm' programs into Hack machine code.")
+    parser.add_argument("asm_files", nargs="+", help="the '.asm' programs to be assembled: files, directories of "
+                                                     "'.asm' files, or glob patterns")
+    parser.add_argument("--out-dir", default="out_hack/",
+                        help="out directory for which to write the output files to (default: out_hack/)")
+    parser.add_argument("--format", choices=["hack", "bin"], default="hack",
+                        help="write the textual '.hack' format, or a raw binary ROM image '.bin' (default: hack)")
+    parser.add_argument("--byteorder", choices=["little", "big"], default="little",
+                        help="byte order of the words of a binary ROM image (default: little)")
+    parser.add_argument("--stream", action="store_true",
+                        help="stream both passes from a memory-mapped file, for very large programs")
+    parser.add_argument("--jobs", type=int, default=1, metavar="N",
+                        help="use N worker processes: to assemble many programs in parallel, or to encode the second "
+                             "pass of a single program in chunks, if it has at least "
+                             f"{Assembler.PARALLEL_MIN_INSTRUCTIONS} instructions (default: 1)")
+    parser.add_argument("--optimize", action="store_true",
+                        help="remove redundant instructions with a peephole pass, e.g. repeated A instructions and "
+                             "jumps to the next instruction (not with --stream)")
+    parser.add_argument("--source-map", action="store_true",
+                        help="also write a '.map' source map of each program next to its output, mapping every ROM "
+                             "address to its source line, with the addresses of its labels and variables (not with "
+                             "--stream)")
+    parser.add_argument("--watch", action="store_true",
+                        help="keep running, and re-assemble a single program incrementally every time it is saved: "
+                             "only the changed lines are re-encoded, and only the changed words are rewritten")
+    parser.add_argument("--compress", choices=["gz", "xz"],
+                        help="compress each output as it is written, e.g. to 'Pong.hack.gz' (sources ending with '.gz' "
+                             "or '.xz' are always decompressed as they are read)")
+    parser.add_argument("--pipeline", action="store_true",
+                        help="overlap the I/O of many programs with their assembly: a reader thread reads the next "
+                             "sources ahead while a writer thread writes the finished outputs, and the utilization of "
+                             "each stage is printed (not with --stream, --source-map or --jobs)")
+    parser.add_argument("--queue-depth", type=int, default=4, metavar="N",
+                        help="with --pipeline, maximum number of sources read ahead, and of outputs waiting to be "
+                             "written (default: 4)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="always assemble, without reading or updating the cache of unchanged programs")
+    parser.add_argument("--cache-dir", default=AssemblyCache.DEFAULT_DIR,
+                        help=f"directory of the cache of assembled programs (default: {AssemblyCache.DEFAULT_DIR})")
+    parser.add_argument("--cache-size", type=int, default=AssemblyCache.DEFAULT_MAX_BYTES // (1024 * 1024),
+                        metavar="MB", help="size cap of the cache, least recently used programs are evicted first "
+                                           "(default: %(default)s)")
+    parser.add_argument("--diagnostics", choices=AssemblyError.FORMATS, default="text",
+                        help="print the errors of invalid programs to stderr as compact 'file:line:column: "
+                             "error[code]: message' lines, or as JSON (default: text)")
+    parser.add_argument("--profile", nargs="?", const="text", choices=Profile.FORMATS,
+                        help="print a profile of each stage of the assembly to stderr, as a text table (default) or "
+                             f"JSON. Also enabled by the {Profile.ENVIRONMENT_VARIABLE} environment variable.")
+    args = parser.parse_args(argv)
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.optimize and args.stream:
+        parser.error("--optimize needs the whole program in memory, it cannot be combined with --stream")
+    if args.source_map and args.stream:
+        parser.error("--source-map needs the whole program in memory, it cannot be combined with --stream")
+    if args.watch and (args.stream or args.optimize or args.source_map):
+        parser.error("--watch cannot be combined with --stream, --optimize or --source-map")
+    if args.pipeline and (args.stream or args.source_map or args.jobs > 1 or args.watch):
+        parser.error("--pipeline cannot be combined with --stream, --source-map, --jobs or --watch")
+    if args.queue_depth < 1:
+        parser.error("--queue-depth must be at least 1")
+    if args.profile:
+        os.environ[Profile.ENVIRONMENT_VARIABLE] = args.profile  # Also profiles the Assemblers of batch workers
+
+    try:
+        from .Batch import Batch
+    except ImportError:  # Run as a script from inside the Assembler/ directory
+        from Batch import Batch
+    try:
+        asm_files = Batch.expand_inputs(args.asm_files)
+    except FileNotFoundError as error:
+        parser.error(str(error))
+    out_dir = os.path.join(args.out_dir, "")  # get_out_filename expects a trailing separator
+    os.makedirs(out_dir, exist_ok=True)
+    if args.watch:
+        if len(asm_files) != 1:
+            parser.error("--watch watches a single program")
+        try:
+            from .Watch import Watch
+        except ImportError:  # Run as a script from inside the Assembler/ directory
+            from Watch import Watch
+        extension = "." + args.format + ("." + args.compress if args.compress else "")
+        out_filename = Assembler().get_out_filename(asm_files[0], out_dir, extension=extension)
+        print(f"Watching {asm_files[0]}, press Ctrl+C to stop.")
+        Watch.watch(asm_files[0], out_filename, args.format, args.byteorder, diagnostics=args.diagnostics)
+        return 0
+    cache = None
+    if not args.no_cache:
+        cache = AssemblyCache(args.cache_dir, args.cache_size * 1024 * 1024, version=Assembler.cache_version())
+
+    if args.pipeline:
+        start = time.perf_counter()
+        results, stats = Batch.assemble_pipeline(asm_files, out_dir, out_format=args.format, byteorder=args.byteorder,
+                                                 cache=cache, optimize=args.optimize, compress=args.compress,
+                                                 read_depth=args.queue_depth, write_depth=args.queue_depth)
+        print(Batch.summary(results, time.perf_counter() - start))
+        print(Batch.pipeline_report(stats))
+        return report_batch_diagnostics(results, args.diagnostics)
+
+    if len(asm_files) == 1:
+        hack_assembler = Assembler()
+        try:
+            hack_assembler.assemble(asm_files[0], out_format=args.format, byteorder=args.byteorder, stream=args.stream,
+                                    jobs=args.jobs, out_dir=out_dir, cache=cache, optimize=args.optimize,
+                                    source_map=args.source_map, compress=args.compress)
+        except AssemblyError as error:
+            print(error.format(args.diagnostics), file=sys.stderr)
+            return 1
+        return 0
+
+    start = time.perf_counter()
+    results = Batch.assemble_batch(asm_files, out_dir, jobs=args.jobs, out_format=args.format,
+                                   byteorder=args.byteorder, stream=args.stream, cache=cache, optimize=args.optimize,
+                                   source_map=args.source_map, compress=args.compress)
+    print(Batch.summary(results, time.perf_counter() - start))
+    return report_batch_diagnostics(results, args.diagnostics)
+
+
+def report_batch_diagnostics(results, diagnostics):
+    """
+    Prints the Diagnostics of the invalid programs of a batch to stderr, as the single program path does.
+    :param results: the results of Batch.assemble_batch or Batch.assemble_pipeline
+    :param diagnostics: "text" or "json", the format of the Diagnostics
+    :return: the exit status of the batch, 1 if any program failed, else 0
+    """
+    try:
+        from .Batch import Batch
+    except ImportError:  # Run as a script from inside the Assembler/ directory
+        from Batch import Batch
+    formatted = Batch.diagnostics(results, diagnostics)
+    if formatted is not None:
+        print(formatted, file=sys.stderr)
+    return 1 if any(error is not None for _, _, error in results) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
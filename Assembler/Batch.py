@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+
+import glob
+import io
+import os
+import time
+
+try:
+    from .Assembler import Assembler
+    from .Diagnostics import AssemblyError
+    from .HackFile import HackFile
+except ImportError:  # Run as a script from inside the Assembler/ directory
+    from Assembler import Assembler
+    from Diagnostics import AssemblyError
+    from HackFile import HackFile
+
+
+class Batch:
+    """
+    Batch is a class that provides helper functions to assemble many programs in one process (or one pool of worker
+    processes), rather than paying for a fresh interpreter per program. Every program is assembled by a fresh
+    Assembler, with its own SymbolTable.
+    """
+
+    @staticmethod
+    def expand_inputs(paths):
+        """
+        Expands input paths into '.asm' files: files are kept as they are, directories are expanded into the '.asm'
+        files they contain (including compressed '.asm.gz' and '.asm.xz' files), and anything else is expanded as a
+        glob pattern.
+        :param paths: a list of files, directories and glob patterns
+        :return: a list of '.asm' filenames, without duplicates, in the order they were given
+        """
+        asm_files = []
+        for path in paths:
+            if os.path.isfile(path):
+                asm_files.append(path)
+            elif os.path.isdir(path):
+                asm_files.extend(sorted(match for pattern in ("*.asm", "*.asm.gz", "*.asm.xz")
+                                        for match in glob.glob(os.path.join(path, pattern))))
+            else:
+                matches = sorted(glob.glob(path))
+                if not matches:
+                    raise FileNotFoundError(f"No '.asm' file matches {path}")
+                asm_files.extend(match for match in matches if os.path.isfile(match))
+        return list(dict.fromkeys(asm_files))
+
+    @staticmethod
+    def assemble_file(asm_file, out_dir, out_format="hack", byteorder="little", stream=False, cache=None,
+                      optimize=False, source_map=False, compress=None):
+        """
+        Assembles a single program with a fresh Assembler, catching any error so that one bad program does not stop
+        the rest of the batch.
+        :param asm_file: the '.asm' file to be assembled
+        :param out_dir: out directory for which to write the output file to
+        :param out_format: "hack" for the textual '.hack' format, or "bin" for a raw binary ROM image
+        :param byteorder: byte order of the words of a binary ROM image, "little" or "big"
+        :param stream: if True, stream both passes from a memory-mapped file
+        :param cache: an optional AssemblyCache of unchanged programs
+        :param optimize: if True, run the peephole Optimizer
+        :param source_map: if True, also write the SourceMap of the program
+        :param compress: "gz" or "xz" to compress the output file, or None
+        :return: a tuple of (asm_file, seconds taken, error or None), see Batch.error
+        """
+        start = time.perf_counter()
+        try:
+            Assembler().assemble(asm_file, out_format=out_format, byteorder=byteorder, stream=stream,
+                                 out_dir=out_dir, verbose=False, cache=cache, optimize=optimize,
+                                 source_map=source_map, compress=compress)
+        except Exception as error:
+            return asm_file, time.perf_counter() - start, Batch.error(error)
+        return asm_file, time.perf_counter() - start, None
+
+    @staticmethod
+    def error(exception):
+        """
+        :param exception: the exception raised while assembling a program of the batch
+        :return: the AssemblyError itself for an invalid program, so that its Diagnostics can still be formatted as
+        requested, or else an error message
+        """
+        if isinstance(exception, AssemblyError):
+            return exception
+        return f"{type(exception).__name__}: {exception}"
+
+    @staticmethod
+    def assemble_batch(asm_files, out_dir, jobs=1, out_format="hack", byteorder="little", stream=False, cache=None,
+                       optimize=False, source_map=False, compress=None):
+        """
+        Assembles many programs, across a pool of worker processes if jobs > 1.
+        :param asm_files: a list of '.asm' files to be assembled
+        :param out_dir: out directory for which to write the output files to
+        :param jobs: number of worker processes
+        :param out_format: "hack" for the textual '.hack' format, or "bin" for a raw binary ROM image
+        :param byteorder: byte order of the words of a binary ROM image, "little" or "big"
+        :param stream: if True, stream both passes of every program from a memory-mapped file
+        :param cache: an optional AssemblyCache of unchanged programs
+        :param optimize: if True, run the peephole Optimizer over every program
+        :param source_map: if True, also write the SourceMap of every program
+        :param compress: "gz" or "xz" to compress every output file, or None
+        :return: a list of (asm_file, seconds taken, error or None) tuples, in the order of asm_files, see Batch.error
+        """
+        options = (out_dir, out_format, byteorder, stream, cache, optimize, source_map, compress)
+        if jobs > 1 and len(asm_files) > 1:
+            from concurrent.futures import ProcessPoolExecutor  # Imported on demand: it imports multiprocessing
+
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                futures = [pool.submit(Batch.assemble_file, asm_file, *options) for asm_file in asm_files]
+                return [future.result() for future in futures]
+        return [Batch.assemble_file(asm_file, *options) for asm_file in asm_files]
+
+    @staticmethod
+    def assemble_pipeline(asm_files, out_dir, out_format="hack", byteorder="little", cache=None, optimize=False,
+                          compress=None, read_depth=4, write_depth=4):
+        """
+        Assembles many programs in a pipeline of three stages, so that the disk I/O of some programs overlaps the
+        assembly of others: a reader thread prefetches the sources of the next programs into a queue of at most
+        read_depth programs, the calling thread assembles them and renders their outputs, and a writer thread writes
+        each output in a single write, from a queue of at most write_depth outputs. File I/O and (de)compression
+        release the GIL, so on slow or network-backed disks most of the I/O time hides behind the assembly.
+        :param asm_files: a list of '.asm' files to be assembled
+        :param out_dir: out directory for which to write the output files to
+        :param out_format: "hack" for the textual '.hack' format, or "bin" for a raw binary ROM image
+        :param byteorder: byte order of the words of a binary ROM image, "little" or "big"
+        :param cache: an optional AssemblyCache of unchanged programs, fetched by the reader and stored by the writer
+        :param optimize: if True, run the peephole Optimizer over every program
+        :param compress: "gz" or "xz" to compress every output file, or None
+        :param read_depth: maximum number of sources read ahead of the assembly
+        :param write_depth: maximum number of outputs waiting to be written
+        :return: a tuple of (list of (asm_file, seconds taken, error or None) tuples in the order of asm_files, as
+        given by Batch.assemble_batch, and a dictionary of the busy time of each stage and the depths of each queue)
+        """
+        import threading  # Imported on demand, only pipelined batches use threads
+        from queue import Queue
+
+        extension = "." + out_format + ("." + compress if compress else "")
+        read_queue, write_queue = Queue(read_depth), Queue(write_depth)
+        busy = {"read": 0.0, "assemble": 0.0, "write": 0.0}
+        depths = {"read": [], "write": []}  # The depth of each queue, sampled by its consumer before each get
+        results = []
+
+        def read():
+            # Each item is (asm_file, out_filename, cache key, lines, seconds, error): lines is None on a cache hit. The
+            # last item is None at the end of the input, or the exception which stopped the reader, to be re-raised
+            failure = None
+            try:
+                for asm_file in asm_files:
+                    start = time.perf_counter()
+                    out_filename = Assembler().get_out_filename(asm_file, out_dir, extension=extension)
+                    key = lines = error = None
+                    try:
+                        if cache is not None:
+                            key = cache.key(asm_file, out_format, byteorder, optimize, compress)
+                        if key is None or not cache.fetch(key, out_filename):
+                            lines = Assembler().read_file(asm_file)
+                    except Exception as exception:
+                        error = Batch.error(exception)
+                    seconds = time.perf_counter() - start
+                    busy["read"] += seconds
+                    read_queue.put((asm_file, out_filename, key, lines, seconds, error))
+            except BaseException as exception:
+                failure = exception
+            finally:
+                read_queue.put(failure)  # Always, or the assembly would wait forever for the next source
+
+        def write():
+            # Each item is (asm_file, out_filename, cache key, rendered output, seconds, error): the output is None
+            # on a cache hit or an error
+            while True:
+                depths["write"].append(write_queue.qsize())
+                item = write_queue.get()
+                if item is None:
+                    return
+                asm_file, out_filename, key, payload, seconds, error = item
+                start = time.perf_counter()
+                if payload is not None:
+                    try:
+                        with HackFile.open_file(out_filename, "wb") as outfile:
+                            outfile.write(payload)
+                        if key is not None:
+                            cache.store(key, out_filename)
+                    except Exception as exception:
+                        error = Batch.error(exception)
+                write_seconds = time.perf_counter() - start
+                busy["write"] += write_seconds
+                results.append((asm_file, seconds + write_seconds, error))
+
+        start = time.perf_counter()
+        # Daemon threads, so that an interrupted batch does not wait for them
+        reader = threading.Thread(target=read, name="batch-reader", daemon=True)
+        writer = threading.Thread(target=write, name="batch-writer", daemon=True)
+        reader.start()
+        writer.start()
+        while True:
+            depths["read"].append(read_queue.qsize())
+            item = read_queue.get()
+            if item is None:
+                break
+            if isinstance(item, BaseException):  # The reader failed outside of a single program
+                write_queue.put(None)
+                writer.join()
+                raise item
+            asm_file, out_filename, key, lines, seconds, error = item
+            assemble_start = time.perf_counter()
+            payload = None
+            if lines is not None:
+                try:
+                    words = Assembler().assemble_source(lines, optimize, filename=asm_file)
+                    sink = io.BytesIO()
+                    HackFile.write(words, sink, out_format, byteorder)
+                    payload = sink.getvalue()
+                except Exception as exception:
+                    error = Batch.error(exception)
+            assemble_seconds = time.perf_counter() - assemble_start
+            busy["assemble"] += assemble_seconds
+            write_queue.put((asm_file, out_filename, key, payload, seconds + assemble_seconds, error))
+        write_queue.put(None)
+        writer.join()
+        seconds = time.perf_counter() - start
+
+        stats = {
+            "seconds": seconds,
+            "busy_seconds": busy,
+            "utilization": {stage: stage_seconds / seconds if seconds else 0.0
+                            for stage, stage_seconds in busy.items()},
+            "queues": {name: {"capacity": capacity, "max": max(depths[name], default=0),
+                              "mean": sum(depths[name]) / len(depths[name]) if depths[name] else 0.0}
+                       for name, capacity in (("read", read_depth), ("write", write_depth))},
+        }
+        return results, stats
+
+    @staticmethod
+    def pipeline_report(stats):
+        """
+        :param stats: the statistics of Batch.assemble_pipeline
+        :return: a string summarising the utilization of each stage and the depths of each queue of the pipeline
+        """
+        stages = ", ".join(f"{stage} {utilization:.0%}" for stage, utilization in stats["utilization"].items())
+        queues = ", ".join(f"{name} {queue['mean']:.1f} on average (at most {queue['max']} of {queue['capacity']})"
+                           for name, queue in stats["queues"].items())
+        return f"Pipeline stages busy: {stages}\nPipeline queue depths: {queues}"
+
+    @staticmethod
+    def summary(results, seconds):
+        """
+        :param results: the results of Batch.assemble_batch
+        :param seconds: wall time taken by the whole batch
+        :return: a string summarising the per-file timings and failures of the batch. The Diagnostics of invalid
+        programs are only counted, see Batch.diagnostics.
+        """
+        failed = [result for result in results if result[2] is not None]
+        lines = [f"Assembled {len(results)} files in {seconds:.3f}s "
+                 f"({len(results) - len(failed)} succeeded, {len(failed)} failed)"]
+        for asm_file, file_seconds, error in results:
+            status = f"{file_seconds:.3f}s" if error is None else "FAILED"
+            line = f"  {status:>8}  {asm_file}"
+            if isinstance(error, AssemblyError):
+                line += f": {len(error.diagnostics)} error{'s' if len(error.diagnostics) > 1 else ''}"
+            elif error is not None:
+                line += f": {error}"
+            lines.append(line)
+        return "\n".join(lines)
+
+    @staticmethod
+    def diagnostics(results, out_format="text"):
+        """
+        :param results: the results of Batch.assemble_batch
+        :param out_format: "text" or "json", see AssemblyError.format_all
+        :return: a string of the Diagnostics of every invalid program of the batch, or None if there is none
+        """
+        errors = [error for _, _, error in results if isinstance(error, AssemblyError)]
+        return AssemblyError.format_all(errors, out_format) if errors else None
@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+
+import argparse
+import glob
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+try:
+    from .Assembler import Assembler
+    from .Emulator import Emulator
+    from .Parser import Parser
+    from .HackFile import HackFile
+except ImportError:  # Run as a script from inside the Assembler/ directory
+    from Assembler import Assembler
+    from Emulator import Emulator
+    from Parser import Parser
+    from HackFile import HackFile
+
+
+class Benchmark:
+    """
+    Benchmark is a class that provides a harness to measure the throughput of the Assembler. Each stage of the assembly
+    (read_file, tokenize, first_pass, second_pass and write_file) is timed separately, on every bundled program in
+    'in_asm/' and on synthetically scaled programs, and the output is checked against the golden files in 'out_hack/'.
+    """
+
+    STAGES = ["read_file", "tokenize", "first_pass", "second_pass", "write_file"]
+
+    @staticmethod
+    def run_stages(asm_file, out_filename):
+        """
+        Assembles a program once, timing each stage.
+        :param asm_file: the '.asm' file to be assembled
+        :param out_filename: the '.hack' file to write to
+        :return: a tuple of (dictionary of stage name to seconds, array of the assembled words)
+        """
+        assembler = Assembler()
+        seconds = {}
+
+        start = time.perf_counter()
+        lines = assembler.read_file(asm_file)
+        seconds["read_file"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        instructions = Parser.tokenize(lines)
+        seconds["tokenize"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        assembler.first_pass(instructions)
+        seconds["first_pass"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        words = assembler.second_pass(instructions)
+        seconds["second_pass"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        assembler.write_file(words, asm_file, out_filename=out_filename)
+        seconds["write_file"] = time.perf_counter() - start
+
+        return seconds, words
+
+    @staticmethod
+    def peak_memory(asm_file, out_filename):
+        """
+        :param asm_file: the '.asm' file to be assembled
+        :param out_filename: the '.hack' file to write to
+        :return: the peak memory allocated while assembling the program, in bytes
+        """
+        tracemalloc.start()
+        try:
+            Benchmark.run_stages(asm_file, out_filename)
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    @staticmethod
+    def benchmark_program(asm_file, repeat=3, golden_filename=None):
+        """
+        Benchmarks a program, keeping the fastest time of each stage over a number of runs.
+        :param asm_file: the '.asm' file to be benchmarked
+        :param repeat: number of timed runs
+        :param golden_filename: an optional '.hack' file the output must be identical to
+        :return: a dictionary of the results of the program
+        """
+        with open(asm_file) as file:
+            num_lines = sum(1 for _ in file)
+
+        with tempfile.TemporaryDirectory() as out_dir:
+            out_filename = os.path.join(out_dir, "out.hack")
+            best = {}
+            for _ in range(repeat):
+                seconds, words = Benchmark.run_stages(asm_file, out_filename)
+                for stage, stage_seconds in seconds.items():
+                    best[stage] = min(best.get(stage, stage_seconds), stage_seconds)
+            peak_bytes = Benchmark.peak_memory(asm_file, out_filename)
+
+        total_seconds = sum(best.values())
+        result = {
+            "program": os.path.basename(asm_file),
+            "lines": num_lines,
+            "instructions": len(words),
+            "seconds": best,
+            "total_seconds": total_seconds,
+            "lines_per_second": num_lines / total_seconds if total_seconds else 0.0,
+            "peak_memory_bytes": peak_bytes,
+        }
+        if golden_filename is not None:
+            with open(golden_filename) as file:
+                result["matches_golden"] = HackFile.render_text(words) == file.read()
+        return result
+
+    @staticmethod
+    def write_scaled_program(asm_file, num_instructions, scaled_filename):
+        """
+        Writes a synthetically scaled program by replicating a program until it reaches a number of instructions.
+        Replicated labels are ignored by the SymbolTable, so every copy jumps into the first one.
+        :param asm_file: the '.asm' file to be replicated
+        :param num_instructions: the minimum number of instructions of the scaled program
+        :param scaled_filename: the '.asm' file to write to
+        """
+        with open(asm_file) as file:
+            source = file.read()
+        copy_instructions = sum(1 for instruction in Parser.tokenize(source.splitlines())
+                                if instruction[0] != Parser.LABEL)
+        copies = max(1, -(-num_instructions // copy_instructions))
+        with open(scaled_filename, "w") as file:
+            for _ in range(copies):
+                file.write(source)
+                file.write("\n")
+
+    @staticmethod
+    def run(in_dir, scaled=(), repeat=3, golden_dir=None):
+        """
+        :param in_dir: directory of the '.asm' programs to be benchmarked
+        :param scaled: a list of instruction counts of synthetically scaled copies of Pong.asm to be benchmarked
+        :param repeat: number of timed runs per program
+        :param golden_dir: an optional directory of the golden '.hack' files of the programs
+        :return: a list of the results of each program
+        """
+        results = []
+        for asm_file in sorted(glob.glob(os.path.join(in_dir, "*.asm"))):
+            golden_filename = None
+            if golden_dir is not None:
+                golden_filename = os.path.join(golden_dir, os.path.basename(asm_file)[:-len(".asm")] + ".hack")
+                if not os.path.exists(golden_filename):
+                    golden_filename = None
+            results.append(Benchmark.benchmark_program(asm_file, repeat, golden_filename))
+
+        with tempfile.TemporaryDirectory() as scaled_dir:
+            for num_instructions in scaled:
+                scaled_filename = os.path.join(scaled_dir, f"Pong{num_instructions}.asm")
+                Benchmark.write_scaled_program(os.path.join(in_dir, "Pong.asm"), num_instructions, scaled_filename)
+                results.append(Benchmark.benchmark_program(scaled_filename, repeat))
+        return results
+
+    @staticmethod
+    def startup(asm_file, repeat=3, slowest_imports=5):
+        """
+        Measures the cold start of the assembler in fresh interpreters, which is most of the wall time of assembling a
+        tiny program: the import time of the Assembler package as reported by 'python -X importtime', and the wall time
+        of the command line assembling a program.
+        :param asm_file: the '.asm' program assembled by the command line
+        :param repeat: number of timed runs, keeping the fastest
+        :param slowest_imports: number of the slowest imported modules to report
+        :return: a dictionary of the results of the start-up
+        """
+        package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        best = {}
+        for _ in range(repeat):
+            imports = subprocess.run([sys.executable, "-X", "importtime", "-c", "import Assembler.Assembler"],
+                                     cwd=package_dir, capture_output=True, text=True, check=True).stderr
+            modules = []
+            for line in imports.splitlines():
+                if not line.startswith("import time:") or "cumulative" in line:
+                    continue
+                self_us, cumulative_us, name = line[len("import time:"):].split("|")
+                modules.append((int(self_us), int(cumulative_us), name.rstrip()))
+            # The top level imports of the package, e.g. "Assembler" and "Assembler.Assembler", include all the others
+            import_seconds = sum(cumulative for _, cumulative, name in modules
+                                 if name.startswith(" Assembler")) / 1e6
+            if import_seconds < best.get("import_seconds", float("inf")):
+                best["import_seconds"] = import_seconds
+                best["slowest_imports"] = [{"module": name.strip(), "seconds": self_us / 1e6}
+                                           for self_us, _, name in sorted(modules, reverse=True)[:slowest_imports]]
+
+            with tempfile.TemporaryDirectory() as out_dir:
+                for name, command in (("interpreter_seconds", [sys.executable, "-c", "pass"]),
+                                      ("cli_seconds", [sys.executable, "-m", "Assembler.Assembler", "--no-cache",
+                                                       "--out-dir", out_dir, os.path.abspath(asm_file)])):
+                    start = time.perf_counter()
+                    subprocess.run(command, cwd=package_dir, stdout=subprocess.DEVNULL, check=True)
+                    best[name] = min(best.get(name, float("inf")), time.perf_counter() - start)
+        best["program"] = os.path.basename(asm_file)
+        return best
+
+    @staticmethod
+    def startup_report(startup):
+        """
+        :param startup: the results of Benchmark.startup
+        :return: a string report of the start-up
+        """
+        lines = [f"start-up: import {startup['import_seconds'] * 1000:.1f}ms, command line assembling "
+                 f"{startup['program']} {startup['cli_seconds'] * 1000:.1f}ms (bare interpreter "
+                 f"{startup['interpreter_seconds'] * 1000:.1f}ms)"]
+        lines += [f"  {module['seconds'] * 1000:>7.2f}ms  {module['module']}" for module in startup["slowest_imports"]]
+        return "\n".join(lines)
+
+    @staticmethod
+    def emulation(hack_file, cycles, repeat=3):
+        """
+        :param hack_file: the '.hack' program to be run by the Emulator
+        :param cycles: the cycle limit of each run
+        :param repeat: number of timed runs, keeping the fastest
+        :return: a dictionary of the results of the Emulator (see Emulator.benchmark)
+        """
+        result = Emulator.benchmark(HackFile.read_words(hack_file), cycles, repeat)
+        result["program"] = os.path.basename(hack_file)
+        return result
+
+    @staticmethod
+    def emulation_report(emulation):
+        """
+        :param emulation: the results of Benchmark.emulation
+        :return: a string report of the Emulator
+        """
+        return (f"emulator: {emulation['program']} ran {emulation['cycles']} cycles in {emulation['seconds']:.3f}s, "
+                f"{emulation['cycles_per_second']:.0f} cycles/s "
+                f"(decoded in {emulation['decode_seconds'] * 1000:.1f}ms)")
+
+    @staticmethod
+    def compression(asm_file, repeat=3):
+        """
+        Measures the I/O bytes saved by compressed sources and outputs, and their cost in throughput: for each
+        compression, the '.asm' source is read (and decompressed) and the '.hack' output is written (and compressed).
+        :param asm_file: the '.asm' program whose source and output are compressed
+        :param repeat: number of timed runs, keeping the fastest
+        :return: a list of dictionaries of the results of each compression, the uncompressed files first
+        """
+        words = Assembler().assemble_source(Assembler().read_file(asm_file))
+        results = []
+        with tempfile.TemporaryDirectory() as out_dir:
+            for extension in ("",) + HackFile.COMPRESSION_EXTENSIONS:
+                in_filename = os.path.join(out_dir, os.path.basename(asm_file) + extension)
+                out_filename = os.path.join(out_dir, "out" + HackFile.TEXT_EXTENSION + extension)
+                with open(asm_file, "rb") as file, HackFile.open_file(in_filename, "wb") as compressed:
+                    compressed.write(file.read())
+                best = {}
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    Assembler().read_file(in_filename)
+                    best["read_seconds"] = min(best.get("read_seconds", float("inf")), time.perf_counter() - start)
+                    start = time.perf_counter()
+                    Assembler().write_file(words, in_filename, out_filename=out_filename)
+                    best["write_seconds"] = min(best.get("write_seconds", float("inf")), time.perf_counter() - start)
+                best.update(compression=extension or "none", asm_bytes=os.path.getsize(in_filename),
+                            hack_bytes=os.path.getsize(out_filename),
+                            round_trip=HackFile.read_words(out_filename) == words)
+                results.append(best)
+        return results
+
+    @staticmethod
+    def compression_report(compression):
+        """
+        :param compression: the results of Benchmark.compression
+        :return: a string table of the bytes saved and the slowdown of each compression against the uncompressed files
+        """
+        plain = compression[0]
+        plain_bytes = plain["asm_bytes"] + plain["hack_bytes"]
+        plain_seconds = plain["read_seconds"] + plain["write_seconds"]
+        lines = [f"{'compression':<12}{'asm bytes':>12}{'hack bytes':>12}{'saved':>8}{'read':>11}{'write':>11}"
+                 f"{'slowdown':>10}"]
+        for result in compression:
+            saved = 1 - (result["asm_bytes"] + result["hack_bytes"]) / plain_bytes
+            slowdown = (result["read_seconds"] + result["write_seconds"]) / plain_seconds
+            line = f"{result['compression']:<12}{result['asm_bytes']:>12}{result['hack_bytes']:>12}{saved:>8.1%}"
+            line += f"{result['read_seconds'] * 1000:>9.2f}ms{result['write_seconds'] * 1000:>9.2f}ms{slowdown:>9.2f}x"
+            lines.append(line if result["round_trip"] else line + "  DIFF")
+        return "\n".join(lines)
+
+    @staticmethod
+    def regressions(results, baseline, threshold, min_seconds=0.001):
+        """
+        :param results: the results of Benchmark.run
+        :param baseline: the stored results of a previous Benchmark.run
+        :param threshold: the tolerated fraction of throughput lost against the baseline, e.g. 0.1 for 10%
+        :param min_seconds: programs which assembled faster than this in the baseline are too noisy to be compared
+        :return: a list of messages describing each program whose throughput regressed beyond the threshold
+        """
+        baseline_results = {result["program"]: result for result in baseline}
+        messages = []
+        for result in results:
+            previous = baseline_results.get(result["program"])
+            if previous is None or previous["total_seconds"] < min_seconds:
+                continue
+            ratio = result["lines_per_second"] / previous["lines_per_second"]
+            if ratio < 1 - threshold:
+                messages.append(f"{result['program']}: {result['lines_per_second']:.0f} lines/s is "
+                                f"{(1 - ratio) * 100:.1f}% slower than the baseline "
+                                f"{previous['lines_per_second']:.0f} lines/s")
+        return messages
+
+    @staticmethod
+    def report(results):
+        """
+        :param results: the results of Benchmark.run
+        :return: a string table of the results
+        """
+        header = f"{'program':<16}{'lines':>10}" + "".join(f"{stage:>13}" for stage in Benchmark.STAGES)
+        header += f"{'lines/s':>12}{'peak KiB':>10}{'golden':>8}"
+        lines = [header]
+        for result in results:
+            line = f"{result['program']:<16}{result['lines']:>10}"
+            line += "".join(f"{result['seconds'][stage] * 1000:>11.2f}ms" for stage in Benchmark.STAGES)
+            line += f"{result['lines_per_second']:>12.0f}{result['peak_memory_bytes'] // 1024:>10}"
+            line += f"{ {True: 'ok', False: 'DIFF'}.get(result.get('matches_golden'), '-'):>8}"
+            lines.append(line)
+        return "\n".join(lines)
+
+
+def main(argv=None):
+    here = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description="Benchmarks the throughput of the Hack Assembler.")
+    parser.add_argument("--in-dir", default=os.path.join(here, "in_asm"),
+                        help="directory of the '.asm' programs to be benchmarked (default: in_asm/)")
+    parser.add_argument("--golden-dir", default=os.path.join(here, "out_hack"),
+                        help="directory of the golden '.hack' outputs (default: out_hack/)")
+    parser.add_argument("--scaled", type=int, nargs="*", default=[1000000], metavar="INSTRUCTIONS",
+                        help="instruction counts of synthetically scaled copies of Pong.asm (default: 1000000)")
+    parser.add_argument("--repeat", type=int, default=3, help="number of timed runs per program (default: 3)")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare the throughput against the results stored in this JSON file")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="tolerated fraction of throughput lost against the baseline (default: 0.1)")
+    parser.add_argument("--no-startup", action="store_true",
+                        help="skip measuring the cold start (import time and command line) in fresh interpreters")
+    parser.add_argument("--emulator-cycles", type=int, default=1000000,
+                        help="cycles of the golden Pong.hack run by the Emulator, or 0 to skip it (default: 1000000)")
+    parser.add_argument("--no-compression", action="store_true",
+                        help="skip measuring the bytes saved and the cost of '.gz' and '.xz' sources and outputs")
+    args = parser.parse_args(argv)
+
+    results = Benchmark.run(args.in_dir, args.scaled, args.repeat, args.golden_dir)
+    print(Benchmark.report(results))
+    if not args.no_startup:
+        print(Benchmark.startup_report(Benchmark.startup(os.path.join(args.in_dir, "Add.asm"), args.repeat)))
+    if args.emulator_cycles:
+        emulation = Benchmark.emulation(os.path.join(args.golden_dir, "Pong.hack"), args.emulator_cycles, args.repeat)
+        print(Benchmark.emulation_report(emulation))
+    compression = []
+    if not args.no_compression:
+        compression = Benchmark.compression(os.path.join(args.in_dir, "Pong.asm"), args.repeat)
+        print(Benchmark.compression_report(compression))
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+    failures = [f"{result['program']}: output differs from the golden file"
+                for result in results if result.get("matches_golden") is False]
+    failures += [f"Pong.asm: the {result['compression']} output does not read back the same words"
+                 for result in compression if not result["round_trip"]]
+    if args.baseline:
+        with open(args.baseline) as file:
+            failures += Benchmark.regressions(results, json.load(file), args.threshold)
+    for failure in failures:
+        print(f"FAIL {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+
+import hashlib
+import os
+
+
+class AssemblyCache:
+    """
+    The AssemblyCache is an on-disk cache of assembled programs, keyed on the content hash of their source (plus the
+    assembler version and output options). Each entry is the produced output file, named by its key, so an unchanged
+    program is 'assembled' by hashing its source and copying the cached output. The total size of the entries is
+    capped, evicting the least recently used entries first (the modification time of an entry is refreshed on every
+    hit).
+    """
+
+    DEFAULT_DIR = ".hack_cache/"
+    DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+    def __init__(self, cache_dir=DEFAULT_DIR, max_bytes=DEFAULT_MAX_BYTES, version=""):
+        """
+        :param cache_dir: directory of the cache entries, created if it does not exist
+        :param max_bytes: size cap of the cache entries, in bytes
+        :param version: version of the assembler, so that entries produced by other versions are never reused
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.version = version
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def fingerprint(filenames) -> str:
+        """
+        :param filenames: the files of the code producing the cached outputs, e.g. the modules of the assembler
+        :return: a string of the hexadecimal content hash of the files, to be part of the version of the cache, so that
+        a changed build never reuses the entries of another build, even when its version number was not bumped
+        """
+        digest = hashlib.sha256()
+        for filename in filenames:
+            with open(filename, "rb") as file:
+                digest.update(file.read())
+        return digest.hexdigest()[:16]
+
+    def key(self, asm_infile, *options) -> str:
+        """
+        :param asm_infile: the '.asm' file to be assembled, which is hashed in chunks
+        :param options: output options which change the produced output, e.g. the out_format and byteorder
+        :return: a string of the hexadecimal content hash of the source, assembler version and options
+        """
+        digest = hashlib.sha256()
+        digest.update(repr((self.version,) + options).encode())
+        with open(asm_infile, "rb") as file:
+            for chunk in iter(lambda: file.read(1 << 20), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def fetch(self, key, out_filename) -> bool:
+        """
+        Refreshes the output file from the cache entry of the key, if there is one.
+        :param key: the key of the source, as given by AssemblyCache.key
+        :param out_filename: the output file to be written
+        :return: a Bool value representing whether the key was a cache hit
+        """
+        entry = os.path.join(self.cache_dir, key)
+        try:
+            self.copy_file(entry, out_filename)
+            os.utime(entry)  # Most recently used
+        except FileNotFoundError:
+            self.misses += 1
+            return False
+        self.hits += 1
+        return True
+
+    def store(self, key, out_filename):
+        """
+        Stores a produced output file as the cache entry of the key, then evicts least recently used entries until the
+        cache is back under its size cap.
+        :param key: the key of the source, as given by AssemblyCache.key
+        :param out_filename: the produced output file to be cached
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        temp_filename = os.path.join(self.cache_dir, f"{key}.{os.getpid()}.{os.urandom(4).hex()}.tmp")
+        self.copy_file(out_filename, temp_filename)
+        os.replace(temp_filename, os.path.join(self.cache_dir, key))  # Atomic, for concurrent batch workers
+        self.evict()
+
+    @staticmethod
+    def copy_file(source, destination):
+        """
+        Copies a file, without shutil, whose import (with its compression modules) would slow down the start-up.
+        :param source: the file to be copied
+        :param destination: the file to be written
+        """
+        with open(source, "rb") as source_file, open(destination, "wb") as destination_file:
+            for chunk in iter(lambda: source_file.read(1 << 20), b""):
+                destination_file.write(chunk)
+
+    def evict(self):
+        """
+        Evicts the least recently used cache entries until their total size is under the size cap.
+        """
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(".tmp"):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:  # Evicted by another process
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total_bytes = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_bytes <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total_bytes -= size
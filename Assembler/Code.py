@@ -1,5 +1,13 @@
 #!/usr/bin/env python3
 
+import os
+
+try:
+    from .CodeTable import C_INSTRUCTION_WORDS
+except ImportError:  # Run as a script from inside the Assembler/ directory
+    from CodeTable import C_INSTRUCTION_WORDS
+
+
 class Code:
     """
     The Code class contains static attributes of the (Comp)utation, (Dest)ination, and Jump codes of the Hack language.
@@ -17,6 +25,132 @@ class Code:
                    "D+A": "000010", "D+M": "000010", "D-A": "010011", "D-M": "010011", "A-D": "000111", "M-D": "000111",
                    "D&A": "000000", "D&M": "000000", "D|A": "010101", "D|M": "010101"}
 
+    # Alternate operand orderings of the commutative Comp codes, e.g. "A+D" computes the same as "D+A"
+    _comp_aliases = {"1+D": "D+1", "1+A": "A+1", "1+M": "M+1", "A+D": "D+A", "M+D": "D+M", "A&D": "D&A", "M&D": "D&M",
+                     "A|D": "D|A", "M|D": "D|M"}
+
+    # Final 16-bit word of every legal 'dest=comp;jump' spelling, loaded from the generated CodeTable module: its
+    # bytecode is cached by Python, so loading it at start-up costs far less than computing the table. Other spellings
+    # (e.g. "DM=M+1") are memoized into it the first time they are encoded.
+    _c_instruction_words = C_INSTRUCTION_WORDS
+
+    # The generated module of the precomputed table, see Code.write_table_module
+    TABLE_MODULE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "CodeTable.py")
+
+    @staticmethod
+    def encode_c_instruction(instruction) -> int:
+        """
+        Encodes a C instruction with a single lookup into the table of precomputed C instructions. Compiler generated
+        code repeats a small set of C instructions thousands of times, so spellings missing from the table are encoded
+        once and then memoized.
+        :param instruction: the C instruction to be encoded, without whitespace or comments, e.g. "AM=M-1" or "0;JMP"
+        :return: the 16-bit integer machine code word of the C instruction
+        """
+        try:
+            return Code._c_instruction_words[instruction]
+        except KeyError:
+            pass
+        dest, _, comp = instruction.rpartition("=")
+        comp, _, jump = comp.partition(";")
+        word = Code.encode_c_fields(dest, comp, jump)
+        Code._c_instruction_words[instruction] = word
+        return word
+
+    @staticmethod
+    def encode_c_fields(dest, comp, jump) -> int:
+        """
+        Encodes the Dest, Comp and Jump codes of a C instruction into a 16-bit word: "111", then the 'a' op code and
+        6-bit comp code, then the 3-bit dest and jump codes.
+        :param dest: the Dest code, in any ordering of its registers (e.g. "MD" or "DM"), or None/"" for no Dest
+        :param comp: the Comp code, in either operand ordering of commutative operations (e.g. "D+A" or "A+D")
+        :param jump: the Jump code, or None/"" for no Jump
+        :return: the 16-bit integer machine code word of the C instruction
+        :raises ValueError: if any of the codes is invalid (see Code.invalid_fields)
+        """
+        comp = Code._comp_aliases.get(comp, comp)
+        dest = Code.canonical_dest(dest)
+        comp_int = int(Code.decode_comp_code(comp), 2)
+        return 0b111 << 13 | comp_int << 6 | Code.decode_dest_code(dest) << 3 | Code.decode_jump_code(jump)
+
+    @staticmethod
+    def canonical_dest(dest):
+        """
+        :param dest: a Dest code, in any ordering of its registers, or None/"" for no Dest
+        :return: the Dest code in the canonical ordering of its registers (e.g. "DM" -> "MD"), or dest itself if it is
+        not a valid Dest code
+        """
+        if dest and dest not in Code._dest_codes and len(set(dest)) == len(dest) and set(dest) <= set("AMD"):
+            return "".join(register for register in "AMD" if register in dest)
+        return dest
+
+    @staticmethod
+    def invalid_fields(dest, comp, jump):
+        """
+        Validates every field of a C instruction, so that all of its errors can be reported at once.
+        :param dest: the Dest code, or None/"" for no Dest
+        :param comp: the Comp code
+        :param jump: the Jump code, or None/"" for no Jump
+        :return: a list of (field, message) pairs of the invalid fields, where field is "dest", "comp" or "jump"
+        """
+        invalid = []
+        if dest and Code.canonical_dest(dest) not in Code._dest_codes:
+            invalid.append(("dest", f"Invalid Dest code \"{dest}\""))
+        if Code._comp_aliases.get(comp, comp) not in Code._comp_codes:
+            invalid.append(("comp", f"Invalid Comp code \"{comp}\""))
+        if jump and jump not in Code._jump_codes:
+            invalid.append(("jump", f"Invalid Jump code \"{jump}\""))
+        return invalid
+
+    @staticmethod
+    def precompute_c_instructions():
+        """
+        Fills the table of C instructions with every legal spelling, e.g. before forking worker processes which would
+        otherwise each memoize the same spellings. The table loaded from CodeTable already holds all of them, unless
+        it is out of date with the Code tables.
+        """
+        Code._c_instruction_words.update(Code._build_c_instruction_words())
+
+    @staticmethod
+    def write_table_module(filename=TABLE_MODULE):
+        """
+        Generates the CodeTable module of the precomputed table of C instructions, from the Code tables. It must be
+        generated again whenever the Code tables change.
+        :param filename: the '.py' module to write
+        """
+        words = Code._build_c_instruction_words()
+        lines = ['"""', "Generated by 'python Code.py' from the tables of Code.py, do not edit.", '"""', "",
+                 "C_INSTRUCTION_WORDS = dict(zip(("]
+        for items in ([f'"{instruction}"' for instruction in words], list(map(str, words.values()))):
+            line = "   "
+            for item in items:
+                if len(line) + len(item) + 2 > 120:
+                    lines.append(line)
+                    line = "   "
+                line += " " + item + ","
+            lines += [line, "), ("]
+        lines[-1] = ")))"
+        with open(filename, "w") as file:
+            file.write("\n".join(lines) + "\n")
+
+    @staticmethod
+    def _build_c_instruction_words():
+        """
+        Precomputes the 16-bit word of every legal C instruction spelling: each (canonical) Dest code, with each Comp
+        code in either operand ordering, with each Jump code.
+        :return: a dictionary of C instruction spelling to 16-bit word
+        """
+        words = {}
+        for comp in list(Code._comp_codes) + list(Code._comp_aliases):
+            for dest in Code._dest_codes:
+                for jump in Code._jump_codes:
+                    instruction = comp
+                    if dest != "null":
+                        instruction = dest + "=" + instruction
+                    if jump != "null":
+                        instruction = instruction + ";" + jump
+                    words[instruction] = Code.encode_c_fields(dest, comp, jump)
+        return words
+
     @staticmethod
     def decode_comp_code_a(code):
         """
@@ -38,9 +172,10 @@ class Code:
         :param instruction: The Comp code to be converted to 7-bit binary
         :return: a string of a 7-bit binary number (1-bit op code and 6-bit comp code).
         """
-        a_code = Code.decode_comp_code_a(code)
-        comp_code = Code._comp_codes[code]
-        return a_code + comp_code
+        comp_code = Code._comp_codes.get(code)
+        if comp_code is None:
+            raise ValueError(f"Invalid Comp code \"{code}\"")
+        return Code.decode_comp_code_a(code) + comp_code
 
     @staticmethod
     def decode_dest_code(code) -> int:
@@ -54,7 +189,8 @@ class Code:
         """
         if not code:
             code = "null"
-        assert code in Code._dest_codes
+        if code not in Code._dest_codes:
+            raise ValueError(f"Invalid Dest code \"{code}\"")
         return Code._dest_codes.index(code)
 
     @staticmethod
@@ -69,5 +205,11 @@ class Code:
         """
         if not code:
             code = "null"
-        assert code in Code._jump_codes
+        if code not in Code._jump_codes:
+            raise ValueError(f"Invalid Jump code \"{code}\"")
         return Code._jump_codes.index(code)
+
+
+if __name__ == '__main__':
+    Code.write_table_module()
+    print(f"Wrote {Code.TABLE_MODULE}")
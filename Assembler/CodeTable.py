@@ -0,0 +1,421 @@
+"""
+Generated by 'python Code.py' from the tables of Code.py, do not edit.
+"""
+
+C_INSTRUCTION_WORDS = dict(zip((
+    "0", "0;JGT", "0;JEQ", "0;JGE", "0;JLT", "0;JNE", "0;JLE", "0;JMP", "M=0", "M=0;JGT", "M=0;JEQ", "M=0;JGE",
+    "M=0;JLT", "M=0;JNE", "M=0;JLE", "M=0;JMP", "D=0", "D=0;JGT", "D=0;JEQ", "D=0;JGE", "D=0;JLT", "D=0;JNE", "D=0;JLE",
+    "D=0;JMP", "MD=0", "MD=0;JGT", "MD=0;JEQ", "MD=0;JGE", "MD=0;JLT", "MD=0;JNE", "MD=0;JLE", "MD=0;JMP", "A=0",
+    "A=0;JGT", "A=0;JEQ", "A=0;JGE", "A=0;JLT", "A=0;JNE", "A=0;JLE", "A=0;JMP", "AM=0", "AM=0;JGT", "AM=0;JEQ",
+    "AM=0;JGE", "AM=0;JLT", "AM=0;JNE", "AM=0;JLE", "AM=0;JMP", "AD=0", "AD=0;JGT", "AD=0;JEQ", "AD=0;JGE", "AD=0;JLT",
+    "AD=0;JNE", "AD=0;JLE", "AD=0;JMP", "AMD=0", "AMD=0;JGT", "AMD=0;JEQ", "AMD=0;JGE", "AMD=0;JLT", "AMD=0;JNE",
+    "AMD=0;JLE", "AMD=0;JMP", "1", "1;JGT", "1;JEQ", "1;JGE", "1;JLT", "1;JNE", "1;JLE", "1;JMP", "M=1", "M=1;JGT",
+    "M=1;JEQ", "M=1;JGE", "M=1;JLT", "M=1;JNE", "M=1;JLE", "M=1;JMP", "D=1", "D=1;JGT", "D=1;JEQ", "D=1;JGE", "D=1;JLT",
+    "D=1;JNE", "D=1;JLE", "D=1;JMP", "MD=1", "MD=1;JGT", "MD=1;JEQ", "MD=1;JGE", "MD=1;JLT", "MD=1;JNE", "MD=1;JLE",
+    "MD=1;JMP", "A=1", "A=1;JGT", "A=1;JEQ", "A=1;JGE", "A=1;JLT", "A=1;JNE", "A=1;JLE", "A=1;JMP", "AM=1", "AM=1;JGT",
+    "AM=1;JEQ", "AM=1;JGE", "AM=1;JLT", "AM=1;JNE", "AM=1;JLE", "AM=1;JMP", "AD=1", "AD=1;JGT", "AD=1;JEQ", "AD=1;JGE",
+    "AD=1;JLT", "AD=1;JNE", "AD=1;JLE", "AD=1;JMP", "AMD=1", "AMD=1;JGT", "AMD=1;JEQ", "AMD=1;JGE", "AMD=1;JLT",
+    "AMD=1;JNE", "AMD=1;JLE", "AMD=1;JMP", "-1", "-1;JGT", "-1;JEQ", "-1;JGE", "-1;JLT", "-1;JNE", "-1;JLE", "-1;JMP",
+    "M=-1", "M=-1;JGT", "M=-1;JEQ", "M=-1;JGE", "M=-1;JLT", "M=-1;JNE", "M=-1;JLE", "M=-1;JMP", "D=-1", "D=-1;JGT",
+    "D=-1;JEQ", "D=-1;JGE", "D=-1;JLT", "D=-1;JNE", "D=-1;JLE", "D=-1;JMP", "MD=-1", "MD=-1;JGT", "MD=-1;JEQ",
+    "MD=-1;JGE", "MD=-1;JLT", "MD=-1;JNE", "MD=-1;JLE", "MD=-1;JMP", "A=-1", "A=-1;JGT", "A=-1;JEQ", "A=-1;JGE",
+    "A=-1;JLT", "A=-1;JNE", "A=-1;JLE", "A=-1;JMP", "AM=-1", "AM=-1;JGT", "AM=-1;JEQ", "AM=-1;JGE", "AM=-1;JLT",
+    "AM=-1;JNE", "AM=-1;JLE", "AM=-1;JMP", "AD=-1", "AD=-1;JGT", "AD=-1;JEQ", "AD=-1;JGE", "AD=-1;JLT", "AD=-1;JNE",
+    "AD=-1;JLE", "AD=-1;JMP", "AMD=-1", "AMD=-1;JGT", "AMD=-1;JEQ", "AMD=-1;JGE", "AMD=-1;JLT", "AMD=-1;JNE",
+    "AMD=-1;JLE", "AMD=-1;JMP", "D", "D;JGT", "D;JEQ", "D;JGE", "D;JLT", "D;JNE", "D;JLE", "D;JMP", "M=D", "M=D;JGT",
+    "M=D;JEQ", "M=D;JGE", "M=D;JLT", "M=D;JNE", "M=D;JLE", "M=D;JMP", "D=D", "D=D;JGT", "D=D;JEQ", "D=D;JGE", "D=D;JLT",
+    "D=D;JNE", "D=D;JLE", "D=D;JMP", "MD=D", "MD=D;JGT", "MD=D;JEQ", "MD=D;JGE", "MD=D;JLT", "MD=D;JNE", "MD=D;JLE",
+    "MD=D;JMP", "A=D", "A=D;JGT", "A=D;JEQ", "A=D;JGE", "A=D;JLT", "A=D;JNE", "A=D;JLE", "A=D;JMP", "AM=D", "AM=D;JGT",
+    "AM=D;JEQ", "AM=D;JGE", "AM=D;JLT", "AM=D;JNE", "AM=D;JLE", "AM=D;JMP", "AD=D", "AD=D;JGT", "AD=D;JEQ", "AD=D;JGE",
+    "AD=D;JLT", "AD=D;JNE", "AD=D;JLE", "AD=D;JMP", "AMD=D", "AMD=D;JGT", "AMD=D;JEQ", "AMD=D;JGE", "AMD=D;JLT",
+    "AMD=D;JNE", "AMD=D;JLE", "AMD=D;JMP", "A", "A;JGT", "A;JEQ", "A;JGE", "A;JLT", "A;JNE", "A;JLE", "A;JMP", "M=A",
+    "M=A;JGT", "M=A;JEQ", "M=A;JGE", "M=A;JLT", "M=A;JNE", "M=A;JLE", "M=A;JMP", "D=A", "D=A;JGT", "D=A;JEQ", "D=A;JGE",
+    "D=A;JLT", "D=A;JNE", "D=A;JLE", "D=A;JMP", "MD=A", "MD=A;JGT", "MD=A;JEQ", "MD=A;JGE", "MD=A;JLT", "MD=A;JNE",
+    "MD=A;JLE", "MD=A;JMP", "A=A", "A=A;JGT", "A=A;JEQ", "A=A;JGE", "A=A;JLT", "A=A;JNE", "A=A;JLE", "A=A;JMP", "AM=A",
+    "AM=A;JGT", "AM=A;JEQ", "AM=A;JGE", "AM=A;JLT", "AM=A;JNE", "AM=A;JLE", "AM=A;JMP", "AD=A", "AD=A;JGT", "AD=A;JEQ",
+    "AD=A;JGE", "AD=A;JLT", "AD=A;JNE", "AD=A;JLE", "AD=A;JMP", "AMD=A", "AMD=A;JGT", "AMD=A;JEQ", "AMD=A;JGE",
+    "AMD=A;JLT", "AMD=A;JNE", "AMD=A;JLE", "AMD=A;JMP", "M", "M;JGT", "M;JEQ", "M;JGE", "M;JLT", "M;JNE", "M;JLE",
+    "M;JMP", "M=M", "M=M;JGT", "M=M;JEQ", "M=M;JGE", "M=M;JLT", "M=M;JNE", "M=M;JLE", "M=M;JMP", "D=M", "D=M;JGT",
+    "D=M;JEQ", "D=M;JGE", "D=M;JLT", "D=M;JNE", "D=M;JLE", "D=M;JMP", "MD=M", "MD=M;JGT", "MD=M;JEQ", "MD=M;JGE",
+    "MD=M;JLT", "MD=M;JNE", "MD=M;JLE", "MD=M;JMP", "A=M", "A=M;JGT", "A=M;JEQ", "A=M;JGE", "A=M;JLT", "A=M;JNE",
+    "A=M;JLE", "A=M;JMP", "AM=M", "AM=M;JGT", "AM=M;JEQ", "AM=M;JGE", "AM=M;JLT", "AM=M;JNE", "AM=M;JLE", "AM=M;JMP",
+    "AD=M", "AD=M;JGT", "AD=M;JEQ", "AD=M;JGE", "AD=M;JLT", "AD=M;JNE", "AD=M;JLE", "AD=M;JMP", "AMD=M", "AMD=M;JGT",
+    "AMD=M;JEQ", "AMD=M;JGE", "AMD=M;JLT", "AMD=M;JNE", "AMD=M;JLE", "AMD=M;JMP", "!D", "!D;JGT", "!D;JEQ", "!D;JGE",
+    "!D;JLT", "!D;JNE", "!D;JLE", "!D;JMP", "M=!D", "M=!D;JGT", "M=!D;JEQ", "M=!D;JGE", "M=!D;JLT", "M=!D;JNE",
+    "M=!D;JLE", "M=!D;JMP", "D=!D", "D=!D;JGT", "D=!D;JEQ", "D=!D;JGE", "D=!D;JLT", "D=!D;JNE", "D=!D;JLE", "D=!D;JMP",
+    "MD=!D", "MD=!D;JGT", "MD=!D;JEQ", "MD=!D;JGE", "MD=!D;JLT", "MD=!D;JNE", "MD=!D;JLE", "MD=!D;JMP", "A=!D",
+    "A=!D;JGT", "A=!D;JEQ", "A=!D;JGE", "A=!D;JLT", "A=!D;JNE", "A=!D;JLE", "A=!D;JMP", "AM=!D", "AM=!D;JGT",
+    "AM=!D;JEQ", "AM=!D;JGE", "AM=!D;JLT", "AM=!D;JNE", "AM=!D;JLE", "AM=!D;JMP", "AD=!D", "AD=!D;JGT", "AD=!D;JEQ",
+    "AD=!D;JGE", "AD=!D;JLT", "AD=!D;JNE", "AD=!D;JLE", "AD=!D;JMP", "AMD=!D", "AMD=!D;JGT", "AMD=!D;JEQ", "AMD=!D;JGE",
+    "AMD=!D;JLT", "AMD=!D;JNE", "AMD=!D;JLE", "AMD=!D;JMP", "!A", "!A;JGT", "!A;JEQ", "!A;JGE", "!A;JLT", "!A;JNE",
+    "!A;JLE", "!A;JMP", "M=!A", "M=!A;JGT", "M=!A;JEQ", "M=!A;JGE", "M=!A;JLT", "M=!A;JNE", "M=!A;JLE", "M=!A;JMP",
+    "D=!A", "D=!A;JGT", "D=!A;JEQ", "D=!A;JGE", "D=!A;JLT", "D=!A;JNE", "D=!A;JLE", "D=!A;JMP", "MD=!A", "MD=!A;JGT",
+    "MD=!A;JEQ", "MD=!A;JGE", "MD=!A;JLT", "MD=!A;JNE", "MD=!A;JLE", "MD=!A;JMP", "A=!A", "A=!A;JGT", "A=!A;JEQ",
+    "A=!A;JGE", "A=!A;JLT", "A=!A;JNE", "A=!A;JLE", "A=!A;JMP", "AM=!A", "AM=!A;JGT", "AM=!A;JEQ", "AM=!A;JGE",
+    "AM=!A;JLT", "AM=!A;JNE", "AM=!A;JLE", "AM=!A;JMP", "AD=!A", "AD=!A;JGT", "AD=!A;JEQ", "AD=!A;JGE", "AD=!A;JLT",
+    "AD=!A;JNE", "AD=!A;JLE", "AD=!A;JMP", "AMD=!A", "AMD=!A;JGT", "AMD=!A;JEQ", "AMD=!A;JGE", "AMD=!A;JLT",
+    "AMD=!A;JNE", "AMD=!A;JLE", "AMD=!A;JMP", "!M", "!M;JGT", "!M;JEQ", "!M;JGE", "!M;JLT", "!M;JNE", "!M;JLE",
+    "!M;JMP", "M=!M", "M=!M;JGT", "M=!M;JEQ", "M=!M;JGE", "M=!M;JLT", "M=!M;JNE", "M=!M;JLE", "M=!M;JMP", "D=!M",
+    "D=!M;JGT", "D=!M;JEQ", "D=!M;JGE", "D=!M;JLT", "D=!M;JNE", "D=!M;JLE", "D=!M;JMP", "MD=!M", "MD=!M;JGT",
+    "MD=!M;JEQ", "MD=!M;JGE", "MD=!M;JLT", "MD=!M;JNE", "MD=!M;JLE", "MD=!M;JMP", "A=!M", "A=!M;JGT", "A=!M;JEQ",
+    "A=!M;JGE", "A=!M;JLT", "A=!M;JNE", "A=!M;JLE", "A=!M;JMP", "AM=!M", "AM=!M;JGT", "AM=!M;JEQ", "AM=!M;JGE",
+    "AM=!M;JLT", "AM=!M;JNE", "AM=!M;JLE", "AM=!M;JMP", "AD=!M", "AD=!M;JGT", "AD=!M;JEQ", "AD=!M;JGE", "AD=!M;JLT",
+    "AD=!M;JNE", "AD=!M;JLE", "AD=!M;JMP", "AMD=!M", "AMD=!M;JGT", "AMD=!M;JEQ", "AMD=!M;JGE", "AMD=!M;JLT",
+    "AMD=!M;JNE", "AMD=!M;JLE", "AMD=!M;JMP", "-D", "-D;JGT", "-D;JEQ", "-D;JGE", "-D;JLT", "-D;JNE", "-D;JLE",
+    "-D;JMP", "M=-D", "M=-D;JGT", "M=-D;JEQ", "M=-D;JGE", "M=-D;JLT", "M=-D;JNE", "M=-D;JLE", "M=-D;JMP", "D=-D",
+    "D=-D;JGT", "D=-D;JEQ", "D=-D;JGE", "D=-D;JLT", "D=-D;JNE", "D=-D;JLE", "D=-D;JMP", "MD=-D", "MD=-D;JGT",
+    "MD=-D;JEQ", "MD=-D;JGE", "MD=-D;JLT", "MD=-D;JNE", "MD=-D;JLE", "MD=-D;JMP", "A=-D", "A=-D;JGT", "A=-D;JEQ",
+    "A=-D;JGE", "A=-D;JLT", "A=-D;JNE", "A=-D;JLE", "A=-D;JMP", "AM=-D", "AM=-D;JGT", "AM=-D;JEQ", "AM=-D;JGE",
+    "AM=-D;JLT", "AM=-D;JNE", "AM=-D;JLE", "AM=-D;JMP", "AD=-D", "AD=-D;JGT", "AD=-D;JEQ", "AD=-D;JGE", "AD=-D;JLT",
+    "AD=-D;JNE", "AD=-D;JLE", "AD=-D;JMP", "AMD=-D", "AMD=-D;JGT", "AMD=-D;JEQ", "AMD=-D;JGE", "AMD=-D;JLT",
+    "AMD=-D;JNE", "AMD=-D;JLE", "AMD=-D;JMP", "-A", "-A;JGT", "-A;JEQ", "-A;JGE", "-A;JLT", "-A;JNE", "-A;JLE",
+    "-A;JMP", "M=-A", "M=-A;JGT", "M=-A;JEQ", "M=-A;JGE", "M=-A;JLT", "M=-A;JNE", "M=-A;JLE", "M=-A;JMP", "D=-A",
+    "D=-A;JGT", "D=-A;JEQ", "D=-A;JGE", "D=-A;JLT", "D=-A;JNE", "D=-A;JLE", "D=-A;JMP", "MD=-A", "MD=-A;JGT",
+    "MD=-A;JEQ", "MD=-A;JGE", "MD=-A;JLT", "MD=-A;JNE", "MD=-A;JLE", "MD=-A;JMP", "A=-A", "A=-A;JGT", "A=-A;JEQ",
+    "A=-A;JGE", "A=-A;JLT", "A=-A;JNE", "A=-A;JLE", "A=-A;JMP", "AM=-A", "AM=-A;JGT", "AM=-A;JEQ", "AM=-A;JGE",
+    "AM=-A;JLT", "AM=-A;JNE", "AM=-A;JLE", "AM=-A;JMP", "AD=-A", "AD=-A;JGT", "AD=-A;JEQ", "AD=-A;JGE", "AD=-A;JLT",
+    "AD=-A;JNE", "AD=-A;JLE", "AD=-A;JMP", "AMD=-A", "AMD=-A;JGT", "AMD=-A;JEQ", "AMD=-A;JGE", "AMD=-A;JLT",
+    "AMD=-A;JNE", "AMD=-A;JLE", "AMD=-A;JMP", "-M", "-M;JGT", "-M;JEQ", "-M;JGE", "-M;JLT", "-M;JNE", "-M;JLE",
+    "-M;JMP", "M=-M", "M=-M;JGT", "M=-M;JEQ", "M=-M;JGE", "M=-M;JLT", "M=-M;JNE", "M=-M;JLE", "M=-M;JMP", "D=-M",
+    "D=-M;JGT", "D=-M;JEQ", "D=-M;JGE", "D=-M;JLT", "D=-M;JNE", "D=-M;JLE", "D=-M;JMP", "MD=-M", "MD=-M;JGT",
+    "MD=-M;JEQ", "MD=-M;JGE", "MD=-M;JLT", "MD=-M;JNE", "MD=-M;JLE", "MD=-M;JMP", "A=-M", "A=-M;JGT", "A=-M;JEQ",
+    "A=-M;JGE", "A=-M;JLT", "A=-M;JNE", "A=-M;JLE", "A=-M;JMP", "AM=-M", "AM=-M;JGT", "AM=-M;JEQ", "AM=-M;JGE",
+    "AM=-M;JLT", "AM=-M;JNE", "AM=-M;JLE", "AM=-M;JMP", "AD=-M", "AD=-M;JGT", "AD=-M;JEQ", "AD=-M;JGE", "AD=-M;JLT",
+    "AD=-M;JNE", "AD=-M;JLE", "AD=-M;JMP", "AMD=-M", "AMD=-M;JGT", "AMD=-M;JEQ", "AMD=-M;JGE", "AMD=-M;JLT",
+    "AMD=-M;JNE", "AMD=-M;JLE", "AMD=-M;JMP", "D+1", "D+1;JGT", "D+1;JEQ", "D+1;JGE", "D+1;JLT", "D+1;JNE", "D+1;JLE",
+    "D+1;JMP", "M=D+1", "M=D+1;JGT", "M=D+1;JEQ", "M=D+1;JGE", "M=D+1;JLT", "M=D+1;JNE", "M=D+1;JLE", "M=D+1;JMP",
+    "D=D+1", "D=D+1;JGT", "D=D+1;JEQ", "D=D+1;JGE", "D=D+1;JLT", "D=D+1;JNE", "D=D+1;JLE", "D=D+1;JMP", "MD=D+1",
+    "MD=D+1;JGT", "MD=D+1;JEQ", "MD=D+1;JGE", "MD=D+1;JLT", "MD=D+1;JNE", "MD=D+1;JLE", "MD=D+1;JMP", "A=D+1",
+    "A=D+1;JGT", "A=D+1;JEQ", "A=D+1;JGE", "A=D+1;JLT", "A=D+1;JNE", "A=D+1;JLE", "A=D+1;JMP", "AM=D+1", "AM=D+1;JGT",
+    "AM=D+1;JEQ", "AM=D+1;JGE", "AM=D+1;JLT", "AM=D+1;JNE", "AM=D+1;JLE", "AM=D+1;JMP", "AD=D+1", "AD=D+1;JGT",
+    "AD=D+1;JEQ", "AD=D+1;JGE", "AD=D+1;JLT", "AD=D+1;JNE", "AD=D+1;JLE", "AD=D+1;JMP", "AMD=D+1", "AMD=D+1;JGT",
+    "AMD=D+1;JEQ", "AMD=D+1;JGE", "AMD=D+1;JLT", "AMD=D+1;JNE", "AMD=D+1;JLE", "AMD=D+1;JMP", "A+1", "A+1;JGT",
+    "A+1;JEQ", "A+1;JGE", "A+1;JLT", "A+1;JNE", "A+1;JLE", "A+1;JMP", "M=A+1", "M=A+1;JGT", "M=A+1;JEQ", "M=A+1;JGE",
+    "M=A+1;JLT", "M=A+1;JNE", "M=A+1;JLE", "M=A+1;JMP", "D=A+1", "D=A+1;JGT", "D=A+1;JEQ", "D=A+1;JGE", "D=A+1;JLT",
+    "D=A+1;JNE", "D=A+1;JLE", "D=A+1;JMP", "MD=A+1", "MD=A+1;JGT", "MD=A+1;JEQ", "MD=A+1;JGE", "MD=A+1;JLT",
+    "MD=A+1;JNE", "MD=A+1;JLE", "MD=A+1;JMP", "A=A+1", "A=A+1;JGT", "A=A+1;JEQ", "A=A+1;JGE", "A=A+1;JLT", "A=A+1;JNE",
+    "A=A+1;JLE", "A=A+1;JMP", "AM=A+1", "AM=A+1;JGT", "AM=A+1;JEQ", "AM=A+1;JGE", "AM=A+1;JLT", "AM=A+1;JNE",
+    "AM=A+1;JLE", "AM=A+1;JMP", "AD=A+1", "AD=A+1;JGT", "AD=A+1;JEQ", "AD=A+1;JGE", "AD=A+1;JLT", "AD=A+1;JNE",
+    "AD=A+1;JLE", "AD=A+1;JMP", "AMD=A+1", "AMD=A+1;JGT", "AMD=A+1;JEQ", "AMD=A+1;JGE", "AMD=A+1;JLT", "AMD=A+1;JNE",
+    "AMD=A+1;JLE", "AMD=A+1;JMP", "M+1", "M+1;JGT", "M+1;JEQ", "M+1;JGE", "M+1;JLT", "M+1;JNE", "M+1;JLE", "M+1;JMP",
+    "M=M+1", "M=M+1;JGT", "M=M+1;JEQ", "M=M+1;JGE", "M=M+1;JLT", "M=M+1;JNE", "M=M+1;JLE", "M=M+1;JMP", "D=M+1",
+    "D=M+1;JGT", "D=M+1;JEQ", "D=M+1;JGE", "D=M+1;JLT", "D=M+1;JNE", "D=M+1;JLE", "D=M+1;JMP", "MD=M+1", "MD=M+1;JGT",
+    "MD=M+1;JEQ", "MD=M+1;JGE", "MD=M+1;JLT", "MD=M+1;JNE", "MD=M+1;JLE", "MD=M+1;JMP", "A=M+1", "A=M+1;JGT",
+    "A=M+1;JEQ", "A=M+1;JGE", "A=M+1;JLT", "A=M+1;JNE", "A=M+1;JLE", "A=M+1;JMP", "AM=M+1", "AM=M+1;JGT", "AM=M+1;JEQ",
+    "AM=M+1;JGE", "AM=M+1;JLT", "AM=M+1;JNE", "AM=M+1;JLE", "AM=M+1;JMP", "AD=M+1", "AD=M+1;JGT", "AD=M+1;JEQ",
+    "AD=M+1;JGE", "AD=M+1;JLT", "AD=M+1;JNE", "AD=M+1;JLE", "AD=M+1;JMP", "AMD=M+1", "AMD=M+1;JGT", "AMD=M+1;JEQ",
+    "AMD=M+1;JGE", "AMD=M+1;JLT", "AMD=M+1;JNE", "AMD=M+1;JLE", "AMD=M+1;JMP", "D-1", "D-1;JGT", "D-1;JEQ", "D-1;JGE",
+    "D-1;JLT", "D-1;JNE", "D-1;JLE", "D-1;JMP", "M=D-1", "M=D-1;JGT", "M=D-1;JEQ", "M=D-1;JGE", "M=D-1;JLT",
+    "M=D-1;JNE", "M=D-1;JLE", "M=D-1;JMP", "D=D-1", "D=D-1;JGT", "D=D-1;JEQ", "D=D-1;JGE", "D=D-1;JLT", "D=D-1;JNE",
+    "D=D-1;JLE", "D=D-1;JMP", "MD=D-1", "MD=D-1;JGT", "MD=D-1;JEQ", "MD=D-1;JGE", "MD=D-1;JLT", "MD=D-1;JNE",
+    "MD=D-1;JLE", "MD=D-1;JMP", "A=D-1", "A=D-1;JGT", "A=D-1;JEQ", "A=D-1;JGE", "A=D-1;JLT", "A=D-1;JNE", "A=D-1;JLE",
+    "A=D-1;JMP", "AM=D-1", "AM=D-1;JGT", "AM=D-1;JEQ", "AM=D-1;JGE", "AM=D-1;JLT", "AM=D-1;JNE", "AM=D-1;JLE",
+    "AM=D-1;JMP", "AD=D-1", "AD=D-1;JGT", "AD=D-1;JEQ", "AD=D-1;JGE", "AD=D-1;JLT", "AD=D-1;JNE", "AD=D-1;JLE",
+    "AD=D-1;JMP", "AMD=D-1", "AMD=D-1;JGT", "AMD=D-1;JEQ", "AMD=D-1;JGE", "AMD=D-1;JLT", "AMD=D-1;JNE", "AMD=D-1;JLE",
+    "AMD=D-1;JMP", "A-1", "A-1;JGT", "A-1;JEQ", "A-1;JGE", "A-1;JLT", "A-1;JNE", "A-1;JLE", "A-1;JMP", "M=A-1",
+    "M=A-1;JGT", "M=A-1;JEQ", "M=A-1;JGE", "M=A-1;JLT", "M=A-1;JNE", "M=A-1;JLE", "M=A-1;JMP", "D=A-1", "D=A-1;JGT",
+    "D=A-1;JEQ", "D=A-1;JGE", "D=A-1;JLT", "D=A-1;JNE", "D=A-1;JLE", "D=A-1;JMP", "MD=A-1", "MD=A-1;JGT", "MD=A-1;JEQ",
+    "MD=A-1;JGE", "MD=A-1;JLT", "MD=A-1;JNE", "MD=A-1;JLE", "MD=A-1;JMP", "A=A-1", "A=A-1;JGT", "A=A-1;JEQ",
+    "A=A-1;JGE", "A=A-1;JLT", "A=A-1;JNE", "A=A-1;JLE", "A=A-1;JMP", "AM=A-1", "AM=A-1;JGT", "AM=A-1;JEQ", "AM=A-1;JGE",
+    "AM=A-1;JLT", "AM=A-1;JNE", "AM=A-1;JLE", "AM=A-1;JMP", "AD=A-1", "AD=A-1;JGT", "AD=A-1;JEQ", "AD=A-1;JGE",
+    "AD=A-1;JLT", "AD=A-1;JNE", "AD=A-1;JLE", "AD=A-1;JMP", "AMD=A-1", "AMD=A-1;JGT", "AMD=A-1;JEQ", "AMD=A-1;JGE",
+    "AMD=A-1;JLT", "AMD=A-1;JNE", "AMD=A-1;JLE", "AMD=A-1;JMP", "M-1", "M-1;JGT", "M-1;JEQ", "M-1;JGE", "M-1;JLT",
+    "M-1;JNE", "M-1;JLE", "M-1;JMP", "M=M-1", "M=M-1;JGT", "M=M-1;JEQ", "M=M-1;JGE", "M=M-1;JLT", "M=M-1;JNE",
+    "M=M-1;JLE", "M=M-1;JMP", "D=M-1", "D=M-1;JGT", "D=M-1;JEQ", "D=M-1;JGE", "D=M-1;JLT", "D=M-1;JNE", "D=M-1;JLE",
+    "D=M-1;JMP", "MD=M-1", "MD=M-1;JGT", "MD=M-1;JEQ", "MD=M-1;JGE", "MD=M-1;JLT", "MD=M-1;JNE", "MD=M-1;JLE",
+    "MD=M-1;JMP", "A=M-1", "A=M-1;JGT", "A=M-1;JEQ", "A=M-1;JGE", "A=M-1;JLT", "A=M-1;JNE", "A=M-1;JLE", "A=M-1;JMP",
+    "AM=M-1", "AM=M-1;JGT", "AM=M-1;JEQ", "AM=M-1;JGE", "AM=M-1;JLT", "AM=M-1;JNE", "AM=M-1;JLE", "AM=M-1;JMP",
+    "AD=M-1", "AD=M-1;JGT", "AD=M-1;JEQ", "AD=M-1;JGE", "AD=M-1;JLT", "AD=M-1;JNE", "AD=M-1;JLE", "AD=M-1;JMP",
+    "AMD=M-1", "AMD=M-1;JGT", "AMD=M-1;JEQ", "AMD=M-1;JGE", "AMD=M-1;JLT", "AMD=M-1;JNE", "AMD=M-1;JLE", "AMD=M-1;JMP",
+    "D+A", "D+A;JGT", "D+A;JEQ", "D+A;JGE", "D+A;JLT", "D+A;JNE", "D+A;JLE", "D+A;JMP", "M=D+A", "M=D+A;JGT",
+    "M=D+A;JEQ", "M=D+A;JGE", "M=D+A;JLT", "M=D+A;JNE", "M=D+A;JLE", "M=D+A;JMP", "D=D+A", "D=D+A;JGT", "D=D+A;JEQ",
+    "D=D+A;JGE", "D=D+A;JLT", "D=D+A;JNE", "D=D+A;JLE", "D=D+A;JMP", "MD=D+A", "MD=D+A;JGT", "MD=D+A;JEQ", "MD=D+A;JGE",
+    "MD=D+A;JLT", "MD=D+A;JNE", "MD=D+A;JLE", "MD=D+A;JMP", "A=D+A", "A=D+A;JGT", "A=D+A;JEQ", "A=D+A;JGE", "A=D+A;JLT",
+    "A=D+A;JNE", "A=D+A;JLE", "A=D+A;JMP", "AM=D+A", "AM=D+A;JGT", "AM=D+A;JEQ", "AM=D+A;JGE", "AM=D+A;JLT",
+    "AM=D+A;JNE", "AM=D+A;JLE", "AM=D+A;JMP", "AD=D+A", "AD=D+A;JGT", "AD=D+A;JEQ", "AD=D+A;JGE", "AD=D+A;JLT",
+    "AD=D+A;JNE", "AD=D+A;JLE", "AD=D+A;JMP", "AMD=D+A", "AMD=D+A;JGT", "AMD=D+A;JEQ", "AMD=D+A;JGE", "AMD=D+A;JLT",
+    "AMD=D+A;JNE", "AMD=D+A;JLE", "AMD=D+A;JMP", "D+M", "D+M;JGT", "D+M;JEQ", "D+M;JGE", "D+M;JLT", "D+M;JNE",
+    "D+M;JLE", "D+M;JMP", "M=D+M", "M=D+M;JGT", "M=D+M;JEQ", "M=D+M;JGE", "M=D+M;JLT", "M=D+M;JNE", "M=D+M;JLE",
+    "M=D+M;JMP", "D=D+M", "D=D+M;JGT", "D=D+M;JEQ", "D=D+M;JGE", "D=D+M;JLT", "D=D+M;JNE", "D=D+M;JLE", "D=D+M;JMP",
+    "MD=D+M", "MD=D+M;JGT", "MD=D+M;JEQ", "MD=D+M;JGE", "MD=D+M;JLT", "MD=D+M;JNE", "MD=D+M;JLE", "MD=D+M;JMP", "A=D+M",
+    "A=D+M;JGT", "A=D+M;JEQ", "A=D+M;JGE", "A=D+M;JLT", "A=D+M;JNE", "A=D+M;JLE", "A=D+M;JMP", "AM=D+M", "AM=D+M;JGT",
+    "AM=D+M;JEQ", "AM=D+M;JGE", "AM=D+M;JLT", "AM=D+M;JNE", "AM=D+M;JLE", "AM=D+M;JMP", "AD=D+M", "AD=D+M;JGT",
+    "AD=D+M;JEQ", "AD=D+M;JGE", "AD=D+M;JLT", "AD=D+M;JNE", "AD=D+M;JLE", "AD=D+M;JMP", "AMD=D+M", "AMD=D+M;JGT",
+    "AMD=D+M;JEQ", "AMD=D+M;JGE", "AMD=D+M;JLT", "AMD=D+M;JNE", "AMD=D+M;JLE", "AMD=D+M;JMP", "D-A", "D-A;JGT",
+    "D-A;JEQ", "D-A;JGE", "D-A;JLT", "D-A;JNE", "D-A;JLE", "D-A;JMP", "M=D-A", "M=D-A;JGT", "M=D-A;JEQ", "M=D-A;JGE",
+    "M=D-A;JLT", "M=D-A;JNE", "M=D-A;JLE", "M=D-A;JMP", "D=D-A", "D=D-A;JGT", "D=D-A;JEQ", "D=D-A;JGE", "D=D-A;JLT",
+    "D=D-A;JNE", "D=D-A;JLE", "D=D-A;JMP", "MD=D-A", "MD=D-A;JGT", "MD=D-A;JEQ", "MD=D-A;JGE", "MD=D-A;JLT",
+    "MD=D-A;JNE", "MD=D-A;JLE", "MD=D-A;JMP", "A=D-A", "A=D-A;JGT", "A=D-A;JEQ", "A=D-A;JGE", "A=D-A;JLT", "A=D-A;JNE",
+    "A=D-A;JLE", "A=D-A;JMP", "AM=D-A", "AM=D-A;JGT", "AM=D-A;JEQ", "AM=D-A;JGE", "AM=D-A;JLT", "AM=D-A;JNE",
+    "AM=D-A;JLE", "AM=D-A;JMP", "AD=D-A", "AD=D-A;JGT", "AD=D-A;JEQ", "AD=D-A;JGE", "AD=D-A;JLT", "AD=D-A;JNE",
+    "AD=D-A;JLE", "AD=D-A;JMP", "AMD=D-A", "AMD=D-A;JGT", "AMD=D-A;JEQ", "AMD=D-A;JGE", "AMD=D-A;JLT", "AMD=D-A;JNE",
+    "AMD=D-A;JLE", "AMD=D-A;JMP", "D-M", "D-M;JGT", "D-M;JEQ", "D-M;JGE", "D-M;JLT", "D-M;JNE", "D-M;JLE", "D-M;JMP",
+    "M=D-M", "M=D-M;JGT", "M=D-M;JEQ", "M=D-M;JGE", "M=D-M;JLT", "M=D-M;JNE", "M=D-M;JLE", "M=D-M;JMP", "D=D-M",
+    "D=D-M;JGT", "D=D-M;JEQ", "D=D-M;JGE", "D=D-M;JLT", "D=D-M;JNE", "D=D-M;JLE", "D=D-M;JMP", "MD=D-M", "MD=D-M;JGT",
+    "MD=D-M;JEQ", "MD=D-M;JGE", "MD=D-M;JLT", "MD=D-M;JNE", "MD=D-M;JLE", "MD=D-M;JMP", "A=D-M", "A=D-M;JGT",
+    "A=D-M;JEQ", "A=D-M;JGE", "A=D-M;JLT", "A=D-M;JNE", "A=D-M;JLE", "A=D-M;JMP", "AM=D-M", "AM=D-M;JGT", "AM=D-M;JEQ",
+    "AM=D-M;JGE", "AM=D-M;JLT", "AM=D-M;JNE", "AM=D-M;JLE", "AM=D-M;JMP", "AD=D-M", "AD=D-M;JGT", "AD=D-M;JEQ",
+    "AD=D-M;JGE", "AD=D-M;JLT", "AD=D-M;JNE", "AD=D-M;JLE", "AD=D-M;JMP", "AMD=D-M", "AMD=D-M;JGT", "AMD=D-M;JEQ",
+    "AMD=D-M;JGE", "AMD=D-M;JLT", "AMD=D-M;JNE", "AMD=D-M;JLE", "AMD=D-M;JMP", "A-D", "A-D;JGT", "A-D;JEQ", "A-D;JGE",
+    "A-D;JLT", "A-D;JNE", "A-D;JLE", "A-D;JMP", "M=A-D", "M=A-D;JGT", "M=A-D;JEQ", "M=A-D;JGE", "M=A-D;JLT",
+    "M=A-D;JNE", "M=A-D;JLE", "M=A-D;JMP", "D=A-D", "D=A-D;JGT", "D=A-D;JEQ", "D=A-D;JGE", "D=A-D;JLT", "D=A-D;JNE",
+    "D=A-D;JLE", "D=A-D;JMP", "MD=A-D", "MD=A-D;JGT", "MD=A-D;JEQ", "MD=A-D;JGE", "MD=A-D;JLT", "MD=A-D;JNE",
+    "MD=A-D;JLE", "MD=A-D;JMP", "A=A-D", "A=A-D;JGT", "A=A-D;JEQ", "A=A-D;JGE", "A=A-D;JLT", "A=A-D;JNE", "A=A-D;JLE",
+    "A=A-D;JMP", "AM=A-D", "AM=A-D;JGT", "AM=A-D;JEQ", "AM=A-D;JGE", "AM=A-D;JLT", "AM=A-D;JNE", "AM=A-D;JLE",
+    "AM=A-D;JMP", "AD=A-D", "AD=A-D;JGT", "AD=A-D;JEQ", "AD=A-D;JGE", "AD=A-D;JLT", "AD=A-D;JNE", "AD=A-D;JLE",
+    "AD=A-D;JMP", "AMD=A-D", "AMD=A-D;JGT", "AMD=A-D;JEQ", "AMD=A-D;JGE", "AMD=A-D;JLT", "AMD=A-D;JNE", "AMD=A-D;JLE",
+    "AMD=A-D;JMP", "M-D", "M-D;JGT", "M-D;JEQ", "M-D;JGE", "M-D;JLT", "M-D;JNE", "M-D;JLE", "M-D;JMP", "M=M-D",
+    "M=M-D;JGT", "M=M-D;JEQ", "M=M-D;JGE", "M=M-D;JLT", "M=M-D;JNE", "M=M-D;JLE", "M=M-D;JMP", "D=M-D", "D=M-D;JGT",
+    "D=M-D;JEQ", "D=M-D;JGE", "D=M-D;JLT", "D=M-D;JNE", "D=M-D;JLE", "D=M-D;JMP", "MD=M-D", "MD=M-D;JGT", "MD=M-D;JEQ",
+    "MD=M-D;JGE", "MD=M-D;JLT", "MD=M-D;JNE", "MD=M-D;JLE", "MD=M-D;JMP", "A=M-D", "A=M-D;JGT", "A=M-D;JEQ",
+    "A=M-D;JGE", "A=M-D;JLT", "A=M-D;JNE", "A=M-D;JLE", "A=M-D;JMP", "AM=M-D", "AM=M-D;JGT", "AM=M-D;JEQ", "AM=M-D;JGE",
+    "AM=M-D;JLT", "AM=M-D;JNE", "AM=M-D;JLE", "AM=M-D;JMP", "AD=M-D", "AD=M-D;JGT", "AD=M-D;JEQ", "AD=M-D;JGE",
+    "AD=M-D;JLT", "AD=M-D;JNE", "AD=M-D;JLE", "AD=M-D;JMP", "AMD=M-D", "AMD=M-D;JGT", "AMD=M-D;JEQ", "AMD=M-D;JGE",
+    "AMD=M-D;JLT", "AMD=M-D;JNE", "AMD=M-D;JLE", "AMD=M-D;JMP", "D&A", "D&A;JGT", "D&A;JEQ", "D&A;JGE", "D&A;JLT",
+    "D&A;JNE", "D&A;JLE", "D&A;JMP", "M=D&A", "M=D&A;JGT", "M=D&A;JEQ", "M=D&A;JGE", "M=D&A;JLT", "M=D&A;JNE",
+    "M=D&A;JLE", "M=D&A;JMP", "D=D&A", "D=D&A;JGT", "D=D&A;JEQ", "D=D&A;JGE", "D=D&A;JLT", "D=D&A;JNE", "D=D&A;JLE",
+    "D=D&A;JMP", "MD=D&A", "MD=D&A;JGT", "MD=D&A;JEQ", "MD=D&A;JGE", "MD=D&A;JLT", "MD=D&A;JNE", "MD=D&A;JLE",
+    "MD=D&A;JMP", "A=D&A", "A=D&A;JGT", "A=D&A;JEQ", "A=D&A;JGE", "A=D&A;JLT", "A=D&A;JNE", "A=D&A;JLE", "A=D&A;JMP",
+    "AM=D&A", "AM=D&A;JGT", "AM=D&A;JEQ", "AM=D&A;JGE", "AM=D&A;JLT", "AM=D&A;JNE", "AM=D&A;JLE", "AM=D&A;JMP",
+    "AD=D&A", "AD=D&A;JGT", "AD=D&A;JEQ", "AD=D&A;JGE", "AD=D&A;JLT", "AD=D&A;JNE", "AD=D&A;JLE", "AD=D&A;JMP",
+    "AMD=D&A", "AMD=D&A;JGT", "AMD=D&A;JEQ", "AMD=D&A;JGE", "AMD=D&A;JLT", "AMD=D&A;JNE", "AMD=D&A;JLE", "AMD=D&A;JMP",
+    "D&M", "D&M;JGT", "D&M;JEQ", "D&M;JGE", "D&M;JLT", "D&M;JNE", "D&M;JLE", "D&M;JMP", "M=D&M", "M=D&M;JGT",
+    "M=D&M;JEQ", "M=D&M;JGE", "M=D&M;JLT", "M=D&M;JNE", "M=D&M;JLE", "M=D&M;JMP", "D=D&M", "D=D&M;JGT", "D=D&M;JEQ",
+    "D=D&M;JGE", "D=D&M;JLT", "D=D&M;JNE", "D=D&M;JLE", "D=D&M;JMP", "MD=D&M", "MD=D&M;JGT", "MD=D&M;JEQ", "MD=D&M;JGE",
+    "MD=D&M;JLT", "MD=D&M;JNE", "MD=D&M;JLE", "MD=D&M;JMP", "A=D&M", "A=D&M;JGT", "A=D&M;JEQ", "A=D&M;JGE", "A=D&M;JLT",
+    "A=D&M;JNE", "A=D&M;JLE", "A=D&M;JMP", "AM=D&M", "AM=D&M;JGT", "AM=D&M;JEQ", "AM=D&M;JGE", "AM=D&M;JLT",
+    "AM=D&M;JNE", "AM=D&M;JLE", "AM=D&M;JMP", "AD=D&M", "AD=D&M;JGT", "AD=D&M;JEQ", "AD=D&M;JGE", "AD=D&M;JLT",
+    "AD=D&M;JNE", "AD=D&M;JLE", "AD=D&M;JMP", "AMD=D&M", "AMD=D&M;JGT", "AMD=D&M;JEQ", "AMD=D&M;JGE", "AMD=D&M;JLT",
+    "AMD=D&M;JNE", "AMD=D&M;JLE", "AMD=D&M;JMP", "D|A", "D|A;JGT", "D|A;JEQ", "D|A;JGE", "D|A;JLT", "D|A;JNE",
+    "D|A;JLE", "D|A;JMP", "M=D|A", "M=D|A;JGT", "M=D|A;JEQ", "M=D|A;JGE", "M=D|A;JLT", "M=D|A;JNE", "M=D|A;JLE",
+    "M=D|A;JMP", "D=D|A", "D=D|A;JGT", "D=D|A;JEQ", "D=D|A;JGE", "D=D|A;JLT", "D=D|A;JNE", "D=D|A;JLE", "D=D|A;JMP",
+    "MD=D|A", "MD=D|A;JGT", "MD=D|A;JEQ", "MD=D|A;JGE", "MD=D|A;JLT", "MD=D|A;JNE", "MD=D|A;JLE", "MD=D|A;JMP", "A=D|A",
+    "A=D|A;JGT", "A=D|A;JEQ", "A=D|A;JGE", "A=D|A;JLT", "A=D|A;JNE", "A=D|A;JLE", "A=D|A;JMP", "AM=D|A", "AM=D|A;JGT",
+    "AM=D|A;JEQ", "AM=D|A;JGE", "AM=D|A;JLT", "AM=D|A;JNE", "AM=D|A;JLE", "AM=D|A;JMP", "AD=D|A", "AD=D|A;JGT",
+    "AD=D|A;JEQ", "AD=D|A;JGE", "AD=D|A;JLT", "AD=D|A;JNE", "AD=D|A;JLE", "AD=D|A;JMP", "AMD=D|A", "AMD=D|A;JGT",
+    "AMD=D|A;JEQ", "AMD=D|A;JGE", "AMD=D|A;JLT", "AMD=D|A;JNE", "AMD=D|A;JLE", "AMD=D|A;JMP", "D|M", "D|M;JGT",
+    "D|M;JEQ", "D|M;JGE", "D|M;JLT", "D|M;JNE", "D|M;JLE", "D|M;JMP", "M=D|M", "M=D|M;JGT", "M=D|M;JEQ", "M=D|M;JGE",
+    "M=D|M;JLT", "M=D|M;JNE", "M=D|M;JLE", "M=D|M;JMP", "D=D|M", "D=D|M;JGT", "D=D|M;JEQ", "D=D|M;JGE", "D=D|M;JLT",
+    "D=D|M;JNE", "D=D|M;JLE", "D=D|M;JMP", "MD=D|M", "MD=D|M;JGT", "MD=D|M;JEQ", "MD=D|M;JGE", "MD=D|M;JLT",
+    "MD=D|M;JNE", "MD=D|M;JLE", "MD=D|M;JMP", "A=D|M", "A=D|M;JGT", "A=D|M;JEQ", "A=D|M;JGE", "A=D|M;JLT", "A=D|M;JNE",
+    "A=D|M;JLE", "A=D|M;JMP", "AM=D|M", "AM=D|M;JGT", "AM=D|M;JEQ", "AM=D|M;JGE", "AM=D|M;JLT", "AM=D|M;JNE",
+    "AM=D|M;JLE", "AM=D|M;JMP", "AD=D|M", "AD=D|M;JGT", "AD=D|M;JEQ", "AD=D|M;JGE", "AD=D|M;JLT", "AD=D|M;JNE",
+    "AD=D|M;JLE", "AD=D|M;JMP", "AMD=D|M", "AMD=D|M;JGT", "AMD=D|M;JEQ", "AMD=D|M;JGE", "AMD=D|M;JLT", "AMD=D|M;JNE",
+    "AMD=D|M;JLE", "AMD=D|M;JMP", "1+D", "1+D;JGT", "1+D;JEQ", "1+D;JGE", "1+D;JLT", "1+D;JNE", "1+D;JLE", "1+D;JMP",
+    "M=1+D", "M=1+D;JGT", "M=1+D;JEQ", "M=1+D;JGE", "M=1+D;JLT", "M=1+D;JNE", "M=1+D;JLE", "M=1+D;JMP", "D=1+D",
+    "D=1+D;JGT", "D=1+D;JEQ", "D=1+D;JGE", "D=1+D;JLT", "D=1+D;JNE", "D=1+D;JLE", "D=1+D;JMP", "MD=1+D", "MD=1+D;JGT",
+    "MD=1+D;JEQ", "MD=1+D;JGE", "MD=1+D;JLT", "MD=1+D;JNE", "MD=1+D;JLE", "MD=1+D;JMP", "A=1+D", "A=1+D;JGT",
+    "A=1+D;JEQ", "A=1+D;JGE", "A=1+D;JLT", "A=1+D;JNE", "A=1+D;JLE", "A=1+D;JMP", "AM=1+D", "AM=1+D;JGT", "AM=1+D;JEQ",
+    "AM=1+D;JGE", "AM=1+D;JLT", "AM=1+D;JNE", "AM=1+D;JLE", "AM=1+D;JMP", "AD=1+D", "AD=1+D;JGT", "AD=1+D;JEQ",
+    "AD=1+D;JGE", "AD=1+D;JLT", "AD=1+D;JNE", "AD=1+D;JLE", "AD=1+D;JMP", "AMD=1+D", "AMD=1+D;JGT", "AMD=1+D;JEQ",
+    "AMD=1+D;JGE", "AMD=1+D;JLT", "AMD=1+D;JNE", "AMD=1+D;JLE", "AMD=1+D;JMP", "1+A", "1+A;JGT", "1+A;JEQ", "1+A;JGE",
+    "1+A;JLT", "1+A;JNE", "1+A;JLE", "1+A;JMP", "M=1+A", "M=1+A;JGT", "M=1+A;JEQ", "M=1+A;JGE", "M=1+A;JLT",
+    "M=1+A;JNE", "M=1+A;JLE", "M=1+A;JMP", "D=1+A", "D=1+A;JGT", "D=1+A;JEQ", "D=1+A;JGE", "D=1+A;JLT", "D=1+A;JNE",
+    "D=1+A;JLE", "D=1+A;JMP", "MD=1+A", "MD=1+A;JGT", "MD=1+A;JEQ", "MD=1+A;JGE", "MD=1+A;JLT", "MD=1+A;JNE",
+    "MD=1+A;JLE", "MD=1+A;JMP", "A=1+A", "A=1+A;JGT", "A=1+A;JEQ", "A=1+A;JGE", "A=1+A;JLT", "A=1+A;JNE", "A=1+A;JLE",
+    "A=1+A;JMP", "AM=1+A", "AM=1+A;JGT", "AM=1+A;JEQ", "AM=1+A;JGE", "AM=1+A;JLT", "AM=1+A;JNE", "AM=1+A;JLE",
+    "AM=1+A;JMP", "AD=1+A", "AD=1+A;JGT", "AD=1+A;JEQ", "AD=1+A;JGE", "AD=1+A;JLT", "AD=1+A;JNE", "AD=1+A;JLE",
+    "AD=1+A;JMP", "AMD=1+A", "AMD=1+A;JGT", "AMD=1+A;JEQ", "AMD=1+A;JGE", "AMD=1+A;JLT", "AMD=1+A;JNE", "AMD=1+A;JLE",
+    "AMD=1+A;JMP", "1+M", "1+M;JGT", "1+M;JEQ", "1+M;JGE", "1+M;JLT", "1+M;JNE", "1+M;JLE", "1+M;JMP", "M=1+M",
+    "M=1+M;JGT", "M=1+M;JEQ", "M=1+M;JGE", "M=1+M;JLT", "M=1+M;JNE", "M=1+M;JLE", "M=1+M;JMP", "D=1+M", "D=1+M;JGT",
+    "D=1+M;JEQ", "D=1+M;JGE", "D=1+M;JLT", "D=1+M;JNE", "D=1+M;JLE", "D=1+M;JMP", "MD=1+M", "MD=1+M;JGT", "MD=1+M;JEQ",
+    "MD=1+M;JGE", "MD=1+M;JLT", "MD=1+M;JNE", "MD=1+M;JLE", "MD=1+M;JMP", "A=1+M", "A=1+M;JGT", "A=1+M;JEQ",
+    "A=1+M;JGE", "A=1+M;JLT", "A=1+M;JNE", "A=1+M;JLE", "A=1+M;JMP", "AM=1+M", "AM=1+M;JGT", "AM=1+M;JEQ", "AM=1+M;JGE",
+    "AM=1+M;JLT", "AM=1+M;JNE", "AM=1+M;JLE", "AM=1+M;JMP", "AD=1+M", "AD=1+M;JGT", "AD=1+M;JEQ", "AD=1+M;JGE",
+    "AD=1+M;JLT", "AD=1+M;JNE", "AD=1+M;JLE", "AD=1+M;JMP", "AMD=1+M", "AMD=1+M;JGT", "AMD=1+M;JEQ", "AMD=1+M;JGE",
+    "AMD=1+M;JLT", "AMD=1+M;JNE", "AMD=1+M;JLE", "AMD=1+M;JMP", "A+D", "A+D;JGT", "A+D;JEQ", "A+D;JGE", "A+D;JLT",
+    "A+D;JNE", "A+D;JLE", "A+D;JMP", "M=A+D", "M=A+D;JGT", "M=A+D;JEQ", "M=A+D;JGE", "M=A+D;JLT", "M=A+D;JNE",
+    "M=A+D;JLE", "M=A+D;JMP", "D=A+D", "D=A+D;JGT", "D=A+D;JEQ", "D=A+D;JGE", "D=A+D;JLT", "D=A+D;JNE", "D=A+D;JLE",
+    "D=A+D;JMP", "MD=A+D", "MD=A+D;JGT", "MD=A+D;JEQ", "MD=A+D;JGE", "MD=A+D;JLT", "MD=A+D;JNE", "MD=A+D;JLE",
+    "MD=A+D;JMP", "A=A+D", "A=A+D;JGT", "A=A+D;JEQ", "A=A+D;JGE", "A=A+D;JLT", "A=A+D;JNE", "A=A+D;JLE", "A=A+D;JMP",
+    "AM=A+D", "AM=A+D;JGT", "AM=A+D;JEQ", "AM=A+D;JGE", "AM=A+D;JLT", "AM=A+D;JNE", "AM=A+D;JLE", "AM=A+D;JMP",
+    "AD=A+D", "AD=A+D;JGT", "AD=A+D;JEQ", "AD=A+D;JGE", "AD=A+D;JLT", "AD=A+D;JNE", "AD=A+D;JLE", "AD=A+D;JMP",
+    "AMD=A+D", "AMD=A+D;JGT", "AMD=A+D;JEQ", "AMD=A+D;JGE", "AMD=A+D;JLT", "AMD=A+D;JNE", "AMD=A+D;JLE", "AMD=A+D;JMP",
+    "M+D", "M+D;JGT", "M+D;JEQ", "M+D;JGE", "M+D;JLT", "M+D;JNE", "M+D;JLE", "M+D;JMP", "M=M+D", "M=M+D;JGT",
+    "M=M+D;JEQ", "M=M+D;JGE", "M=M+D;JLT", "M=M+D;JNE", "M=M+D;JLE", "M=M+D;JMP", "D=M+D", "D=M+D;JGT", "D=M+D;JEQ",
+    "D=M+D;JGE", "D=M+D;JLT", "D=M+D;JNE", "D=M+D;JLE", "D=M+D;JMP", "MD=M+D", "MD=M+D;JGT", "MD=M+D;JEQ", "MD=M+D;JGE",
+    "MD=M+D;JLT", "MD=M+D;JNE", "MD=M+D;JLE", "MD=M+D;JMP", "A=M+D", "A=M+D;JGT", "A=M+D;JEQ", "A=M+D;JGE", "A=M+D;JLT",
+    "A=M+D;JNE", "A=M+D;JLE", "A=M+D;JMP", "AM=M+D", "AM=M+D;JGT", "AM=M+D;JEQ", "AM=M+D;JGE", "AM=M+D;JLT",
+    "AM=M+D;JNE", "AM=M+D;JLE", "AM=M+D;JMP", "AD=M+D", "AD=M+D;JGT", "AD=M+D;JEQ", "AD=M+D;JGE", "AD=M+D;JLT",
+    "AD=M+D;JNE", "AD=M+D;JLE", "AD=M+D;JMP", "AMD=M+D", "AMD=M+D;JGT", "AMD=M+D;JEQ", "AMD=M+D;JGE", "AMD=M+D;JLT",
+    "AMD=M+D;JNE", "AMD=M+D;JLE", "AMD=M+D;JMP", "A&D", "A&D;JGT", "A&D;JEQ", "A&D;JGE", "A&D;JLT", "A&D;JNE",
+    "A&D;JLE", "A&D;JMP", "M=A&D", "M=A&D;JGT", "M=A&D;JEQ", "M=A&D;JGE", "M=A&D;JLT", "M=A&D;JNE", "M=A&D;JLE",
+    "M=A&D;JMP", "D=A&D", "D=A&D;JGT", "D=A&D;JEQ", "D=A&D;JGE", "D=A&D;JLT", "D=A&D;JNE", "D=A&D;JLE", "D=A&D;JMP",
+    "MD=A&D", "MD=A&D;JGT", "MD=A&D;JEQ", "MD=A&D;JGE", "MD=A&D;JLT", "MD=A&D;JNE", "MD=A&D;JLE", "MD=A&D;JMP", "A=A&D",
+    "A=A&D;JGT", "A=A&D;JEQ", "A=A&D;JGE", "A=A&D;JLT", "A=A&D;JNE", "A=A&D;JLE", "A=A&D;JMP", "AM=A&D", "AM=A&D;JGT",
+    "AM=A&D;JEQ", "AM=A&D;JGE", "AM=A&D;JLT", "AM=A&D;JNE", "AM=A&D;JLE", "AM=A&D;JMP", "AD=A&D", "AD=A&D;JGT",
+    "AD=A&D;JEQ", "AD=A&D;JGE", "AD=A&D;JLT", "AD=A&D;JNE", "AD=A&D;JLE", "AD=A&D;JMP", "AMD=A&D", "AMD=A&D;JGT",
+    "AMD=A&D;JEQ", "AMD=A&D;JGE", "AMD=A&D;JLT", "AMD=A&D;JNE", "AMD=A&D;JLE", "AMD=A&D;JMP", "M&D", "M&D;JGT",
+    "M&D;JEQ", "M&D;JGE", "M&D;JLT", "M&D;JNE", "M&D;JLE", "M&D;JMP", "M=M&D", "M=M&D;JGT", "M=M&D;JEQ", "M=M&D;JGE",
+    "M=M&D;JLT", "M=M&D;JNE", "M=M&D;JLE", "M=M&D;JMP", "D=M&D", "D=M&D;JGT", "D=M&D;JEQ", "D=M&D;JGE", "D=M&D;JLT",
+    "D=M&D;JNE", "D=M&D;JLE", "D=M&D;JMP", "MD=M&D", "MD=M&D;JGT", "MD=M&D;JEQ", "MD=M&D;JGE", "MD=M&D;JLT",
+    "MD=M&D;JNE", "MD=M&D;JLE", "MD=M&D;JMP", "A=M&D", "A=M&D;JGT", "A=M&D;JEQ", "A=M&D;JGE", "A=M&D;JLT", "A=M&D;JNE",
+    "A=M&D;JLE", "A=M&D;JMP", "AM=M&D", "AM=M&D;JGT", "AM=M&D;JEQ", "AM=M&D;JGE", "AM=M&D;JLT", "AM=M&D;JNE",
+    "AM=M&D;JLE", "AM=M&D;JMP", "AD=M&D", "AD=M&D;JGT", "AD=M&D;JEQ", "AD=M&D;JGE", "AD=M&D;JLT", "AD=M&D;JNE",
+    "AD=M&D;JLE", "AD=M&D;JMP", "AMD=M&D", "AMD=M&D;JGT", "AMD=M&D;JEQ", "AMD=M&D;JGE", "AMD=M&D;JLT", "AMD=M&D;JNE",
+    "AMD=M&D;JLE", "AMD=M&D;JMP", "A|D", "A|D;JGT", "A|D;JEQ", "A|D;JGE", "A|D;JLT", "A|D;JNE", "A|D;JLE", "A|D;JMP",
+    "M=A|D", "M=A|D;JGT", "M=A|D;JEQ", "M=A|D;JGE", "M=A|D;JLT", "M=A|D;JNE", "M=A|D;JLE", "M=A|D;JMP", "D=A|D",
+    "D=A|D;JGT", "D=A|D;JEQ", "D=A|D;JGE", "D=A|D;JLT", "D=A|D;JNE", "D=A|D;JLE", "D=A|D;JMP", "MD=A|D", "MD=A|D;JGT",
+    "MD=A|D;JEQ", "MD=A|D;JGE", "MD=A|D;JLT", "MD=A|D;JNE", "MD=A|D;JLE", "MD=A|D;JMP", "A=A|D", "A=A|D;JGT",
+    "A=A|D;JEQ", "A=A|D;JGE", "A=A|D;JLT", "A=A|D;JNE", "A=A|D;JLE", "A=A|D;JMP", "AM=A|D", "AM=A|D;JGT", "AM=A|D;JEQ",
+    "AM=A|D;JGE", "AM=A|D;JLT", "AM=A|D;JNE", "AM=A|D;JLE", "AM=A|D;JMP", "AD=A|D", "AD=A|D;JGT", "AD=A|D;JEQ",
+    "AD=A|D;JGE", "AD=A|D;JLT", "AD=A|D;JNE", "AD=A|D;JLE", "AD=A|D;JMP", "AMD=A|D", "AMD=A|D;JGT", "AMD=A|D;JEQ",
+    "AMD=A|D;JGE", "AMD=A|D;JLT", "AMD=A|D;JNE", "AMD=A|D;JLE", "AMD=A|D;JMP", "M|D", "M|D;JGT", "M|D;JEQ", "M|D;JGE",
+    "M|D;JLT", "M|D;JNE", "M|D;JLE", "M|D;JMP", "M=M|D", "M=M|D;JGT", "M=M|D;JEQ", "M=M|D;JGE", "M=M|D;JLT",
+    "M=M|D;JNE", "M=M|D;JLE", "M=M|D;JMP", "D=M|D", "D=M|D;JGT", "D=M|D;JEQ", "D=M|D;JGE", "D=M|D;JLT", "D=M|D;JNE",
+    "D=M|D;JLE", "D=M|D;JMP", "MD=M|D", "MD=M|D;JGT", "MD=M|D;JEQ", "MD=M|D;JGE", "MD=M|D;JLT", "MD=M|D;JNE",
+    "MD=M|D;JLE", "MD=M|D;JMP", "A=M|D", "A=M|D;JGT", "A=M|D;JEQ", "A=M|D;JGE", "A=M|D;JLT", "A=M|D;JNE", "A=M|D;JLE",
+    "A=M|D;JMP", "AM=M|D", "AM=M|D;JGT", "AM=M|D;JEQ", "AM=M|D;JGE", "AM=M|D;JLT", "AM=M|D;JNE", "AM=M|D;JLE",
+    "AM=M|D;JMP", "AD=M|D", "AD=M|D;JGT", "AD=M|D;JEQ", "AD=M|D;JGE", "AD=M|D;JLT", "AD=M|D;JNE", "AD=M|D;JLE",
+    "AD=M|D;JMP", "AMD=M|D", "AMD=M|D;JGT", "AMD=M|D;JEQ", "AMD=M|D;JGE", "AMD=M|D;JLT", "AMD=M|D;JNE", "AMD=M|D;JLE",
+    "AMD=M|D;JMP",
+), (
+    60032, 60033, 60034, 60035, 60036, 60037, 60038, 60039, 60040, 60041, 60042, 60043, 60044, 60045, 60046, 60047,
+    60048, 60049, 60050, 60051, 60052, 60053, 60054, 60055, 60056, 60057, 60058, 60059, 60060, 60061, 60062, 60063,
+    60064, 60065, 60066, 60067, 60068, 60069, 60070, 60071, 60072, 60073, 60074, 60075, 60076, 60077, 60078, 60079,
+    60080, 60081, 60082, 60083, 60084, 60085, 60086, 60087, 60088, 60089, 60090, 60091, 60092, 60093, 60094, 60095,
+    61376, 61377, 61378, 61379, 61380, 61381, 61382, 61383, 61384, 61385, 61386, 61387, 61388, 61389, 61390, 61391,
+    61392, 61393, 61394, 61395, 61396, 61397, 61398, 61399, 61400, 61401, 61402, 61403, 61404, 61405, 61406, 61407,
+    61408, 61409, 61410, 61411, 61412, 61413, 61414, 61415, 61416, 61417, 61418, 61419, 61420, 61421, 61422, 61423,
+    61424, 61425, 61426, 61427, 61428, 61429, 61430, 61431, 61432, 61433, 61434, 61435, 61436, 61437, 61438, 61439,
+    61056, 61057, 61058, 61059, 61060, 61061, 61062, 61063, 61064, 61065, 61066, 61067, 61068, 61069, 61070, 61071,
+    61072, 61073, 61074, 61075, 61076, 61077, 61078, 61079, 61080, 61081, 61082, 61083, 61084, 61085, 61086, 61087,
+    61088, 61089, 61090, 61091, 61092, 61093, 61094, 61095, 61096, 61097, 61098, 61099, 61100, 61101, 61102, 61103,
+    61104, 61105, 61106, 61107, 61108, 61109, 61110, 61111, 61112, 61113, 61114, 61115, 61116, 61117, 61118, 61119,
+    58112, 58113, 58114, 58115, 58116, 58117, 58118, 58119, 58120, 58121, 58122, 58123, 58124, 58125, 58126, 58127,
+    58128, 58129, 58130, 58131, 58132, 58133, 58134, 58135, 58136, 58137, 58138, 58139, 58140, 58141, 58142, 58143,
+    58144, 58145, 58146, 58147, 58148, 58149, 58150, 58151, 58152, 58153, 58154, 58155, 58156, 58157, 58158, 58159,
+    58160, 58161, 58162, 58163, 58164, 58165, 58166, 58167, 58168, 58169, 58170, 58171, 58172, 58173, 58174, 58175,
+    60416, 60417, 60418, 60419, 60420, 60421, 60422, 60423, 60424, 60425, 60426, 60427, 60428, 60429, 60430, 60431,
+    60432, 60433, 60434, 60435, 60436, 60437, 60438, 60439, 60440, 60441, 60442, 60443, 60444, 60445, 60446, 60447,
+    60448, 60449, 60450, 60451, 60452, 60453, 60454, 60455, 60456, 60457, 60458, 60459, 60460, 60461, 60462, 60463,
+    60464, 60465, 60466, 60467, 60468, 60469, 60470, 60471, 60472, 60473, 60474, 60475, 60476, 60477, 60478, 60479,
+    64512, 64513, 64514, 64515, 64516, 64517, 64518, 64519, 64520, 64521, 64522, 64523, 64524, 64525, 64526, 64527,
+    64528, 64529, 64530, 64531, 64532, 64533, 64534, 64535, 64536, 64537, 64538, 64539, 64540, 64541, 64542, 64543,
+    64544, 64545, 64546, 64547, 64548, 64549, 64550, 64551, 64552, 64553, 64554, 64555, 64556, 64557, 64558, 64559,
+    64560, 64561, 64562, 64563, 64564, 64565, 64566, 64567, 64568, 64569, 64570, 64571, 64572, 64573, 64574, 64575,
+    58176, 58177, 58178, 58179, 58180, 58181, 58182, 58183, 58184, 58185, 58186, 58187, 58188, 58189, 58190, 58191,
+    58192, 58193, 58194, 58195, 58196, 58197, 58198, 58199, 58200, 58201, 58202, 58203, 58204, 58205, 58206, 58207,
+    58208, 58209, 58210, 58211, 58212, 58213, 58214, 58215, 58216, 58217, 58218, 58219, 58220, 58221, 58222, 58223,
+    58224, 58225, 58226, 58227, 58228, 58229, 58230, 58231, 58232, 58233, 58234, 58235, 58236, 58237, 58238, 58239,
+    60480, 60481, 60482, 60483, 60484, 60485, 60486, 60487, 60488, 60489, 60490, 60491, 60492, 60493, 60494, 60495,
+    60496, 60497, 60498, 60499, 60500, 60501, 60502, 60503, 60504, 60505, 60506, 60507, 60508, 60509, 60510, 60511,
+    60512, 60513, 60514, 60515, 60516, 60517, 60518, 60519, 60520, 60521, 60522, 60523, 60524, 60525, 60526, 60527,
+    60528, 60529, 60530, 60531, 60532, 60533, 60534, 60535, 60536, 60537, 60538, 60539, 60540, 60541, 60542, 60543,
+    64576, 64577, 64578, 64579, 64580, 64581, 64582, 64583, 64584, 64585, 64586, 64587, 64588, 64589, 64590, 64591,
+    64592, 64593, 64594, 64595, 64596, 64597, 64598, 64599, 64600, 64601, 64602, 64603, 64604, 64605, 64606, 64607,
+    64608, 64609, 64610, 64611, 64612, 64613, 64614, 64615, 64616, 64617, 64618, 64619, 64620, 64621, 64622, 64623,
+    64624, 64625, 64626, 64627, 64628, 64629, 64630, 64631, 64632, 64633, 64634, 64635, 64636, 64637, 64638, 64639,
+    58304, 58305, 58306, 58307, 58308, 58309, 58310, 58311, 58312, 58313, 58314, 58315, 58316, 58317, 58318, 58319,
+    58320, 58321, 58322, 58323, 58324, 58325, 58326, 58327, 58328, 58329, 58330, 58331, 58332, 58333, 58334, 58335,
+    58336, 58337, 58338, 58339, 58340, 58341, 58342, 58343, 58344, 58345, 58346, 58347, 58348, 58349, 58350, 58351,
+    58352, 58353, 58354, 58355, 58356, 58357, 58358, 58359, 58360, 58361, 58362, 58363, 58364, 58365, 58366, 58367,
+    60608, 60609, 60610, 60611, 60612, 60613, 60614, 60615, 60616, 60617, 60618, 60619, 60620, 60621, 60622, 60623,
+    60624, 60625, 60626, 60627, 60628, 60629, 60630, 60631, 60632, 60633, 60634, 60635, 60636, 60637, 60638, 60639,
+    60640, 60641, 60642, 60643, 60644, 60645, 60646, 60647, 60648, 60649, 60650, 60651, 60652, 60653, 60654, 60655,
+    60656, 60657, 60658, 60659, 60660, 60661, 60662, 60663, 60664, 60665, 60666, 60667, 60668, 60669, 60670, 60671,
+    64704, 64705, 64706, 64707, 64708, 64709, 64710, 64711, 64712, 64713, 64714, 64715, 64716, 64717, 64718, 64719,
+    64720, 64721, 64722, 64723, 64724, 64725, 64726, 64727, 64728, 64729, 64730, 64731, 64732, 64733, 64734, 64735,
+    64736, 64737, 64738, 64739, 64740, 64741, 64742, 64743, 64744, 64745, 64746, 64747, 64748, 64749, 64750, 64751,
+    64752, 64753, 64754, 64755, 64756, 64757, 64758, 64759, 64760, 64761, 64762, 64763, 64764, 64765, 64766, 64767,
+    59328, 59329, 59330, 59331, 59332, 59333, 59334, 59335, 59336, 59337, 59338, 59339, 59340, 59341, 59342, 59343,
+    59344, 59345, 59346, 59347, 59348, 59349, 59350, 59351, 59352, 59353, 59354, 59355, 59356, 59357, 59358, 59359,
+    59360, 59361, 59362, 59363, 59364, 59365, 59366, 59367, 59368, 59369, 59370, 59371, 59372, 59373, 59374, 59375,
+    59376, 59377, 59378, 59379, 59380, 59381, 59382, 59383, 59384, 59385, 59386, 59387, 59388, 59389, 59390, 59391,
+    60864, 60865, 60866, 60867, 60868, 60869, 60870, 60871, 60872, 60873, 60874, 60875, 60876, 60877, 60878, 60879,
+    60880, 60881, 60882, 60883, 60884, 60885, 60886, 60887, 60888, 60889, 60890, 60891, 60892, 60893, 60894, 60895,
+    60896, 60897, 60898, 60899, 60900, 60901, 60902, 60903, 60904, 60905, 60906, 60907, 60908, 60909, 60910, 60911,
+    60912, 60913, 60914, 60915, 60916, 60917, 60918, 60919, 60920, 60921, 60922, 60923, 60924, 60925, 60926, 60927,
+    64960, 64961, 64962, 64963, 64964, 64965, 64966, 64967, 64968, 64969, 64970, 64971, 64972, 64973, 64974, 64975,
+    64976, 64977, 64978, 64979, 64980, 64981, 64982, 64983, 64984, 64985, 64986, 64987, 64988, 64989, 64990, 64991,
+    64992, 64993, 64994, 64995, 64996, 64997, 64998, 64999, 65000, 65001, 65002, 65003, 65004, 65005, 65006, 65007,
+    65008, 65009, 65010, 65011, 65012, 65013, 65014, 65015, 65016, 65017, 65018, 65019, 65020, 65021, 65022, 65023,
+    58240, 58241, 58242, 58243, 58244, 58245, 58246, 58247, 58248, 58249, 58250, 58251, 58252, 58253, 58254, 58255,
+    58256, 58257, 58258, 58259, 58260, 58261, 58262, 58263, 58264, 58265, 58266, 58267, 58268, 58269, 58270, 58271,
+    58272, 58273, 58274, 58275, 58276, 58277, 58278, 58279, 58280, 58281, 58282, 58283, 58284, 58285, 58286, 58287,
+    58288, 58289, 58290, 58291, 58292, 58293, 58294, 58295, 58296, 58297, 58298, 58299, 58300, 58301, 58302, 58303,
+    60544, 60545, 60546, 60547, 60548, 60549, 60550, 60551, 60552, 60553, 60554, 60555, 60556, 60557, 60558, 60559,
+    60560, 60561, 60562, 60563, 60564, 60565, 60566, 60567, 60568, 60569, 60570, 60571, 60572, 60573, 60574, 60575,
+    60576, 60577, 60578, 60579, 60580, 60581, 60582, 60583, 60584, 60585, 60586, 60587, 60588, 60589, 60590, 60591,
+    60592, 60593, 60594, 60595, 60596, 60597, 60598, 60599, 60600, 60601, 60602, 60603, 60604, 60605, 60606, 60607,
+    64640, 64641, 64642, 64643, 64644, 64645, 64646, 64647, 64648, 64649, 64650, 64651, 64652, 64653, 64654, 64655,
+    64656, 64657, 64658, 64659, 64660, 64661, 64662, 64663, 64664, 64665, 64666, 64667, 64668, 64669, 64670, 64671,
+    64672, 64673, 64674, 64675, 64676, 64677, 64678, 64679, 64680, 64681, 64682, 64683, 64684, 64685, 64686, 64687,
+    64688, 64689, 64690, 64691, 64692, 64693, 64694, 64695, 64696, 64697, 64698, 64699, 64700, 64701, 64702, 64703,
+    57472, 57473, 57474, 57475, 57476, 57477, 57478, 57479, 57480, 57481, 57482, 57483, 57484, 57485, 57486, 57487,
+    57488, 57489, 57490, 57491, 57492, 57493, 57494, 57495, 57496, 57497, 57498, 57499, 57500, 57501, 57502, 57503,
+    57504, 57505, 57506, 57507, 57508, 57509, 57510, 57511, 57512, 57513, 57514, 57515, 57516, 57517, 57518, 57519,
+    57520, 57521, 57522, 57523, 57524, 57525, 57526, 57527, 57528, 57529, 57530, 57531, 57532, 57533, 57534, 57535,
+    61568, 61569, 61570, 61571, 61572, 61573, 61574, 61575, 61576, 61577, 61578, 61579, 61580, 61581, 61582, 61583,
+    61584, 61585, 61586, 61587, 61588, 61589, 61590, 61591, 61592, 61593, 61594, 61595, 61596, 61597, 61598, 61599,
+    61600, 61601, 61602, 61603, 61604, 61605, 61606, 61607, 61608, 61609, 61610, 61611, 61612, 61613, 61614, 61615,
+    61616, 61617, 61618, 61619, 61620, 61621, 61622, 61623, 61624, 61625, 61626, 61627, 61628, 61629, 61630, 61631,
+    58560, 58561, 58562, 58563, 58564, 58565, 58566, 58567, 58568, 58569, 58570, 58571, 58572, 58573, 58574, 58575,
+    58576, 58577, 58578, 58579, 58580, 58581, 58582, 58583, 58584, 58585, 58586, 58587, 58588, 58589, 58590, 58591,
+    58592, 58593, 58594, 58595, 58596, 58597, 58598, 58599, 58600, 58601, 58602, 58603, 58604, 58605, 58606, 58607,
+    58608, 58609, 58610, 58611, 58612, 58613, 58614, 58615, 58616, 58617, 58618, 58619, 58620, 58621, 58622, 58623,
+    62656, 62657, 62658, 62659, 62660, 62661, 62662, 62663, 62664, 62665, 62666, 62667, 62668, 62669, 62670, 62671,
+    62672, 62673, 62674, 62675, 62676, 62677, 62678, 62679, 62680, 62681, 62682, 62683, 62684, 62685, 62686, 62687,
+    62688, 62689, 62690, 62691, 62692, 62693, 62694, 62695, 62696, 62697, 62698, 62699, 62700, 62701, 62702, 62703,
+    62704, 62705, 62706, 62707, 62708, 62709, 62710, 62711, 62712, 62713, 62714, 62715, 62716, 62717, 62718, 62719,
+    57792, 57793, 57794, 57795, 57796, 57797, 57798, 57799, 57800, 57801, 57802, 57803, 57804, 57805, 57806, 57807,
+    57808, 57809, 57810, 57811, 57812, 57813, 57814, 57815, 57816, 57817, 57818, 57819, 57820, 57821, 57822, 57823,
+    57824, 57825, 57826, 57827, 57828, 57829, 57830, 57831, 57832, 57833, 57834, 57835, 57836, 57837, 57838, 57839,
+    57840, 57841, 57842, 57843, 57844, 57845, 57846, 57847, 57848, 57849, 57850, 57851, 57852, 57853, 57854, 57855,
+    61888, 61889, 61890, 61891, 61892, 61893, 61894, 61895, 61896, 61897, 61898, 61899, 61900, 61901, 61902, 61903,
+    61904, 61905, 61906, 61907, 61908, 61909, 61910, 61911, 61912, 61913, 61914, 61915, 61916, 61917, 61918, 61919,
+    61920, 61921, 61922, 61923, 61924, 61925, 61926, 61927, 61928, 61929, 61930, 61931, 61932, 61933, 61934, 61935,
+    61936, 61937, 61938, 61939, 61940, 61941, 61942, 61943, 61944, 61945, 61946, 61947, 61948, 61949, 61950, 61951,
+    57344, 57345, 57346, 57347, 57348, 57349, 57350, 57351, 57352, 57353, 57354, 57355, 57356, 57357, 57358, 57359,
+    57360, 57361, 57362, 57363, 57364, 57365, 57366, 57367, 57368, 57369, 57370, 57371, 57372, 57373, 57374, 57375,
+    57376, 57377, 57378, 57379, 57380, 57381, 57382, 57383, 57384, 57385, 57386, 57387, 57388, 57389, 57390, 57391,
+    57392, 57393, 57394, 57395, 57396, 57397, 57398, 57399, 57400, 57401, 57402, 57403, 57404, 57405, 57406, 57407,
+    61440, 61441, 61442, 61443, 61444, 61445, 61446, 61447, 61448, 61449, 61450, 61451, 61452, 61453, 61454, 61455,
+    61456, 61457, 61458, 61459, 61460, 61461, 61462, 61463, 61464, 61465, 61466, 61467, 61468, 61469, 61470, 61471,
+    61472, 61473, 61474, 61475, 61476, 61477, 61478, 61479, 61480, 61481, 61482, 61483, 61484, 61485, 61486, 61487,
+    61488, 61489, 61490, 61491, 61492, 61493, 61494, 61495, 61496, 61497, 61498, 61499, 61500, 61501, 61502, 61503,
+    58688, 58689, 58690, 58691, 58692, 58693, 58694, 58695, 58696, 58697, 58698, 58699, 58700, 58701, 58702, 58703,
+    58704, 58705, 58706, 58707, 58708, 58709, 58710, 58711, 58712, 58713, 58714, 58715, 58716, 58717, 58718, 58719,
+    58720, 58721, 58722, 58723, 58724, 58725, 58726, 58727, 58728, 58729, 58730, 58731, 58732, 58733, 58734, 58735,
+    58736, 58737, 58738, 58739, 58740, 58741, 58742, 58743, 58744, 58745, 58746, 58747, 58748, 58749, 58750, 58751,
+    62784, 62785, 62786, 62787, 62788, 62789, 62790, 62791, 62792, 62793, 62794, 62795, 62796, 62797, 62798, 62799,
+    62800, 62801, 62802, 62803, 62804, 62805, 62806, 62807, 62808, 62809, 62810, 62811, 62812, 62813, 62814, 62815,
+    62816, 62817, 62818, 62819, 62820, 62821, 62822, 62823, 62824, 62825, 62826, 62827, 62828, 62829, 62830, 62831,
+    62832, 62833, 62834, 62835, 62836, 62837, 62838, 62839, 62840, 62841, 62842, 62843, 62844, 62845, 62846, 62847,
+    59328, 59329, 59330, 59331, 59332, 59333, 59334, 59335, 59336, 59337, 59338, 59339, 59340, 59341, 59342, 59343,
+    59344, 59345, 59346, 59347, 59348, 59349, 59350, 59351, 59352, 59353, 59354, 59355, 59356, 59357, 59358, 59359,
+    59360, 59361, 59362, 59363, 59364, 59365, 59366, 59367, 59368, 59369, 59370, 59371, 59372, 59373, 59374, 59375,
+    59376, 59377, 59378, 59379, 59380, 59381, 59382, 59383, 59384, 59385, 59386, 59387, 59388, 59389, 59390, 59391,
+    60864, 60865, 60866, 60867, 60868, 60869, 60870, 60871, 60872, 60873, 60874, 60875, 60876, 60877, 60878, 60879,
+    60880, 60881, 60882, 60883, 60884, 60885, 60886, 60887, 60888, 60889, 60890, 60891, 60892, 60893, 60894, 60895,
+    60896, 60897, 60898, 60899, 60900, 60901, 60902, 60903, 60904, 60905, 60906, 60907, 60908, 60909, 60910, 60911,
+    60912, 60913, 60914, 60915, 60916, 60917, 60918, 60919, 60920, 60921, 60922, 60923, 60924, 60925, 60926, 60927,
+    64960, 64961, 64962, 64963, 64964, 64965, 64966, 64967, 64968, 64969, 64970, 64971, 64972, 64973, 64974, 64975,
+    64976, 64977, 64978, 64979, 64980, 64981, 64982, 64983, 64984, 64985, 64986, 64987, 64988, 64989, 64990, 64991,
+    64992, 64993, 64994, 64995, 64996, 64997, 64998, 64999, 65000, 65001, 65002, 65003, 65004, 65005, 65006, 65007,
+    65008, 65009, 65010, 65011, 65012, 65013, 65014, 65015, 65016, 65017, 65018, 65019, 65020, 65021, 65022, 65023,
+    57472, 57473, 57474, 57475, 57476, 57477, 57478, 57479, 57480, 57481, 57482, 57483, 57484, 57485, 57486, 57487,
+    57488, 57489, 57490, 57491, 57492, 57493, 57494, 57495, 57496, 57497, 57498, 57499, 57500, 57501, 57502, 57503,
+    57504, 57505, 57506, 57507, 57508, 57509, 57510, 57511, 57512, 57513, 57514, 57515, 57516, 57517, 57518, 57519,
+    57520, 57521, 57522, 57523, 57524, 57525, 57526, 57527, 57528, 57529, 57530, 57531, 57532, 57533, 57534, 57535,
+    61568, 61569, 61570, 61571, 61572, 61573, 61574, 61575, 61576, 61577, 61578, 61579, 61580, 61581, 61582, 61583,
+    61584, 61585, 61586, 61587, 61588, 61589, 61590, 61591, 61592, 61593, 61594, 61595, 61596, 61597, 61598, 61599,
+    61600, 61601, 61602, 61603, 61604, 61605, 61606, 61607, 61608, 61609, 61610, 61611, 61612, 61613, 61614, 61615,
+    61616, 61617, 61618, 61619, 61620, 61621, 61622, 61623, 61624, 61625, 61626, 61627, 61628, 61629, 61630, 61631,
+    57344, 57345, 57346, 57347, 57348, 57349, 57350, 57351, 57352, 57353, 57354, 57355, 57356, 57357, 57358, 57359,
+    57360, 57361, 57362, 57363, 57364, 57365, 57366, 57367, 57368, 57369, 57370, 57371, 57372, 57373, 57374, 57375,
+    57376, 57377, 57378, 57379, 57380, 57381, 57382, 57383, 57384, 57385, 57386, 57387, 57388, 57389, 57390, 57391,
+    57392, 57393, 57394, 57395, 57396, 57397, 57398, 57399, 57400, 57401, 57402, 57403, 57404, 57405, 57406, 57407,
+    61440, 61441, 61442, 61443, 61444, 61445, 61446, 61447, 61448, 61449, 61450, 61451, 61452, 61453, 61454, 61455,
+    61456, 61457, 61458, 61459, 61460, 61461, 61462, 61463, 61464, 61465, 61466, 61467, 61468, 61469, 61470, 61471,
+    61472, 61473, 61474, 61475, 61476, 61477, 61478, 61479, 61480, 61481, 61482, 61483, 61484, 61485, 61486, 61487,
+    61488, 61489, 61490, 61491, 61492, 61493, 61494, 61495, 61496, 61497, 61498, 61499, 61500, 61501, 61502, 61503,
+    58688, 58689, 58690, 58691, 58692, 58693, 58694, 58695, 58696, 58697, 58698, 58699, 58700, 58701, 58702, 58703,
+    58704, 58705, 58706, 58707, 58708, 58709, 58710, 58711, 58712, 58713, 58714, 58715, 58716, 58717, 58718, 58719,
+    58720, 58721, 58722, 58723, 58724, 58725, 58726, 58727, 58728, 58729, 58730, 58731, 58732, 58733, 58734, 58735,
+    58736, 58737, 58738, 58739, 58740, 58741, 58742, 58743, 58744, 58745, 58746, 58747, 58748, 58749, 58750, 58751,
+    62784, 62785, 62786, 62787, 62788, 62789, 62790, 62791, 62792, 62793, 62794, 62795, 62796, 62797, 62798, 62799,
+    62800, 62801, 62802, 62803, 62804, 62805, 62806, 62807, 62808, 62809, 62810, 62811, 62812, 62813, 62814, 62815,
+    62816, 62817, 62818, 62819, 62820, 62821, 62822, 62823, 62824, 62825, 62826, 62827, 62828, 62829, 62830, 62831,
+    62832, 62833, 62834, 62835, 62836, 62837, 62838, 62839, 62840, 62841, 62842, 62843, 62844, 62845, 62846, 62847,
+)))
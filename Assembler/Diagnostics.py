@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+
+class Diagnostic:
+    """
+    A Diagnostic is an error in a Hack assembly program, located at a line and column of its source (both counted from
+    1). Its code is one of Diagnostic.CODES, which tools can match on instead of the message.
+    """
+
+    CODES = {
+        "E001": "invalid A instruction",
+        "E002": "invalid label",
+        "E003": "A instruction address out of range",
+        "E004": "invalid Dest code",
+        "E005": "invalid Comp code",
+        "E006": "invalid Jump code",
+    }
+
+    # Code of an invalid field of a C instruction, by field
+    FIELD_CODES = {"dest": "E004", "comp": "E005", "jump": "E006"}
+
+    __slots__ = ("filename", "line", "column", "code", "message")
+
+    def __init__(self, filename, line, column, code, message):
+        self.filename = filename
+        self.line = line
+        self.column = column
+        self.code = code
+        self.message = message
+
+    def __repr__(self):
+        return f"Diagnostic({self.format()!r})"
+
+    def format(self):
+        """
+        :return: the compact one line format of compilers, e.g. "Max.asm:12:3: error[E005]: Invalid Comp code "D+D""
+        """
+        return f"{self.filename}:{self.line}:{self.column}: error[{self.code}]: {self.message}"
+
+    def to_dict(self):
+        return {"file": self.filename, "line": self.line, "column": self.column, "code": self.code,
+                "message": self.message}
+
+    @staticmethod
+    def locate_column(line, offset):
+        """
+        Locates a character of a cleaned line (without whitespace or comments) in its source line.
+        :param line: the source line, e.g. "  AMD = D|M ; JLT"
+        :param offset: the index of the character in the cleaned line, e.g. 4 for the "D" of "AMD=D|M;JLT"
+        :return: the column of the character in the source line, counted from 1
+        """
+        seen = 0
+        for index, char in enumerate(line):
+            if char.isspace():
+                continue
+            if seen == offset:
+                return index + 1
+            seen += 1
+        return len(line.rstrip("\r\n")) + 1
+
+
+class AssemblyError(Exception):
+    """
+    An AssemblyError is raised when a program fails to assemble, with the Diagnostics of every error of the program
+    (not only the first), in source order.
+    """
+
+    FORMATS = ("text", "json")
+
+    def __init__(self, diagnostics):
+        self.diagnostics = sorted(diagnostics, key=lambda diagnostic: (diagnostic.line, diagnostic.column))
+        super().__init__(self.format())
+
+    def __reduce__(self):
+        # Pickled with its Diagnostics (e.g. when raised in a worker process), not with its formatted message
+        return AssemblyError, (self.diagnostics,)
+
+    def format(self, out_format="text"):
+        """
+        :param out_format: "text" for one compact line per Diagnostic, or "json" for a JSON list of Diagnostics
+        :return: a string of the Diagnostics
+        """
+        return AssemblyError.format_all([self], out_format)
+
+    @staticmethod
+    def format_all(errors, out_format="text"):
+        """
+        :param errors: the AssemblyErrors of several programs, e.g. of a batch
+        :param out_format: "text" for one compact line per Diagnostic, or "json" for a single JSON list of the
+        Diagnostics of all the programs
+        :return: a string of the Diagnostics, program after program
+        """
+        if out_format == "json":
+            import json  # Imported on demand, only invalid programs are ever reported
+
+            return json.dumps([diagnostic.to_dict() for error in errors for diagnostic in error.diagnostics])
+        return "\n".join(diagnostic.format() for error in errors for diagnostic in error.diagnostics)
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+
+import argparse
+import os
+import sys
+from array import array
+
+try:
+    from .Assembler import Assembler
+    from .Code import Code
+    from .Diagnostics import AssemblyError
+    from .HackFile import HackFile
+except ImportError:  # Run as a script from inside the Assembler/ directory
+    from Assembler import Assembler
+    from Code import Code
+    from Diagnostics import AssemblyError
+    from HackFile import HackFile
+
+
+class Disassembler:
+    """
+    The Disassembler translates 16-bit Hack machine code words back into Hack assembly. The Code tables of Comp, Dest
+    and Jump codes are inverted once into a single lookup table of every possible word, so that disassembling a word
+    is one list index: words below 0x8000 are A instructions "@address", and words of the form 111a cccc ccdd djjj are
+    C instructions. Labels and variables cannot be recovered, so symbols are disassembled to their numeric addresses.
+    """
+
+    _instructions = None  # Lookup table of word to instruction, or None for words which are not valid instructions
+    _instructions_array = None  # The same lookup table as a NumPy array, for vectorized disassembly
+
+    @staticmethod
+    def instruction_table():
+        """
+        :return: a list of the instruction of each of the 65536 possible words, or None for invalid words
+        """
+        if Disassembler._instructions is None:
+            comps = {}
+            for comp, comp_bits in Code._comp_codes.items():
+                a_code = Code.decode_comp_code_a(comp)
+                comps.setdefault(int(a_code + comp_bits, 2), comp)  # The first (canonical) spelling wins
+
+            instructions = [f"@{address}" for address in range(0x8000)]
+            instructions += [None] * (0xE000 - 0x8000)  # Words starting with 1 but not 111 are not instructions
+            for low_bits in range(0x2000):
+                comp = comps.get(low_bits >> 6)
+                if comp is None:
+                    instructions.append(None)
+                    continue
+                dest = Code._dest_codes[low_bits >> 3 & 0b111]
+                jump = Code._jump_codes[low_bits & 0b111]
+                instruction = comp
+                if dest != "null":
+                    instruction = dest + "=" + instruction
+                if jump != "null":
+                    instruction = instruction + ";" + jump
+                instructions.append(instruction)
+            Disassembler._instructions = instructions
+        return Disassembler._instructions
+
+    @staticmethod
+    def disassemble(words):
+        """
+        :param words: an array (or any sequence) of 16-bit machine code words
+        :return: a list of Hack assembly instructions, one per word
+        """
+        table = Disassembler.instruction_table()
+        numpy = HackFile.numpy(len(words)) if isinstance(words, array) else None
+        if numpy is not None:
+            # Vectorized: a single fancy index of the table by a uint16 view of the words
+            if Disassembler._instructions_array is None:
+                Disassembler._instructions_array = numpy.array(table, dtype=object)
+            instructions = Disassembler._instructions_array[numpy.frombuffer(words, dtype=numpy.uint16)].tolist()
+        else:
+            instructions = list(map(table.__getitem__, words))
+        if None in instructions:
+            address = instructions.index(None)
+            raise ValueError(f"ROM[{address}]: word {words[address]:016b} is not a valid Hack instruction")
+        return instructions
+
+    @staticmethod
+    def disassemble_text(words):
+        """
+        :param words: an array of 16-bit machine code words
+        :return: a string of the Hack assembly program, one instruction per line
+        """
+        instructions = Disassembler.disassemble(words)
+        return "\n".join(instructions) + "\n" if instructions else ""
+
+    @staticmethod
+    def verify(asm_file, hack_file, byteorder="little"):
+        """
+        Verifies an assembled program against its source: assembling the source must produce exactly its words, and
+        so must re-assembling the disassembly of its words (the round trip).
+        :param asm_file: the '.asm' source of the program, which may be compressed
+        :param hack_file: the '.hack' (or '.bin') assembled program, which may be compressed
+        :param byteorder: byte order of the words of a '.bin' binary ROM image, "little" or "big"
+        :return: a list of messages describing each mismatch, empty if the program verifies. A program which cannot be
+        read, disassembled or assembled is a mismatch too, so that it does not stop the verification of the others.
+        """
+        try:
+            words = HackFile.read_words(hack_file, byteorder)
+        except ValueError as error:
+            return [f"{hack_file}: cannot be read: {error}"]
+        if not os.path.exists(asm_file):
+            return [f"{hack_file}: no source {asm_file} to verify against"]
+
+        messages = []
+        programs = []
+        try:
+            programs.append(("assembling the source",
+                             Assembler().assemble_source(Assembler().read_file(asm_file), filename=asm_file)))
+        except (ValueError, AssemblyError) as error:
+            messages.append(f"{hack_file}: the source {asm_file} does not assemble: {error}")
+        try:
+            programs.append(("re-assembling the disassembly",
+                             Assembler().assemble_source(Disassembler.disassemble_text(words))))
+        except (ValueError, AssemblyError) as error:
+            messages.append(f"{hack_file}: cannot be disassembled: {error}")
+
+        for name, other in programs:
+            if other == words:
+                continue
+            mismatch = next((address for address, (a, b) in enumerate(zip(words, other)) if a != b),
+                            min(len(words), len(other)))
+            messages.append(f"{hack_file}: {name} differs first at ROM[{mismatch}] "
+                            f"({len(other)} words instead of {len(words)})")
+        return messages
+
+    @staticmethod
+    def find_programs(golden_dir, in_dir):
+        """
+        Finds the assembled programs of a directory, in any output format, and the source of each of them.
+        :param golden_dir: directory of the assembled programs: '.hack' and '.bin' files, which may be compressed
+        :param in_dir: directory of their sources: '.asm' files of the same name, which may be compressed
+        :return: a sorted list of (assembled program, '.asm' source) tuples
+        """
+        programs = []
+        for filename in sorted(os.listdir(golden_dir)):
+            name, extension = os.path.splitext(HackFile.uncompressed_name(filename))
+            if extension not in (HackFile.TEXT_EXTENSION, HackFile.ROM_EXTENSION):
+                continue
+            sources = [os.path.join(in_dir, name + ".asm" + compression)
+                       for compression in ("",) + HackFile.COMPRESSION_EXTENSIONS]
+            asm_file = next((source for source in sources if os.path.exists(source)), sources[0])
+            programs.append((os.path.join(golden_dir, filename), asm_file))
+        return programs
+
+
+def main(argv=None):
+    here = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description="Disassembles Hack machine code into Hack assembly.")
+    parser.add_argument("hack_files", nargs="*", help="the '.hack' or '.bin' programs to be disassembled")
+    parser.add_argument("-o", "--out-dir", default=None,
+                        help="write each disassembly to a '.asm' file in this directory, instead of stdout")
+    parser.add_argument("--byteorder", choices=["little", "big"], default="little",
+                        help="byte order of the words of a '.bin' binary ROM image (default: little)")
+    parser.add_argument("--verify", action="store_true",
+                        help="verify that every program of --golden-dir round-trips against its source in --in-dir")
+    parser.add_argument("--in-dir", default=os.path.join(here, "in_asm"),
+                        help="directory of the '.asm' sources to verify (default: in_asm/)")
+    parser.add_argument("--golden-dir", default=os.path.join(here, "out_hack"),
+                        help="directory of the '.hack' and '.bin' programs to verify, which may be compressed "
+                             "(default: out_hack/)")
+    args = parser.parse_args(argv)
+
+    if args.verify:
+        failures = []
+        programs = Disassembler.find_programs(args.golden_dir, args.in_dir)
+        for hack_file, asm_file in programs:
+            messages = Disassembler.verify(asm_file, hack_file, args.byteorder)
+            print(f"{'ok' if not messages else 'FAIL':>4}  {hack_file}")
+            failures += messages
+        if not programs:
+            failures.append(f"No '.hack' or '.bin' program to verify in {args.golden_dir}")
+        for failure in failures:
+            print(failure)
+        return 1 if failures else 0
+
+    for hack_file in args.hack_files:
+        text = Disassembler.disassemble_text(HackFile.read_words(hack_file, args.byteorder))
+        if args.out_dir is None:
+            sys.stdout.write(text)
+            continue
+        name = os.path.splitext(HackFile.uncompressed_name(os.path.basename(hack_file)))[0]
+        out_filename = os.path.join(args.out_dir, name + ".asm")
+        with open(out_filename, "w") as outfile:
+            outfile.write(text)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+
+import argparse
+import sys
+import time
+from array import array
+
+try:
+    from .Code import Code
+    from .HackFile import HackFile
+    from .SymbolTable import SymbolTable
+except ImportError:  # Run as a script from inside the Assembler/ directory
+    from Code import Code
+    from HackFile import HackFile
+    from SymbolTable import SymbolTable
+
+
+class _Halt(Exception):
+    """
+    Raised by the handler of a halting address, to leave the run loop without testing for a halt on every cycle.
+    """
+
+
+class Emulator:
+    """
+    The Emulator executes assembled Hack machine code. Every word of the ROM is decoded once, with the Code tables of
+    Comp, Dest and Jump codes, into a handler specialized for that instruction, called as handler(a, d, pc) and
+    returning the next (a, d, pc): the run loop is a single list index and call per cycle, with no bit-twiddling.
+    The RAM is a flat array('H') of 32K words, in which the screen and the keyboard are mapped at the SCREEN and KBD
+    addresses of the SymbolTable.
+    The program halts when it reaches the idiomatic infinite loop "(END) @END 0;JMP", or runs past the end of the ROM.
+    """
+
+    RAM_SIZE = 0x8000
+    SCREEN = SymbolTable.PREDEFINED["SCREEN"]
+    KBD = SymbolTable.PREDEFINED["KBD"]
+
+    # Default cycle limit of Emulator.run, so that a program which never halts (e.g. one waiting for a key) returns
+    MAX_CYCLES = 10_000_000
+
+    # Python expression of every Comp code of the A register, masked to 16 bits, of the D register d and the A register
+    # a. The Comp codes of the M register read ram[a] instead of a.
+    _comp_expressions = {"0": "0", "1": "1", "-1": "0xFFFF", "D": "d", "A": "a", "!D": "d ^ 0xFFFF", "!A": "a ^ 0xFFFF",
+                         "-D": "-d & 0xFFFF", "-A": "-a & 0xFFFF", "D+1": "d + 1 & 0xFFFF", "A+1": "a + 1 & 0xFFFF",
+                         "D-1": "d - 1 & 0xFFFF", "A-1": "a - 1 & 0xFFFF", "D+A": "d + a & 0xFFFF",
+                         "D-A": "d - a & 0xFFFF", "A-D": "a - d & 0xFFFF", "D&A": "d & a", "D|A": "d | a"}
+    _comp_expressions.update({comp.replace("A", "M"): expression.replace("a", "ram[a]")
+                              for comp, expression in list(_comp_expressions.items()) if "A" in comp})
+
+    # Python expression of the next pc of every Jump code, of the ALU output out (a negative output has its top bit set)
+    _jump_expressions = {"null": "pc + 1", "JGT": "a if 0 < out < 0x8000 else pc + 1",
+                         "JEQ": "pc + 1 if out else a", "JGE": "a if out < 0x8000 else pc + 1",
+                         "JLT": "a if out >= 0x8000 else pc + 1", "JNE": "a if out else pc + 1",
+                         "JLE": "pc + 1 if 0 < out < 0x8000 else a", "JMP": "a"}
+
+    # Compiled factory of the handler of each C instruction word decoded so far, called as factory(ram)
+    _c_handler_factories = {}
+
+    def __init__(self, words):
+        """
+        :param words: an array (or any sequence) of the 16-bit machine code words of the program
+        :raises ValueError: if a word is not a valid Hack instruction
+        """
+        self.rom = array("H", words)
+        self.ram = array("H", bytes(2 * Emulator.RAM_SIZE))
+        self.a = self.d = self.pc = 0
+        self.cycles = 0
+        self.halted = False
+        self._handlers = self.decode(self.rom, self.ram)
+
+    @staticmethod
+    def from_file(filename, byteorder="little"):
+        """
+        :param filename: the '.hack' or '.bin' assembled program
+        :param byteorder: byte order of the words of a '.bin' binary ROM image, "little" or "big"
+        :return: an Emulator of the program
+        """
+        return Emulator(HackFile.read_words(filename, byteorder))
+
+    @staticmethod
+    def decode(rom, ram):
+        """
+        Decodes every word of a ROM once into its handler. Handlers are shared by all the words of the same value, so a
+        program only creates a few hundred of them, however long it is.
+        :param rom: an array('H') of the machine code words of the program
+        :param ram: the array('H') the handlers read and write
+        :return: a list of the handler of each ROM address, padded with halting handlers up to the largest address
+        """
+        def halt(a, d, pc):
+            raise _Halt
+
+        handlers = {}
+        jump_word = Code.encode_c_fields(None, "0", "JMP")
+        decoded = []
+        for address, word in enumerate(rom):
+            if word == address and address + 1 < len(rom) and rom[address + 1] & 0xE03F == jump_word & 0xE03F:
+                decoded.append(halt)  # "(END) @END 0;JMP": loads its own address, then jumps to it without a Dest
+                continue
+            handler = handlers.get(word)
+            if handler is None:
+                if word < 0x8000:
+                    handler = Emulator.a_handler(word)
+                else:
+                    factory = Emulator._c_handler_factories.get(word)
+                    if factory is None:
+                        factory = Emulator.c_handler_factory(word, address)
+                        Emulator._c_handler_factories[word] = factory
+                    handler = factory(ram)
+                handlers[word] = handler
+            decoded.append(handler)
+        decoded += [halt] * max(1, 0x10000 - len(decoded))  # Past the end of the program, the ROM is empty
+        return decoded
+
+    @staticmethod
+    def a_handler(address):
+        """
+        :param address: the address loaded by an A instruction
+        :return: the handler of the A instruction
+        """
+        def handler(a, d, pc):
+            return address, d, pc + 1
+        return handler
+
+    @staticmethod
+    def c_handler_factory(word, address=None):
+        """
+        Compiles the handler of a C instruction from the Python expressions of its Comp, Dest and Jump codes, e.g.
+        "AM=M-1" into "out = ram[a] - 1 & 0xFFFF; ram[a] = out; return out, d, pc + 1". The M register is written
+        first, at the address of the A register before the instruction, which is also the target of its jump.
+        :param word: the 16-bit machine code word of the C instruction
+        :param address: the ROM address of the word, for the error message
+        :return: a function of the RAM array, which returns the handler of the instruction
+        :raises ValueError: if the word is not a valid C instruction
+        """
+        dest, comp, jump = Emulator.decode_c_instruction(word)
+        if comp is None:
+            location = f"ROM[{address}]: " if address is not None else ""
+            raise ValueError(f"{location}word {word:016b} is not a valid Hack instruction")
+        lines = [f"out = {Emulator._comp_expressions[comp]}"]
+        if "M" in dest:
+            lines.append("ram[a] = out")
+        lines.append(f"return {'out' if 'A' in dest else 'a'}, {'out' if 'D' in dest else 'd'}, "
+                     f"{Emulator._jump_expressions[jump]}")
+        source = "def factory(ram):\n    def handler(a, d, pc):\n"
+        source += "".join(f"        {line}\n" for line in lines)
+        source += "    return handler\n"
+        namespace = {}
+        exec(compile(source, f"<{dest}={comp};{jump}>", "exec"), namespace)
+        return namespace["factory"]
+
+    @staticmethod
+    def decode_c_instruction(word):
+        """
+        :param word: a 16-bit machine code word of the form 111a cccc ccdd djjj
+        :return: a tuple of its (dest, comp, jump) codes, e.g. ("AM", "M-1", "null"), where comp is None if the word
+        is not a valid C instruction
+        """
+        if word >> 13 != 0b111:
+            return None, None, None
+        comp_bits = f"{word >> 6 & 0b111111:06b}"
+        comp = None
+        for code, bits in Code._comp_codes.items():
+            if bits == comp_bits and Code.decode_comp_code_a(code) == str(word >> 12 & 1):
+                comp = code
+                break
+        return Code._dest_codes[word >> 3 & 0b111], comp, Code._jump_codes[word & 0b111]
+
+    def run(self, max_cycles=MAX_CYCLES):
+        """
+        Runs the program until it halts, or for at most max_cycles cycles. A later call resumes where it stopped.
+        :param max_cycles: the cycle limit
+        :return: the number of cycles executed
+        :raises ValueError: if an instruction accesses the M register at an address outside of the RAM
+        """
+        handlers = self._handlers
+        a, d, pc = self.a, self.d, self.pc
+        cycles = 0
+        try:
+            for cycles in range(max_cycles):
+                a, d, pc = handlers[pc](a, d, pc)
+            else:
+                cycles = max_cycles
+        except _Halt:
+            self.halted = True
+        except IndexError:
+            raise ValueError(f"ROM[{pc}]: RAM address {a} is out of range") from None
+        finally:
+            self.a, self.d, self.pc = a, d, pc
+            self.cycles += cycles
+        return cycles
+
+    def reset(self):
+        """
+        Resets the registers and clears the RAM, as the reset button of the Hack computer (which only resets the pc).
+        """
+        self.ram[:] = array("H", bytes(2 * Emulator.RAM_SIZE))
+        self.a = self.d = self.pc = 0
+        self.cycles = 0
+        self.halted = False
+
+    def snapshot(self, start=0, stop=None):
+        """
+        :param start: the first RAM address of the snapshot
+        :param stop: the RAM address after the last one of the snapshot, or None for the end of the RAM
+        :return: a copy of the RAM between the addresses, as an array('H')
+        """
+        return self.ram[start:stop]
+
+    def restore(self, snapshot, start=0):
+        """
+        :param snapshot: an array('H') taken by Emulator.snapshot
+        :param start: the first RAM address of the snapshot
+        """
+        self.ram[start:start + len(snapshot)] = snapshot
+
+    def screen(self):
+        """
+        :return: a memoryview of the 8K words of the screen memory map, one bit per pixel, 32 words per row of 512
+        """
+        return memoryview(self.ram)[Emulator.SCREEN:Emulator.KBD]
+
+    def press_key(self, key=0):
+        """
+        :param key: the Hack character code of the key held down, or 0 for no key
+        """
+        self.ram[Emulator.KBD] = key
+
+    @staticmethod
+    def benchmark(words, cycles=MAX_CYCLES, repeat=3):
+        """
+        :param words: the 16-bit machine code words of the program
+        :param cycles: the cycle limit of each run
+        :param repeat: number of timed runs, keeping the fastest
+        :return: a dictionary of the decoding time, and the cycles and cycles per second of the fastest run
+        """
+        best = {}
+        for _ in range(repeat):
+            start = time.perf_counter()
+            emulator = Emulator(words)
+            decode_seconds = time.perf_counter() - start
+            start = time.perf_counter()
+            executed = emulator.run(cycles)
+            seconds = time.perf_counter() - start
+            if seconds < best.get("seconds", float("inf")):
+                best = {"decode_seconds": decode_seconds, "cycles": executed, "seconds": seconds,
+                        "cycles_per_second": executed / seconds if seconds else 0.0}
+        return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Runs assembled Hack machine code.")
+    parser.add_argument("hack_file", help="the '.hack' or '.bin' program to be run")
+    parser.add_argument("--cycles", type=int, default=Emulator.MAX_CYCLES,
+                        help=f"cycle limit of the run (default: {Emulator.MAX_CYCLES})")
+    parser.add_argument("--byteorder", choices=["little", "big"], default="little",
+                        help="byte order of the words of a '.bin' binary ROM image (default: little)")
+    parser.add_argument("--ram", type=int, nargs=2, action="append", default=[], metavar=("ADDRESS", "VALUE"),
+                        help="set a RAM word before the run, e.g. '--ram 0 3' for R0 = 3 (repeatable)")
+    parser.add_argument("--dump", type=int, nargs=2, metavar=("START", "STOP"),
+                        help="print the RAM words from START up to STOP after the run")
+    args = parser.parse_args(argv)
+
+    emulator = Emulator.from_file(args.hack_file, args.byteorder)
+    for address, value in args.ram:
+        emulator.ram[address] = value & 0xFFFF
+    start = time.perf_counter()
+    cycles = emulator.run(args.cycles)
+    seconds = time.perf_counter() - start
+    print(f"{'Halted' if emulator.halted else 'Stopped'} after {cycles} cycles in {seconds:.3f}s "
+          f"({cycles / seconds if seconds else 0.0:.0f} cycles/s).")
+    if args.dump:
+        for address, value in enumerate(emulator.snapshot(*args.dump), args.dump[0]):
+            print(f"RAM[{address}] = {value - 0x10000 if value & 0x8000 else value}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
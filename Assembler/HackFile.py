@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+
+import io
+import os
+import sys
+from array import array
+from itertools import islice
+
+
+class HackFile:
+    """
+    HackFile is a class that provides helper functions to render, write and read assembled programs. Internally, a
+    program is an array('H') of 16-bit machine code words; the textual '.hack' format (one 16-character binary number
+    per line) and the raw binary ROM image '.bin' format are only produced and parsed here, at the I/O boundary.
+    """
+
+    # Supported output formats, by file extension
+    TEXT_EXTENSION = ".hack"
+    ROM_EXTENSION = ".bin"
+
+    # Supported compressions of sources and outputs, by the extension appended to their own, e.g. "Pong.hack.gz". The
+    # gzip level is zlib's default: higher levels barely shrink '.hack' text further, for much slower writes.
+    COMPRESSION_EXTENSIONS = (".gz", ".xz")
+    GZIP_LEVEL = 6
+
+    @staticmethod
+    def compression(filename):
+        """
+        :param filename: a file name, e.g. "Pong.asm.gz"
+        :return: the compression extension of the file name, e.g. ".gz", or None if it is not compressed
+        """
+        extension = os.path.splitext(filename)[1]
+        return extension if extension in HackFile.COMPRESSION_EXTENSIONS else None
+
+    @staticmethod
+    def uncompressed_name(filename):
+        """
+        :param filename: a file name, e.g. "Pong.hack.xz"
+        :return: the file name without its compression extension, e.g. "Pong.hack"
+        """
+        compression = HackFile.compression(filename)
+        return filename[:-len(compression)] if compression is not None else filename
+
+    @staticmethod
+    def open_file(filename, mode="rb"):
+        """
+        Opens a file, transparently compressed or decompressed as a stream when its name ends with one of
+        HackFile.COMPRESSION_EXTENSIONS: nothing is decompressed to a temporary file, nor held in memory as a whole.
+        :param filename: the file to open
+        :param mode: the mode of the file, e.g. "rb", "rt" or "wb"
+        :return: a file object
+        """
+        compression = HackFile.compression(filename)
+        if compression is None:
+            return open(filename, mode)
+        if compression == ".gz":
+            import gzip  # The compression modules are imported on demand, they are only needed for compressed files
+
+            # A zero mtime in the header, so that the same words always compress to the same bytes
+            file = gzip.GzipFile(filename, mode.replace("t", ""), compresslevel=HackFile.GZIP_LEVEL, mtime=0)
+        else:
+            import lzma
+
+            file = lzma.LZMAFile(filename, mode.replace("t", ""))
+        return io.TextIOWrapper(file) if "t" in mode else file
+
+    # NumPy is optional: it only vectorizes the bulk conversions. Importing it takes about 100ms, more than converting
+    # a few hundred thousand words without it, so it is only imported for conversions that large (or if it is already
+    # imported), and never slows down the start-up of the assembly of small programs.
+    VECTORIZE_MIN_WORDS = 256
+    IMPORT_NUMPY_MIN_WORDS = 1 << 18
+    _numpy = False  # The numpy module once imported, or None if it is not installed
+
+    @staticmethod
+    def numpy(num_words=None):
+        """
+        :param num_words: the number of words of a bulk conversion, or None to import NumPy regardless
+        :return: the numpy module if it should vectorize a conversion of num_words words, else None
+        """
+        if num_words is not None:
+            if num_words <= HackFile.VECTORIZE_MIN_WORDS:
+                return None
+            if (HackFile._numpy is False and num_words < HackFile.IMPORT_NUMPY_MIN_WORDS
+                    and "numpy" not in sys.modules):
+                return None
+        if HackFile._numpy is False:
+            try:
+                import numpy
+            except ImportError:
+                numpy = None
+            HackFile._numpy = numpy
+        return HackFile._numpy
+
+    # Lookup table of the 8 binary digits of each byte, for rendering a word as two lookups of its high and low bytes
+    _byte_digits = [format(byte, "08b").encode("ascii") for byte in range(256)]
+    _byte_digits_newline = [digits + b"\n" for digits in _byte_digits]
+
+    @staticmethod
+    def render(words) -> bytes:
+        """
+        Renders machine code words into the textual '.hack' format in one bulk operation. With NumPy, the bits of all
+        the words are unpacked at once into a (N, 16) matrix, to which ord('0') is added and a column of newlines is
+        appended. Without NumPy, each word is rendered from the binary digits of its high and low bytes.
+        :param words: an array (or any iterable) of 16-bit machine code words
+        :return: ASCII bytes of 16-bit binary numbers, one per line
+        """
+        numpy = HackFile.numpy(len(words)) if isinstance(words, array) else None
+        if numpy is not None:
+            big_endian = numpy.frombuffer(words, dtype=numpy.uint16).astype(">u2")
+            lines = numpy.empty((len(words), 17), dtype=numpy.uint8)
+            lines[:, :16] = numpy.unpackbits(big_endian.view(numpy.uint8).reshape(-1, 2), axis=1)
+            lines[:, :16] += ord("0")
+            lines[:, 16] = ord("\n")
+            return lines.tobytes()
+        high, low = HackFile._byte_digits, HackFile._byte_digits_newline
+        return b"".join([high[word >> 8] + low[word & 0xFF] for word in words])
+
+    @staticmethod
+    def render_text(words) -> str:
+        """
+        :param words: an array (or any iterable) of 16-bit machine code words
+        :return: a string of 16-bit binary numbers, one per line
+        """
+        return HackFile.render(words).decode("ascii")
+
+    # Number of words rendered and written at a time when writing a stream of words
+    STREAM_BUFFER_WORDS = 8192
+
+    @staticmethod
+    def write(words, sink, out_format="hack", byteorder="little"):
+        """
+        Writes machine code words to any file-like sink, e.g. an open file, a socket file or an io.BytesIO.
+        :param words: an array('H') of 16-bit machine code words, or any other iterable of words (e.g. a generator),
+        which is then written as it is consumed, in bounded buffers of HackFile.STREAM_BUFFER_WORDS words
+        :param sink: a file-like object with a write method. The textual format is written as a string to text sinks
+        (io.TextIOBase), and as ASCII bytes to any other sink.
+        :param out_format: "hack" for the textual '.hack' format, or "bin" for a raw binary ROM image
+        :param byteorder: byte order of the words of a raw binary ROM image, "little" or "big"
+        """
+        if not isinstance(words, array):
+            words = iter(words)
+            while True:
+                buffer = array("H", islice(words, HackFile.STREAM_BUFFER_WORDS))
+                if not buffer:
+                    return
+                HackFile.write(buffer, sink, out_format, byteorder)
+
+        if out_format == "hack":
+            text = HackFile.render(words)
+            sink.write(text.decode("ascii") if isinstance(sink, io.TextIOBase) else text)
+        elif out_format == "bin":
+            if byteorder not in ("little", "big"):
+                raise ValueError(f"Byte order {byteorder} must be 'little' or 'big'")
+            if byteorder != sys.byteorder:
+                words = array("H", words)
+                words.byteswap()
+            sink.write(memoryview(words))
+        else:
+            raise ValueError(f"Output format {out_format} must be 'hack' or 'bin'")
+
+    @staticmethod
+    def write_text(words, out_filename):
+        """
+        Writes machine code words to a textual '.hack' file, or a compressed '.hack.gz' or '.hack.xz' file.
+        :param words: an array (or any iterable) of 16-bit machine code words
+        :param out_filename: the '.hack' file to write to
+        """
+        with HackFile.open_file(out_filename, "wb") as outfile:
+            HackFile.write(words, outfile)
+
+    @staticmethod
+    def write_rom(words, out_filename, byteorder="little"):
+        """
+        Writes machine code words to a raw binary ROM image, two bytes per word. When the requested byte order is the
+        native one, the buffer of the array is written straight to the file without copying.
+        :param words: an array('H') (or any iterable) of 16-bit machine code words
+        :param out_filename: the '.bin' file to write to, or a compressed '.bin.gz' or '.bin.xz' file
+        :param byteorder: byte order of the words, "little" or "big"
+        """
+        with HackFile.open_file(out_filename, "wb") as outfile:
+            HackFile.write(words, outfile, "bin", byteorder)
+
+    @staticmethod
+    def read_words(filename, byteorder="little"):
+        """
+        Reads the machine code words of an assembled program, either a textual '.hack' file or a '.bin' binary ROM
+        image (by extension), either of which may be compressed (e.g. '.hack.gz').
+        :param filename: the '.hack' or '.bin' file to read
+        :param byteorder: byte order of the words of a '.bin' binary ROM image, "little" or "big"
+        :return: an array('H') of 16-bit machine code words
+        """
+        with HackFile.open_file(filename, "rb") as file:
+            data = file.read()
+        if HackFile.uncompressed_name(filename).endswith(HackFile.ROM_EXTENSION):
+            return HackFile.parse_rom(data, byteorder)
+        return HackFile.parse_text(data)
+
+    @staticmethod
+    def parse_rom(data, byteorder="little"):
+        """
+        :param data: bytes of a raw binary ROM image, two bytes per word
+        :param byteorder: byte order of the words, "little" or "big"
+        :return: an array('H') of 16-bit machine code words
+        """
+        words = array("H")
+        words.frombytes(data)
+        if byteorder != sys.byteorder:
+            words.byteswap()
+        return words
+
+    @staticmethod
+    def parse_text(data):
+        """
+        Parses the textual '.hack' format. With NumPy, well-formed text (16 binary digits and a newline per word) is
+        parsed in one vectorized operation, as a (N, 17) matrix of bytes.
+        :param data: bytes (or a string) of 16-bit binary numbers, one per line
+        :return: an array('H') of 16-bit machine code words
+        """
+        if isinstance(data, str):
+            data = data.encode("ascii")
+        numpy = HackFile.numpy(len(data) // 17)
+        if numpy is not None and len(data) % 17 == 0:
+            lines = numpy.frombuffer(data, dtype=numpy.uint8).reshape(-1, 17)
+            bits = lines[:, :16] - ord("0")
+            if (lines[:, 16] == ord("\n")).all() and (bits <= 1).all():
+                words = bits.astype(numpy.uint16) @ (numpy.uint16(1) << numpy.arange(15, -1, -1, dtype=numpy.uint16))
+                return array("H", words.astype(numpy.uint16).tobytes())
+        return array("H", [int(line, 2) for line in data.split()])
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import os
+import sys
+from array import array
+
+try:
+    from .SymbolTable import SymbolTable
+    from .Parser import Parser
+    from .Code import Code
+    from .HackFile import HackFile
+    from .SourceMap import SourceMap
+except ImportError:  # Run as a script from inside the Assembler/ directory
+    from SymbolTable import SymbolTable
+    from Parser import Parser
+    from Code import Code
+    from HackFile import HackFile
+    from SourceMap import SourceMap
+
+
+class ObjectModule:
+    """
+    An ObjectModule is a relocatable, separately assembled module of a program (e.g. the Sys.vm or Math.vm part of
+    Pong.asm). It holds:
+    - words: the encoded 16-bit words of the module, in which every A instruction symbol is left as a 0 placeholder
+    - labels: the exported labels of the module, as label:address pairs relative to the start of the module
+    - fixups: (address, symbol) pairs of the A instructions whose symbol is resolved by the Linker, in address order
+    - variables: the symbols the module references but does not define, in first-seen order, which the Linker
+    allocates as variables unless another module defines them as labels
+    - lines: the source line of each word, for the SourceMap of the linked program
+    Predefined symbols (e.g. SP, R13, SCREEN) are resolved when the module is assembled.
+    """
+
+    EXTENSION = ".hobj"
+    FORMAT_VERSION = 1
+
+    def __init__(self, name, words, labels, fixups, variables, lines=None):
+        self.name = name
+        self.words = words
+        self.labels = labels
+        self.fixups = fixups
+        self.variables = variables
+        self.lines = lines if lines is not None else array("I", bytes(4 * len(words)))  # 0 for unknown lines
+
+    @staticmethod
+    def from_source(lines, name=""):
+        """
+        Assembles a module into a relocatable ObjectModule.
+        :param lines: an iterable of lines of Hack assembly source code
+        :param name: name of the module
+        :return: an ObjectModule
+        """
+        words = array("H")
+        labels = {}
+        fixups = []
+        references = {}  # Symbols referenced by the module, in first-seen order
+        predefined = SymbolTable.PREDEFINED
+        line_numbers = array("I")
+        for instruction in Parser.iter_instructions(lines, line_numbers=line_numbers):
+            kind = instruction[0]
+            if kind == Parser.LABEL:
+                labels.setdefault(instruction[1], len(words))
+                line_numbers.pop()  # Only the lines of words are kept
+            elif kind == Parser.A_ADDRESS:
+                words.append(instruction[1])
+            elif kind == Parser.A_SYMBOL:
+                symbol = instruction[1]
+                if symbol in predefined:
+                    words.append(predefined[symbol])
+                else:
+                    fixups.append((len(words), symbol))
+                    references.setdefault(symbol)
+                    words.append(0)
+            else:
+                words.append(Code.encode_c_instruction(instruction[1]))
+        variables = [symbol for symbol in references if symbol not in labels]
+        return ObjectModule(name, words, labels, fixups, variables, line_numbers)
+
+    def to_dict(self):
+        return {"format": "hack-object", "version": ObjectModule.FORMAT_VERSION, "name": self.name,
+                "words": self.words.tolist(), "labels": self.labels, "fixups": self.fixups,
+                "variables": self.variables, "lines": self.lines.tolist()}
+
+    @staticmethod
+    def from_dict(data):
+        if data.get("format") != "hack-object" or data.get("version") != ObjectModule.FORMAT_VERSION:
+            raise ValueError(f"Not a version {ObjectModule.FORMAT_VERSION} Hack object module")
+        return ObjectModule(data["name"], array("H", data["words"]), data["labels"],
+                            [tuple(fixup) for fixup in data["fixups"]], data["variables"],
+                            array("I", data["lines"]) if "lines" in data else None)
+
+    def write(self, out_filename):
+        """
+        :param out_filename: the '.hobj' file to write the ObjectModule to
+        """
+        with open(out_filename, "w") as outfile:
+            json.dump(self.to_dict(), outfile, separators=(",", ":"))
+
+    @staticmethod
+    def read(filename):
+        """
+        :param filename: the '.hobj' file to read
+        :return: an ObjectModule
+        """
+        with open(filename) as file:
+            return ObjectModule.from_dict(json.load(file))
+
+
+class Linker:
+    """
+    The Linker merges ObjectModules into a single program, producing the same words as assembling the concatenation of
+    their sources: the modules are laid out one after the other, their labels are relocated into one SymbolTable
+    (where, like the Assembler, the first definition of a label wins), variables are allocated from address 16 upwards
+    in first-seen order, and every fixup is patched with its resolved address.
+    """
+
+    @staticmethod
+    def link(modules):
+        """
+        :param modules: a list of ObjectModules, in program order
+        :return: a tuple of (array('H') of the 16-bit words of the program, the SymbolTable of the program)
+        """
+        symbol_table = SymbolTable()
+        base = 0
+        for module in modules:
+            for label, address in module.labels.items():
+                symbol_table.add_symbol(label, base + address)
+            base += len(module.words)
+
+        symbol_address = 16
+        for module in modules:
+            for symbol in module.variables:
+                if symbol_table.add_symbol(symbol, symbol_address):
+                    symbol_address += 1
+
+        words = array("H")
+        for module in modules:
+            module_words = array("H", module.words)
+            for address, symbol in module.fixups:
+                module_words[address] = symbol_table.get_address(symbol)
+            words.extend(module_words)
+        return words, symbol_table
+
+    @staticmethod
+    def source_map(modules, symbol_table):
+        """
+        :param modules: the list of ObjectModules of a program, in program order
+        :param symbol_table: the SymbolTable of the linked program, as returned by Linker.link
+        :return: the SourceMap of the linked program, with one file per module
+        """
+        file_starts = []
+        lines = array("I")
+        for module in modules:
+            file_starts.append(len(lines))
+            lines.extend(module.lines)
+        labels = {label: symbol_table[label] for module in modules for label in module.labels}
+        variables = {symbol: symbol_table[symbol] for module in modules for symbol in module.variables
+                     if symbol not in labels}
+        return SourceMap([module.name for module in modules], file_starts, lines, labels, variables)
+
+    @staticmethod
+    def object_filename(asm_file, out_dir):
+        """
+        :param asm_file: the '.asm' file of a module
+        :param out_dir: out directory of the '.hobj' files
+        :return: string of the '.hobj' filename of the module
+        """
+        name = os.path.splitext(os.path.basename(asm_file))[0]
+        return os.path.join(out_dir, name + ObjectModule.EXTENSION)
+
+    @staticmethod
+    def build(asm_files, out_dir):
+        """
+        Assembles the modules whose source changed since their '.hobj' was written (like make, by modification time),
+        and reads the '.hobj' of the others.
+        :param asm_files: a list of the '.asm' files of the modules, in program order
+        :param out_dir: out directory of the '.hobj' files
+        :return: a tuple of (list of ObjectModules, list of the '.asm' files which were assembled)
+        """
+        modules = []
+        assembled = []
+        for asm_file in asm_files:
+            object_filename = Linker.object_filename(asm_file, out_dir)
+            if os.path.exists(object_filename) and os.path.getmtime(object_filename) >= os.path.getmtime(asm_file):
+                modules.append(ObjectModule.read(object_filename))
+                continue
+            with open(asm_file) as file:
+                module = ObjectModule.from_source(file, os.path.basename(asm_file))
+            module.write(object_filename)
+            modules.append(module)
+            assembled.append(asm_file)
+        return modules, assembled
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Separately assembles and links Hack assembly modules.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    compile_parser = subparsers.add_parser("compile", help="assemble '.asm' modules into '.hobj' object modules")
+    compile_parser.add_argument("asm_files", nargs="+")
+    compile_parser.add_argument("--out-dir", default=".", help="out directory of the '.hobj' files (default: .)")
+
+    link_parser = subparsers.add_parser("link", help="link '.hobj' object modules into a program")
+    link_parser.add_argument("object_files", nargs="+")
+    link_parser.add_argument("-o", "--output", required=True, help="the '.hack' or '.bin' program to write")
+
+    build_parser = subparsers.add_parser("build", help="compile the changed '.asm' modules, then link all of them")
+    build_parser.add_argument("asm_files", nargs="+")
+    build_parser.add_argument("--out-dir", default=".", help="out directory of the '.hobj' files (default: .)")
+    build_parser.add_argument("-o", "--output", required=True, help="the '.hack' or '.bin' program to write")
+
+    for subparser in (link_parser, build_parser):
+        subparser.add_argument("--byteorder", choices=["little", "big"], default="little",
+                               help="byte order of the words of a '.bin' binary ROM image (default: little)")
+        subparser.add_argument("--source-map", action="store_true",
+                               help="also write a '.map' source map of the program next to it")
+    args = parser.parse_args(argv)
+
+    if args.command == "compile":
+        for asm_file in args.asm_files:
+            with open(asm_file) as file:
+                module = ObjectModule.from_source(file, os.path.basename(asm_file))
+            module.write(Linker.object_filename(asm_file, args.out_dir))
+        return 0
+
+    if args.command == "link":
+        modules = [ObjectModule.read(object_file) for object_file in args.object_files]
+    else:
+        modules, assembled = Linker.build(args.asm_files, args.out_dir)
+        print(f"Assembled {len(assembled)} of {len(modules)} modules.")
+
+    words, symbol_table = Linker.link(modules)
+    out_format = "bin" if HackFile.uncompressed_name(args.output).endswith(HackFile.ROM_EXTENSION) else "hack"
+    with HackFile.open_file(args.output, "wb") as outfile:
+        HackFile.write(words, outfile, out_format, args.byteorder)
+    if args.source_map:
+        Linker.source_map(modules, symbol_table).write(SourceMap.map_filename(args.output))
+    print("Linking completed.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+
+try:
+    from .Parser import Parser
+    from .Code import Code
+    from .SymbolTable import SymbolTable
+except ImportError:  # Run as a script from inside the Assembler/ directory
+    from Parser import Parser
+    from Code import Code
+    from SymbolTable import SymbolTable
+
+
+class Optimizer:
+    """
+    The Optimizer is a peephole pass over the tokenized program, run between the first pass and the encoding of the
+    instructions, which removes instructions that cannot change what the program computes:
+    - a redundant A instruction, which loads the A register with the value it already holds (e.g. the second @SP of
+      "@SP, M=M+1, @SP"), as the A register is only known until a label or a C instruction writing A
+    - a dead A instruction, immediately followed by another A instruction, which overwrites it before it is used
+    - sequences which push onto a stack then pop straight back off it, as VM translators emit for a push immediately
+      followed by a pop: "@R, M=M+1, @R, AM=M-1" collapses to "@R, A=M", and "@R, AM=M+1, A=A-1, M=D, @R, AM=M-1, D=M"
+      to "@R, A=M, M=D"
+    - a jump (without a dest) to the instruction right after it, which is executed next whether the jump is taken or
+      not, and the A instruction loading its target, when the target does not read A or M before overwriting A
+    Removing instructions moves the labels after them, so the SymbolTable must be rebuilt from the optimized program.
+    The literal targets of jumps (e.g. "@95, 0;JMP") are first replaced with labels. This assumes that addresses loaded
+    as data (e.g. "@95, D=A") are not jumped to later: the return addresses of a program must be labels.
+    """
+
+    # Sequences following an A instruction @R which are collapsed, as (the machine code words of the sequence, where
+    # None stands for @R again, the instruction records of the replacement). The second @R of "@R, M=M+1, @R, AM=M-1"
+    # is already removed as redundant when the sequence is matched.
+    _sequences = [
+        ((Code.encode_c_instruction("M=M+1"), Code.encode_c_instruction("AM=M-1")),
+         [(Parser.C, "A=M", "A", "M", None)]),
+        # A push of D immediately popped back into D, e.g. "push local 0" then "pop temp 0". Valid while RAM[R] does
+        # not point at R itself, as a stack pointer never does.
+        ((Code.encode_c_instruction("AM=M+1"), Code.encode_c_instruction("A=A-1"), Code.encode_c_instruction("M=D"),
+          None, Code.encode_c_instruction("AM=M-1"), Code.encode_c_instruction("D=M")),
+         [(Parser.C, "A=M", "A", "M", None), (Parser.C, "M=D", "M", "D", None)]),
+    ]
+
+    @staticmethod
+    def optimize(instructions):
+        """
+        :param instructions: the tokenized program (a list of instruction records from Parser)
+        :return: a tuple of (the optimized list of instruction records, the number of instructions removed)
+        """
+        labelled = Optimizer.label_jump_targets(instructions)
+        if labelled is None:
+            return instructions, 0
+
+        optimized = []
+        a_value = None  # What the A register is known to hold, as given by a_value_of, or None if it is unknown
+        jump_target = None  # Index in optimized of the A instruction of a removed jump to the next instruction
+        removed = 0
+        for instruction in labelled:
+            kind = instruction[0]
+
+            if kind == Parser.LABEL:
+                if Optimizer.is_jump_to(optimized, instruction[1]):
+                    optimized.pop()  # The jump to the next instruction, its A instruction may be dead too
+                    jump_target = len(optimized) - 1
+                    removed += 1
+                a_value = None  # Jumps to the label may arrive with any value in A
+                optimized.append(instruction)
+                continue
+
+            if kind == Parser.C:
+                jump_target = None  # The target reads A or M
+                if instruction[2] is not None and "A" in instruction[2]:
+                    a_value = None
+                optimized.append(instruction)
+                removed += Optimizer.collapse(optimized)
+                continue
+
+            value = Optimizer.a_value_of(instruction)
+            if value == a_value:
+                removed += 1
+                continue
+            if jump_target is not None:
+                del optimized[jump_target]  # The A instruction of the removed jump, overwritten before it is used
+                jump_target = None
+                removed += 1
+            if optimized and optimized[-1][0] in (Parser.A_ADDRESS, Parser.A_SYMBOL):
+                optimized.pop()
+                removed += 1
+            optimized.append(instruction)
+            a_value = value
+        return optimized, removed
+
+    @staticmethod
+    def a_value_of(instruction):
+        """
+        :param instruction: an A instruction record
+        :return: what the A instruction loads A with: an address, or the name of a label or variable, whose address
+        may yet move
+        """
+        if instruction[0] == Parser.A_SYMBOL:
+            return SymbolTable.PREDEFINED.get(instruction[1], instruction[1])
+        return instruction[1]
+
+    @staticmethod
+    def label_jump_targets(instructions):
+        """
+        Replaces the literal targets of the jumps of the program (e.g. "@95, 0;JMP", as emitted by VM translators for
+        shared subroutines) with labels, so that the jumps still reach their targets once instructions are removed.
+        A literal target is only replaced when its A instruction is used by nothing but the jump which immediately
+        follows it, which must neither read nor write A or M. A program without labels which also jumps to computed
+        addresses (e.g. "@R13, A=M, 0;JMP") is left unchanged, as its return addresses are literal addresses too.
+        :param instructions: the tokenized program
+        :return: the instruction records of the program with labelled jump targets, or None if a literal jump target
+        cannot be replaced (the program is then left unchanged)
+        """
+        num_instructions = sum(instruction[0] != Parser.LABEL for instruction in instructions)
+        labelled = list(instructions)
+        targets = set()
+        computed_jumps = False
+        a_index = None  # Index of the last A instruction, while A still holds its value
+        for index, instruction in enumerate(instructions):
+            kind = instruction[0]
+            if kind == Parser.A_ADDRESS or kind == Parser.A_SYMBOL:
+                a_index = index
+                continue
+            if kind == Parser.LABEL:
+                a_index = None
+                continue
+            if instruction[4] is not None and a_index is None:
+                computed_jumps = True
+            elif instruction[4] is not None:
+                target = instructions[a_index]
+                if target[0] == Parser.A_ADDRESS or target[1] in SymbolTable.PREDEFINED:
+                    address = Optimizer.a_value_of(target)
+                    dest, comp = instruction[2] or "", instruction[3]
+                    if (a_index != index - 1 or "A" in comp or "M" in comp or "A" in dest or "M" in dest
+                            or address >= num_instructions):
+                        return None
+                    labelled[a_index] = (Parser.A_SYMBOL, f"#{address}")  # '#' cannot start a symbol of the source
+                    targets.add(address)
+            if instruction[2] is not None and "A" in instruction[2]:
+                a_index = None
+
+        if computed_jumps and num_instructions == len(instructions):
+            return None
+        if targets:
+            address = 0
+            with_targets = []
+            for instruction in labelled:
+                if instruction[0] != Parser.LABEL:
+                    if address in targets:
+                        with_targets.append((Parser.LABEL, f"#{address}"))
+                    address += 1
+                with_targets.append(instruction)
+            labelled = with_targets
+        return labelled
+
+    @staticmethod
+    def is_jump_to(optimized, label):
+        """
+        :return: a Bool value representing whether the optimized program ends with "@label, <comp>;<jump>", where the
+        jump has no dest, so that removing it changes nothing if the label is defined next
+        """
+        if len(optimized) < 2:
+            return False
+        a_instruction, c_instruction = optimized[-2], optimized[-1]
+        return (a_instruction[0] == Parser.A_SYMBOL and a_instruction[1] == label and c_instruction[0] == Parser.C
+                and c_instruction[2] is None and c_instruction[4] is not None)
+
+    @staticmethod
+    def collapse(optimized):
+        """
+        Collapses the end of the optimized program, if it is one of the sequences of Optimizer._sequences.
+        :param optimized: the optimized program so far, whose last instruction is a C instruction
+        :return: the number of instructions removed
+        """
+        for sequence, replacement in Optimizer._sequences:
+            start = len(optimized) - len(sequence) - 1
+            if start < 0 or optimized[start][0] not in (Parser.A_ADDRESS, Parser.A_SYMBOL):
+                continue
+            a_instruction = optimized[start]
+            for instruction, word in zip(optimized[start + 1:], sequence):
+                if word is None:
+                    if instruction != a_instruction:
+                        break
+                elif instruction[0] != Parser.C or Code.encode_c_instruction(instruction[1]) != word:
+                    break
+            else:
+                optimized[start + 1:] = replacement
+                return len(sequence) - len(replacement)
+        return 0
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 import re
+import sys
 
 
 class Parser:
@@ -9,13 +10,126 @@ class Parser:
     methods
     """
 
+    # Instruction kinds of the records produced by Parser.tokenize
+    LABEL = 0
+    A_ADDRESS = 1
+    A_SYMBOL = 2
+    C = 3
+
+    # Precompiled patterns, so that no method pays for a lookup in the cache of compiled patterns of the re module
+    _comment_pattern = re.compile("//.*")
+    _whitespace_pattern = re.compile(r"\s+")
+    _a_instruction_address_pattern = re.compile("@([0-9]+)")
+    _a_instruction_variable_pattern = re.compile("@([A-Za-z0-9_.$]+)")
+    _a_instruction_pattern = re.compile("@(?:([0-9]+)|([A-Za-z0-9_.$]+))")  # Either an address or a variable
+    _label_instruction_pattern = re.compile(r"\(([A-Za-z0-9_.$]+)\)")
+    _jump_pattern = re.compile("(JGT|JEQ|JGE|JLT|JNE|JLE|JMP)")
+    _c_instruction_pattern = re.compile(r"(?:([AMD]{1,3})=)?([-!]?[AMD01]|[AMD1][-+&|][AMD1])"
+                                        r"(?:;(JGT|JEQ|JGE|JLT|JNE|JLE|JMP))?")
+
+    # Largest address of an A instruction, whose word must start with a 0 bit
+    MAX_ADDRESS = 0x7FFF
+
+    @staticmethod
+    def tokenize(lines, intern_symbols=False, line_numbers=None, errors=None):
+        """
+        Scans the source once, cleaning and classifying every line, and returns a compact list of typed instruction
+        records which both passes of the Assembler walk instead of the raw text (see Parser.iter_instructions).
+        :param lines: an iterable of lines of Hack assembly source code
+        :param intern_symbols: if True, intern the symbols (see Parser.iter_instructions)
+        :param line_numbers: an optional array('I') of the source line numbers of the records (see
+        Parser.iter_instructions)
+        :param errors: an optional callback of invalid lines (see Parser.iter_instructions)
+        :return: a list of instruction records
+        """
+        return list(Parser.iter_instructions(lines, intern_symbols, line_numbers, errors))
+
+    @staticmethod
+    def iter_instructions(lines, intern_symbols=False, line_numbers=None, errors=None):
+        """
+        Cleans and classifies lines one at a time, yielding a typed instruction record for every instruction:
+        - (Parser.LABEL, label) for label 'L instructions', e.g. (LOOP)
+        - (Parser.A_ADDRESS, address) for A instruction addresses, e.g. @21, where address is an int
+        - (Parser.A_SYMBOL, symbol) for A instruction variables/ labels, e.g. @LOOP
+        - (Parser.C, line, dest, comp, jump) for C instructions, where dest and jump may be None
+        :param lines: an iterable of lines of Hack assembly source code
+        :param intern_symbols: if True, intern the symbols of labels and A instructions, so that every reference to a
+        symbol shares a single string with its key in the SymbolTable. This saves memory for programs with tens of
+        thousands of labels, for a slightly slower tokenizer.
+        :param line_numbers: an optional array('I'), to which the source line number (counted from 1) of every record
+        is appended as it is yielded. The line numbers are kept apart from the records, unboxed, so that tracking them
+        allocates nothing per line.
+        :param errors: an optional callback, called as errors(line_number, column, code, message) for every invalid
+        line, which is then skipped. If it is not given, the first invalid line raises a ValueError.
+        C instructions are validated when they are encoded, by Code.
+        :return: a generator of instruction records
+        """
+        intern = sys.intern if intern_symbols else str
+        label_match = Parser._label_instruction_pattern.fullmatch
+        a_instruction_match = Parser._a_instruction_pattern.fullmatch
+        record_line = line_numbers.append if line_numbers is not None else None
+        for line_number, source_line in enumerate(lines, 1):
+            # Fast path of Parser.clean_line: most lines have no comment, and no whitespace but their indentation
+            line = source_line.partition("//")[0].strip()
+            if not line:  # Blank lines and comment-only lines are not instructions
+                continue
+            if " " in line or "\t" in line:
+                line = "".join(line.split())
+            if record_line is not None:
+                record_line(line_number)
+
+            # Dispatch on the first character, then parse all the fields of the instruction from a single match
+            first = line[0]
+            if first == "@":
+                match = a_instruction_match(line)
+                if match is None:
+                    Parser.invalid_line(errors, line_numbers, line_number, source_line, "E001",
+                                        f"A instruction \"{line}\": cannot parse address or variable")
+                    continue
+                address, symbol = match.groups()
+                if address is not None:
+                    address = int(address)
+                    if address > Parser.MAX_ADDRESS:
+                        Parser.invalid_line(errors, line_numbers, line_number, source_line, "E003",
+                                            f"A instruction \"{line}\": address is larger than {Parser.MAX_ADDRESS}")
+                        continue
+                    yield Parser.A_ADDRESS, address
+                else:
+                    yield Parser.A_SYMBOL, intern(symbol)
+
+            elif first == "(":
+                match = label_match(line)
+                if match is None:
+                    Parser.invalid_line(errors, line_numbers, line_number, source_line, "E002",
+                                        f"Label instruction \"{line}\": cannot parse label")
+                    continue
+                yield Parser.LABEL, intern(match.group(1))
+
+            else:
+                dest, _, comp = line.rpartition("=")
+                comp, _, jump = comp.partition(";")
+                yield Parser.C, line, dest or None, comp, jump or None
+
+    @staticmethod
+    def invalid_line(errors, line_numbers, line_number, source_line, code, message):
+        """
+        Reports an invalid line to the errors callback of Parser.iter_instructions, or raises it if there is none.
+        :param code: the code of the error, one of Diagnostics.Diagnostic.CODES
+        """
+        if errors is None:
+            raise ValueError(f"Line {line_number}: {message}")
+        if line_numbers is not None:
+            line_numbers.pop()  # The line is skipped
+        column = len(source_line) - len(source_line.lstrip()) + 1
+        errors(line_number, column, code, message)
+
     @staticmethod
     def clean_line(line):
         """
         :return: line with whitespace and comments removed
         """
-        line = re.sub('//.*', "", line)  # remove comments in current line
-        line = re.sub(r"\s+", "", line)  # remove all whitespace in current line
+        line = Parser._comment_pattern.sub("", line)  # remove comments in current line
+        line = Parser._whitespace_pattern.sub("", line)  # remove all whitespace in current line
         return line
 
     @staticmethod
@@ -32,7 +146,7 @@ class Parser:
         The a_instruction address has the syntax @num, e.g. @21
         :return: a regex Match object
         """
-        return re.match("@[0-9]+", line)
+        return Parser._a_instruction_address_pattern.match(line)
 
     @staticmethod
     def is_a_instruction_is_variable(line):
@@ -40,7 +154,7 @@ class Parser:
         The a_instruction variable has the syntax @string, e.g. @LOOP
         :return: a regex Match object
         """
-        return re.match("@[A-Za-z0-9_.$]+", line)
+        return Parser._a_instruction_variable_pattern.match(line)
 
     @staticmethod
     def parse_a_instruction_address(line):
@@ -48,9 +162,9 @@ class Parser:
         Parses the address of an a_instruction
         :return: a regex Group object
         """
-        assert Parser.is_a_instruction_is_address(line)
-        addr = re.search(r"([0-9]+)", line)
-        return addr[0]
+        match = Parser.is_a_instruction_is_address(line)
+        assert match
+        return match.group(1)
 
     @staticmethod
     def parse_a_instruction_variable(line):
@@ -58,9 +172,9 @@ class Parser:
         Parses the variable of an A instruction
         :return: a regex group object
         """
-        assert Parser.is_a_instruction_is_variable(line)
-        var = re.findall(r"([A-Za-z0-9_.$]+)", line)
-        return var[0]
+        match = Parser.is_a_instruction_is_variable(line)
+        assert match
+        return match.group(1)
 
     @staticmethod
     def is_label_instruction(line):
@@ -68,7 +182,7 @@ class Parser:
         The a_instruction label has the syntax (STRING), e.g. (LOOP)
         :return: a regex Match object
         """
-        return re.match("\(([A-Za-z0-9_.$]+)\)", line)
+        return Parser._label_instruction_pattern.match(line)
 
     @staticmethod
     def parse_label_instruction(line):
@@ -76,17 +190,18 @@ class Parser:
         Parses the variable of an A instruction
         :return: a regex group object
         """
-        assert Parser.is_label_instruction(line)
-        label = re.findall(r"([A-Za-z0-9_.$]+)", line)
-        return label[0]
+        match = Parser.is_label_instruction(line)
+        assert match
+        return match.group(1)
 
     @staticmethod
     def is_c_instruction(line):
         """
-        TODO
+        The c_instruction has the syntax dest=comp;jump, where only comp is mandatory, e.g. D=M, 0;JMP or AM=M-1. This
+        only checks the syntax: whether the Comp code exists is checked by Code.
+        :return: a regex Match object
         """
-        re.match(r"", line)
-        return True
+        return Parser._c_instruction_pattern.fullmatch(line)
 
     @staticmethod
     def parse_c_instruction_comp(line):
@@ -128,7 +243,7 @@ class Parser:
         lines = line.split(";")
         if len(lines) > 1:
             line = lines[1]
-            jump = re.findall(r"(JGT|JEQ|JGE|JLT|JNE|JLE|JMP)", line)
+            jump = Parser._jump_pattern.search(line)
             return jump[0]
         else:
             return None
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+
+import heapq
+import os
+import time
+from contextlib import contextmanager
+
+
+class Profile:
+    """
+    A Profile collects instrumentation of one assembly: the wall time of each stage, counts of each kind of
+    instruction, the growth of the SymbolTable, the hit rates of the C instruction table and the assembly cache, and
+    the slowest source lines. An Assembler only collects a Profile when it is given one (or when the HACK_ASM_PROFILE
+    environment variable is set), so there is no per-line overhead otherwise.
+    """
+
+    ENVIRONMENT_VARIABLE = "HACK_ASM_PROFILE"
+    FORMATS = ["text", "json"]
+
+    def __init__(self, out_format="text", slowest_lines=10):
+        """
+        :param out_format: "text" for a text table, or "json"
+        :param slowest_lines: number of slowest source lines to keep
+        """
+        self.out_format = out_format
+        self.slowest_lines = slowest_lines
+        self.program = None
+        self.stages = {}
+        self.instructions = {"label": 0, "a_address": 0, "a_symbol": 0, "c": 0}
+        self.symbols = {}
+        self.counters = {}
+        self._slowest = []  # A min-heap of (seconds, line_num, line)
+
+    @staticmethod
+    def from_environment():
+        """
+        :return: a Profile in the format named by the HACK_ASM_PROFILE environment variable ("text", "json", or any
+        other non-empty value for "text"), or None if it is not set
+        """
+        out_format = os.environ.get(Profile.ENVIRONMENT_VARIABLE)
+        if not out_format:
+            return None
+        return Profile(out_format if out_format in Profile.FORMATS else "text")
+
+    @contextmanager
+    def stage(self, name):
+        """
+        Times a stage of the assembly, for the duration of a with statement.
+        :param name: name of the stage, e.g. "first_pass"
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + time.perf_counter() - start
+
+    def timed_lines(self, lines):
+        """
+        Wraps the source lines fed to the tokenizer, timing how long the tokenizer takes to consume each line and
+        keeping the slowest ones.
+        :param lines: an iterable of lines of Hack assembly source code
+        :return: a generator of the same lines
+        """
+        slowest = self._slowest
+        previous = time.perf_counter()
+        for line_num, line in enumerate(lines, 1):
+            yield line
+            now = time.perf_counter()
+            if len(slowest) < self.slowest_lines:
+                heapq.heappush(slowest, (now - previous, line_num, line.rstrip("\n")))
+            elif now - previous > slowest[0][0]:
+                heapq.heapreplace(slowest, (now - previous, line_num, line.rstrip("\n")))
+            previous = now
+
+    def count_instructions(self, instructions):
+        """
+        Wraps a stream of instruction records, counting each kind of instruction.
+        :param instructions: an iterable of instruction records from Parser
+        :return: a generator of the same instruction records
+        """
+        counts = [0, 0, 0, 0]  # Indexed by Parser.LABEL, Parser.A_ADDRESS, Parser.A_SYMBOL and Parser.C
+        for instruction in instructions:
+            counts[instruction[0]] += 1
+            yield instruction
+        for name, count in zip(self.instructions, counts):
+            self.instructions[name] += count
+
+    def record_symbols(self, stage, num_symbols):
+        """
+        :param stage: name of the stage after which the SymbolTable is sized
+        :param num_symbols: number of symbols in the SymbolTable
+        """
+        self.symbols[stage] = num_symbols
+
+    def record_counter(self, name, value):
+        """
+        :param name: name of a counter, e.g. "c_table_misses"
+        :param value: value of the counter
+        """
+        self.counters[name] = value
+
+    def to_dict(self):
+        """
+        :return: a dictionary of everything collected by the Profile
+        """
+        return {
+            "program": self.program,
+            "stages": self.stages,
+            "total_seconds": sum(self.stages.values()),
+            "instructions": self.instructions,
+            "symbols": self.symbols,
+            "counters": self.counters,
+            "slowest_lines": [{"line_num": line_num, "line": line, "seconds": seconds}
+                              for seconds, line_num, line in sorted(self._slowest, reverse=True)],
+        }
+
+    def report(self):
+        """
+        :return: a string of everything collected by the Profile, in the format of the Profile
+        """
+        profile = self.to_dict()
+        if self.out_format == "json":
+            import json  # Imported on demand, to keep it out of the start-up of unprofiled runs
+
+            return json.dumps(profile, indent=2)
+
+        lines = [f"Profile of {profile['program']}"]
+        lines += [f"  {stage:<16}{seconds * 1000:>10.2f}ms" for stage, seconds in profile["stages"].items()]
+        lines.append(f"  {'total':<16}{profile['total_seconds'] * 1000:>10.2f}ms")
+        lines.append("Instructions")
+        lines += [f"  {name:<16}{count:>10}" for name, count in profile["instructions"].items()]
+        lines.append("Symbols")
+        lines += [f"  {stage:<16}{count:>10}" for stage, count in profile["symbols"].items()]
+        lines.append("Counters")
+        lines += [f"  {name:<16}{value:>10}" for name, value in profile["counters"].items()]
+        lines.append("Slowest lines")
+        lines += [f"  {line['seconds'] * 1e6:>8.1f}us  {line['line_num']:>7}: {line['line'].strip()}"
+                  for line in profile["slowest_lines"]]
+        return "\n".join(lines)
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+
+import argparse
+import asyncio
+import io
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from .Assembler import Assembler
+    from .Code import Code
+except ImportError:  # Run as a script from inside the Assembler/ directory
+    from Assembler import Assembler
+    from Code import Code
+
+
+def assemble_payload(payload, out_format, byteorder):
+    """
+    Assembles an '.asm' payload. Defined at module level so that it can be run by a pool of worker processes.
+    :param payload: bytes of the Hack assembly program
+    :param out_format: "hack" for the textual '.hack' format, or "bin" for a raw binary ROM image
+    :param byteorder: byte order of the words of a raw binary ROM image, "little" or "big"
+    :return: bytes of the assembled program
+    """
+    sink = io.BytesIO()
+    Assembler().assemble_to(payload, sink, out_format, byteorder)
+    return sink.getvalue()
+
+
+class AssemblerServer:
+    """
+    The AssemblerServer is a warm asyncio service which assembles '.asm' payloads sent over a Unix socket or local TCP,
+    so that assembling many tiny programs does not pay for a Python start-up each. The encoding is offloaded to a pool
+    of worker processes, which are forked once the Code tables and the predefined symbols have already been built.
+
+    Each request is a header line "<format> <byteorder> <length>\\n" (e.g. "hack little 1024\\n") followed by <length>
+    bytes of the '.asm' program. Each response is a header line "OK <length>\\n" followed by <length> bytes of the
+    assembled program, or "ERR <length>\\n" followed by <length> bytes of an error message. A connection may send any
+    number of requests, one after the other.
+    """
+
+    FORMATS = ("hack", "bin")
+    BYTEORDERS = ("little", "big")
+
+    def __init__(self, jobs=None, max_concurrency=None, max_payload=64 * 1024 * 1024):
+        """
+        :param jobs: number of worker processes (default: the number of CPUs)
+        :param max_concurrency: maximum number of requests being assembled at once (default: twice the jobs). Further
+        requests wait, without their payloads being read, until a slot frees up.
+        :param max_payload: maximum size of an '.asm' payload, in bytes
+        """
+        self.jobs = jobs or os.cpu_count() or 1
+        self.max_concurrency = max_concurrency or 2 * self.jobs
+        self.max_payload = max_payload
+        self.pool = None
+        self.slots = None
+
+    async def handle_connection(self, reader, writer):
+        """
+        Serves the requests of a connection, one after the other, until the client closes it.
+        """
+        try:
+            while True:
+                try:
+                    header = await reader.readline()
+                except ValueError:  # The header line is longer than the limit of the stream
+                    await self.respond(writer, b"ERR", b"Request header is too long")
+                    break
+                if not header:
+                    break
+                try:
+                    out_format, byteorder, length = header.decode("ascii").split()
+                    # Only plain decimal digits: int() would also take a sign, e.g. "-5", or underscores
+                    if out_format not in self.FORMATS or byteorder not in self.BYTEORDERS or not length.isdigit():
+                        raise ValueError
+                    length = int(length)
+                except ValueError:
+                    await self.respond(writer, b"ERR", f"Invalid request header {header!r}".encode())
+                    break
+                if length > self.max_payload:
+                    await self.respond(writer, b"ERR", f"Payload of {length} bytes is too large".encode())
+                    break
+
+                async with self.slots:  # Backpressure: the payload is only read once a slot is free
+                    payload = await reader.readexactly(length)
+                    try:
+                        output = await asyncio.get_running_loop().run_in_executor(
+                            self.pool, assemble_payload, payload, out_format, byteorder)
+                    except Exception as error:
+                        await self.respond(writer, b"ERR", f"{type(error).__name__}: {error}".encode())
+                        continue
+                await self.respond(writer, b"OK", output)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            await AssemblerServer.close(writer)
+
+    @staticmethod
+    async def close(writer):
+        """
+        Closes a connection and waits until it is closed, ignoring a peer which has already reset it.
+        """
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+    @staticmethod
+    async def respond(writer, status, body):
+        writer.write(status + b" %d\n" % len(body))
+        writer.write(body)
+        await writer.drain()  # Backpressure: wait for slow clients to read their responses
+
+    async def serve(self, host="127.0.0.1", port=0, path=None, ready=None):
+        """
+        Serves forever, on a Unix socket if path is given, else on TCP.
+        :param host: TCP host to listen on
+        :param port: TCP port to listen on, 0 for any free port
+        :param path: Unix socket path to listen on
+        :param ready: an optional callback, called with the listening asyncio Server once it accepts connections
+        """
+        self.slots = asyncio.Semaphore(self.max_concurrency)
+        Code.precompute_c_instructions()  # Before the worker processes are forked, so that they all share it
+        self.pool = ProcessPoolExecutor(max_workers=self.jobs)
+        try:
+            if path is not None:
+                server = await asyncio.start_unix_server(self.handle_connection, path=path)
+            else:
+                server = await asyncio.start_server(self.handle_connection, host=host, port=port)
+            async with server:
+                if ready is not None:
+                    ready(server)
+                await server.serve_forever()
+        finally:
+            self.pool.shutdown()
+
+
+async def assemble_remote(source, out_format="hack", byteorder="little", host="127.0.0.1", port=None, path=None):
+    """
+    A client of the AssemblerServer, assembling a single program.
+    :param source: the Hack assembly program, either a string or bytes
+    :param out_format: "hack" for the textual '.hack' format, or "bin" for a raw binary ROM image
+    :param byteorder: byte order of the words of a raw binary ROM image, "little" or "big"
+    :param host: TCP host of the server
+    :param port: TCP port of the server
+    :param path: Unix socket path of the server, instead of TCP
+    :return: bytes of the assembled program
+    """
+    if isinstance(source, str):
+        source = source.encode()
+    if path is not None:
+        reader, writer = await asyncio.open_unix_connection(path)
+    else:
+        reader, writer = await asyncio.open_connection(host, port)
+    try:
+        writer.write(f"{out_format} {byteorder} {len(source)}\n".encode("ascii") + source)
+        await writer.drain()
+        status, length = (await reader.readline()).split()
+        body = await reader.readexactly(int(length))
+    finally:
+        await AssemblerServer.close(writer)
+    if status != b"OK":
+        raise Exception(body.decode())
+    return body
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serves the Hack Assembler over a Unix socket or local TCP.")
+    parser.add_argument("--unix", metavar="PATH", help="listen on this Unix socket path, instead of TCP")
+    parser.add_argument("--host", default="127.0.0.1", help="TCP host to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="TCP port to listen on (default: 8765)")
+    parser.add_argument("--jobs", type=int, default=None, metavar="N",
+                        help="number of worker processes (default: the number of CPUs)")
+    parser.add_argument("--max-concurrency", type=int, default=None, metavar="N",
+                        help="maximum number of requests being assembled at once (default: twice the jobs)")
+    args = parser.parse_args(argv)
+
+    server = AssemblerServer(jobs=args.jobs, max_concurrency=args.max_concurrency)
+    where = args.unix or f"{args.host}:{args.port}"
+    try:
+        asyncio.run(server.serve(args.host, args.port, args.unix,
+                                 ready=lambda _: print(f"Serving the Hack Assembler on {where}", flush=True)))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
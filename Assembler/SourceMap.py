@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+
+import argparse
+import os
+import sys
+from array import array
+from bisect import bisect_right
+
+try:
+    from .HackFile import HackFile
+    from .Parser import Parser
+    from .SymbolTable import SymbolTable
+except ImportError:  # Run as a script from inside the Assembler/ directory
+    from HackFile import HackFile
+    from Parser import Parser
+    from SymbolTable import SymbolTable
+
+
+class SourceMap:
+    """
+    A SourceMap maps the ROM addresses of an assembled program back to its source, so that debugging and profiling
+    tools can answer "what is at ROM 0x1A2F" without scanning the source again. It holds:
+    - files: the source files of the program, in program order (a single one, unless the program was linked)
+    - file_starts: the ROM address of the first word of each file, in ascending order
+    - lines: the source line (counted from 1, or 0 if unknown) of the word at each ROM address, in its file
+    - labels, variables: the resolved label:address and variable:address pairs of the program
+    The lines are a dense array('I') indexed by ROM address, so looking up the line of an address is a single index,
+    and its file a bisect of file_starts; a symbol is a single dictionary lookup.
+    """
+
+    EXTENSION = ".map"
+    FORMAT_VERSION = 1
+
+    def __init__(self, files, file_starts, lines, labels, variables):
+        self.files = list(files)
+        self.file_starts = array("I", file_starts)
+        self.lines = array("I", lines)
+        self.labels = dict(labels)
+        self.variables = dict(variables)
+        # The labels in ROM order, for the bisect of SourceMap.label_at
+        by_address = sorted((address, label) for label, address in self.labels.items())
+        self._label_addresses = array("I", (address for address, _ in by_address))
+        self._label_names = [label for _, label in by_address]
+
+    @staticmethod
+    def from_program(filename, instructions, line_numbers, symbol_table):
+        """
+        :param filename: the source file of the program
+        :param instructions: the tokenized program (a list of instruction records from Parser)
+        :param line_numbers: the source line number of each record, as tracked by Parser.tokenize
+        :param symbol_table: the SymbolTable of the program, after the second pass
+        :return: the SourceMap of the program
+        """
+        lines = array("I")
+        labels = {}
+        for instruction, line_number in zip(instructions, line_numbers):
+            if instruction[0] != Parser.LABEL:
+                lines.append(line_number)
+            elif not instruction[1].startswith("#"):  # Labels of jump targets made by the Optimizer are not symbols
+                labels[instruction[1]] = symbol_table[instruction[1]]
+        variables = {symbol: address for symbol, address in symbol_table.items()
+                     if symbol not in labels and symbol not in SymbolTable.PREDEFINED and not symbol.startswith("#")}
+        return SourceMap([filename], [0], lines, labels, variables)
+
+    def lookup(self, address):
+        """
+        :param address: a ROM address of the program
+        :return: a tuple of (source file, source line) of the word at the address
+        :raises ValueError: if the address is not in the program
+        """
+        if not 0 <= address < len(self.lines):
+            raise ValueError(f"ROM[{address}] is not in the program of {len(self.lines)} words")
+        return self.files[bisect_right(self.file_starts, address) - 1], self.lines[address]
+
+    def address_of(self, symbol):
+        """
+        :param symbol: a label or a variable of the program
+        :return: the address of the symbol, or None if the program has no such symbol
+        """
+        address = self.labels.get(symbol)
+        return address if address is not None else self.variables.get(symbol)
+
+    def label_at(self, address):
+        """
+        :param address: a ROM address of the program
+        :return: a tuple of (label, offset) of the closest label at or before the address, e.g. ("Sys.init", 5), or None
+        if no label precedes the address
+        """
+        index = bisect_right(self._label_addresses, address) - 1
+        if index < 0:
+            return None
+        return self._label_names[index], address - self._label_addresses[index]
+
+    def describe(self, address):
+        """
+        :param address: a ROM address of the program
+        :return: a one line description of the word at the address, e.g. "ROM[6703] Pong.asm:27944 (Sys.init+5)"
+        """
+        filename, line = self.lookup(address)
+        description = f"ROM[{address}] {filename}:{line}"
+        label = self.label_at(address)
+        if label is not None:
+            description += f" ({label[0]}+{label[1]})" if label[1] else f" ({label[0]})"
+        return description
+
+    def to_dict(self):
+        return {"format": "hack-source-map", "version": SourceMap.FORMAT_VERSION, "files": self.files,
+                "file_starts": self.file_starts.tolist(), "lines": self.lines.tolist(), "labels": self.labels,
+                "variables": self.variables}
+
+    @staticmethod
+    def from_dict(data):
+        if data.get("format") != "hack-source-map" or data.get("version") != SourceMap.FORMAT_VERSION:
+            raise ValueError(f"Not a version {SourceMap.FORMAT_VERSION} Hack source map")
+        return SourceMap(data["files"], data["file_starts"], data["lines"], data["labels"], data["variables"])
+
+    def write(self, out_filename):
+        """
+        :param out_filename: the '.map' file to write the SourceMap to
+        """
+        import json  # Imported on demand, only source maps and object modules are JSON
+
+        with open(out_filename, "w") as outfile:
+            json.dump(self.to_dict(), outfile, separators=(",", ":"))
+
+    @staticmethod
+    def read(filename):
+        """
+        :param filename: the '.map' file to read
+        :return: a SourceMap
+        """
+        import json
+
+        with open(filename) as file:
+            return SourceMap.from_dict(json.load(file))
+
+    @staticmethod
+    def map_filename(out_filename):
+        """
+        :param out_filename: the '.hack' or '.bin' output file of a program, which may be compressed
+        :return: string of the '.map' filename written next to it
+        """
+        return os.path.splitext(HackFile.uncompressed_name(out_filename))[0] + SourceMap.EXTENSION
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Looks up ROM addresses or symbols in the source map of a program.")
+    parser.add_argument("map_file", help="the '.map' source map of the program")
+    parser.add_argument("queries", nargs="+", metavar="ADDRESS_OR_SYMBOL",
+                        help="ROM addresses, in decimal or with a 0x prefix in hexadecimal, or labels and variables")
+    args = parser.parse_args(argv)
+
+    source_map = SourceMap.read(args.map_file)
+    status = 0
+    for query in args.queries:
+        try:
+            print(source_map.describe(int(query, 0)))
+            continue
+        except ValueError as error:
+            if query[:1].isdigit():
+                print(error, file=sys.stderr)
+                status = 1
+                continue
+        address = source_map.address_of(query)
+        if address is None:
+            print(f"{query}: no such label or variable", file=sys.stderr)
+            status = 1
+        else:
+            print(f"{query} = {address}")
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,30 +1,104 @@
 #!/usr/bin/env python3
 
-class SymbolTable(dict):
+from collections.abc import MutableMapping
+from types import MappingProxyType
+
+
+class SymbolTable(MutableMapping):
+
+    # The predefined symbols of the Hack platform, built once and shared (read-only) by every SymbolTable
+    PREDEFINED = MappingProxyType({"R0": 0, "R1": 1, "R2": 2, "R3": 3, "R4": 4, "R5": 5, "R6": 6, "R7": 7, "R8": 8,
+                                   "R9": 9, "R10": 10, "R11": 11, "R12": 12, "R13": 13, "R14": 14, "R15": 15,
+                                   "SCREEN": 0x4000, "KBD": 0x6000,
+                                   "SP": 0, "LCL": 1, "ARG": 2, "THIS": 3, "THAT": 4
+                                   })
+
+    __slots__ = ("_symbols",)
 
     def __init__(self):
         """
         The SymbolTable contains information on the 'symbol:address' key:value pairs of the written Hack program. The
         Symbol:Address refers to what Address in the ROM or in RAM the symbolic symbol refers to.
         Symbolic 'symbols' are represented with the following syntax: @LOOP, @sys.init
-        The SymbolTable class is a subclass of a Dict object, as it is fundamentally a Dictionary itself.
+        The SymbolTable class is a dictionary-like MutableMapping of symbols to addresses. It overlays the symbols of
+        the program on the immutable predefined symbols, which are shared by every SymbolTable and never copied: a new
+        SymbolTable is an empty dictionary, so that creating thousands of tables is cheap. Assigning a predefined
+        symbol shadows it in this SymbolTable only, and deleting it restores the predefined address.
+        """
+        self._symbols = _Overlay()
+
+    def __getitem__(self, symbol):
+        return self._symbols[symbol]
+
+    def __setitem__(self, symbol, address):
+        self._symbols[symbol] = address
+
+    def __delitem__(self, symbol):
+        del self._symbols[symbol]
+
+    def __contains__(self, symbol):
+        return symbol in self._symbols or symbol in SymbolTable.PREDEFINED
+
+    def __iter__(self):
+        yield from SymbolTable.PREDEFINED
+        for symbol in self._symbols:
+            if symbol not in SymbolTable.PREDEFINED:
+                yield symbol
+
+    def __len__(self):
+        return len(self._symbols.keys() | SymbolTable.PREDEFINED.keys())
+
+    def __repr__(self):
+        return f"SymbolTable({dict(self)})"
+
+    def __reduce__(self):
+        # The shared predefined symbols (a mappingproxy) cannot be pickled, so a SymbolTable is pickled as its overlay
+        return SymbolTable.from_symbols, (dict(self._symbols),)
+
+    def get(self, symbol, default=None):
+        return self[symbol] if symbol in self else default
+
+    def copy(self):
+        return SymbolTable.from_symbols(self._symbols)
+
+    @staticmethod
+    def from_symbols(symbols):
+        """
+        :param symbols: a dictionary of symbol:address pairs, with or without the predefined symbols
+        :return: a SymbolTable of the symbols, overlaid on the predefined symbols
         """
-        super().__init__()
-        self.update({"R0": 0, "R1": 1, "R2": 2, "R3": 3, "R4": 4, "R5": 5, "R6": 6, "R7": 7, "R8": 8, "R9": 9,
-                     "R10": 10, "R11": 11, "R12": 12, "R13": 13, "R14": 14, "R15": 15,
-                     "SCREEN": 0x4000, "KBD": 0x6000,
-                     "SP": 0, "LCL": 1, "ARG": 2, "THIS": 3, "THAT": 4
-                     })
+        symbol_table = SymbolTable()
+        predefined = SymbolTable.PREDEFINED
+        symbol_table._symbols.update((symbol, address) for symbol, address in symbols.items()
+                                     if symbol not in predefined or predefined[symbol] != address)
+        return symbol_table
 
     def contains(self, symbol):
         return symbol in self
 
     def add_symbol(self, symbol, address):
-        if self.contains(symbol):
+        """
+        Adds a symbol:address pair, unless the symbol is already in the SymbolTable, with a single insert-if-absent
+        lookup of the program's symbols.
+        :return: a Bool value representing whether the symbol was added
+        """
+        if symbol in SymbolTable.PREDEFINED:
             return False
-        else:
-            self.update({symbol: address})
-            return True
+        symbols = self._symbols
+        num_symbols = len(symbols)
+        symbols.setdefault(symbol, address)
+        return len(symbols) != num_symbols
 
     def get_address(self, symbol):
-        return self[symbol]
+        return self._symbols[symbol]
+
+
+class _Overlay(dict):
+    """
+    The symbols of a single program. A symbol missing from the overlay falls back to the shared predefined symbols,
+    from within the dictionary lookup itself (dict.__missing__), so that looking up any symbol is still a single
+    subscript. Containment (and get) do not call __missing__: the SymbolTable checks both dictionaries for those.
+    """
+
+    __slots__ = ()
+    __missing__ = SymbolTable.PREDEFINED.__getitem__
@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import time
+from array import array
+from itertools import compress, count, islice
+from operator import ne
+
+try:
+    from .Parser import Parser
+    from .Code import Code
+    from .HackFile import HackFile
+    from .SymbolTable import SymbolTable
+except ImportError:  # Run as a script from inside the Assembler/ directory
+    from Parser import Parser
+    from Code import Code
+    from HackFile import HackFile
+    from SymbolTable import SymbolTable
+
+
+class IncrementalAssembly:
+    """
+    An IncrementalAssembly keeps the state of the last assembly of a program in memory: its source lines, the
+    instruction record of each line (or None for blank and comment lines), its labels, its variables and its words. An
+    edited version of the program is then assembled by diffing its lines against the previous ones, and only
+    re-tokenizing and re-encoding the changed lines:
+    - label addresses are only recomputed when the changed lines define labels or shift the instruction count
+    - variable addresses are only recomputed when the changed lines change the order in which variables are first seen
+    - the A instructions of the unchanged lines are only patched if they reference a symbol whose address moved
+    The words are always identical to those of a full assembly of the edited program.
+    """
+
+    # Lines replaced by a single edit, beyond which the rest of a difference is re-tokenized as a whole, and the number
+    # of equal lines after which a difference ends (see IncrementalAssembly.diff)
+    MAX_EDIT_LINES = 32
+    RESYNC_LINES = 4
+
+    def __init__(self, lines=()):
+        """
+        :param lines: the lines of the program to be assembled
+        :raises ValueError: if the program is invalid
+        """
+        self.lines = []
+        self.records = []
+        # Flags of the lines which encode a word, which define a label, and which reference a label or a variable, so
+        # that words are counted, and labels and references are found, in C rather than by walking every record
+        self.word_lines = bytearray()
+        self.label_lines = bytearray()
+        self.reference_lines = bytearray()
+        self.labels = {}
+        self.variables = {}
+        self.symbols = dict(SymbolTable.PREDEFINED)
+        self.words = array("H")
+        self.update(lines)
+
+    def update(self, lines):
+        """
+        Assembles an edited version of the program. If it is invalid, the state is left unchanged.
+        :param lines: the lines of the edited program
+        :return: a tuple of (the first changed address, the address after the last changed one) of the words, or None
+        if no word changed. The words after the span are unchanged, but are moved if the number of words changed.
+        :raises ValueError: if the edited program is invalid
+        """
+        lines = list(lines)
+        regions = self.diff(self.lines, lines)
+        if not regions:
+            return None
+
+        # Tokenize and validate the changed lines before touching the state
+        region_records = [self.tokenize(lines[j1:j2]) for _, _, j1, j2 in regions]
+        for records in region_records:
+            for record in records:
+                if record is not None and record[0] == Parser.C:
+                    Code.encode_c_instruction(record[1])
+
+        relabel = False
+        reallocate = False
+        spans = []  # The (start, old end, new end) addresses of the words of each region
+        shift = 0
+        for (i1, i2, _, _), records in zip(regions, region_records):
+            old_records = self.records[i1:i2]
+            start = self.word_lines.count(1, 0, i1) + shift
+            old_count = self.word_lines.count(1, i1, i2)
+            new_count = sum(1 for record in records if record is not None and record[0] != Parser.LABEL)
+            spans.append((start, start + old_count, start + new_count))
+            shift += new_count - old_count
+            relabel = relabel or new_count != old_count or self.defines_labels(old_records + records)
+            reallocate = reallocate or self.variable_references(old_records) != self.variable_references(records)
+
+        for (i1, i2, j1, j2), records in reversed(list(zip(regions, region_records))):
+            self.lines[i1:i2] = lines[j1:j2]
+            self.records[i1:i2] = records
+            self.word_lines[i1:i2] = bytes(record is not None and record[0] != Parser.LABEL for record in records)
+            self.label_lines[i1:i2] = bytes(record is not None and record[0] == Parser.LABEL for record in records)
+            self.reference_lines[i1:i2] = bytes(record is not None and record[0] == Parser.A_SYMBOL
+                                                and record[1] not in SymbolTable.PREDEFINED for record in records)
+
+        symbols = self.symbols
+        if relabel:
+            labels = self.scan_labels()
+            reallocate = reallocate or labels.keys() != self.labels.keys()
+            self.labels = labels
+        if reallocate:
+            self.variables = self.scan_variables()
+        if relabel or reallocate:
+            self.symbols = dict(SymbolTable.PREDEFINED)
+            self.symbols.update(self.labels)
+            self.symbols.update(self.variables)
+
+        # Each region starts after the words of the regions before it have been replaced
+        for (start, old_end, _), records in zip(spans, region_records):
+            self.words[start:old_end] = self.encode(records, self.symbols)
+        changed = [(start, new_end) for start, old_end, new_end in spans if old_end != start or new_end != start]
+
+        moved = {symbol for symbol, address in self.symbols.items() if symbols.get(symbol) != address}
+        if moved:
+            patched = self.patch(moved)
+            if patched is not None:
+                changed.append(patched)
+        if not changed:
+            return None
+        first, last = min(start for start, _ in changed), max(end for _, end in changed)
+        return first, len(self.words) if shift else last
+
+    @staticmethod
+    def diff(old, new):
+        """
+        Diffs two versions of a program by line. Edits are assumed to be local: runs of equal lines are skipped in C,
+        and after each difference the two versions are resynchronized on the nearest run of RESYNC_LINES equal lines,
+        at most MAX_EDIT_LINES lines further in either version. Past that, the rest of the difference is a single
+        region. Any resynchronization gives a valid (if not minimal) diff.
+        :param old: the previous lines of the program
+        :param new: the edited lines of the program
+        :return: a list of (i1, i2, j1, j2) tuples, in ascending order, of the regions where the lines old[i1:i2] were
+        replaced with new[j1:j2]
+        """
+        # The common suffix is trimmed first, so that the last region ends where the versions become equal again
+        suffix = next(compress(count(), map(ne, reversed(old), reversed(new))), min(len(old), len(new)))
+        old_end, new_end = len(old) - suffix, len(new) - suffix
+        regions = []
+        i = j = 0
+        while True:
+            i_run = islice(old, i, old_end)
+            j_run = islice(new, j, new_end)
+            equal = next(compress(count(), map(ne, i_run, j_run)), min(old_end - i, new_end - j))
+            i += equal
+            j += equal
+            if i == old_end and j == new_end:
+                return regions
+            resync = IncrementalAssembly.resync(old, new, i, j, old_end, new_end)
+            regions.append((i, resync[0], j, resync[1]))
+            i, j = resync
+
+    @staticmethod
+    def resync(old, new, i, j, old_end, new_end):
+        """
+        :return: a tuple of the indices (i2, j2) of the nearest lines after a difference at old[i] and new[j] from which
+        both versions are equal again, or (old_end, new_end) if there is none nearby
+        """
+        edit_lines, resync_lines = IncrementalAssembly.MAX_EDIT_LINES, IncrementalAssembly.RESYNC_LINES
+        for distance in range(1, 2 * edit_lines + 1):
+            for i_skip in range(max(0, distance - edit_lines), min(distance, edit_lines) + 1):
+                i2, j2 = i + i_skip, j + distance - i_skip
+                if i2 > old_end or j2 > new_end:
+                    continue
+                length = min(resync_lines, old_end - i2, new_end - j2)
+                if (length == resync_lines or (i2 + length == old_end and j2 + length == new_end)) and \
+                        old[i2:i2 + length] == new[j2:j2 + length]:
+                    return i2, j2
+        return old_end, new_end
+
+    @staticmethod
+    def tokenize(lines):
+        """
+        :param lines: a list of source lines
+        :return: a list of the instruction record of each line, or None for blank and comment lines
+        :raises ValueError: if a line is invalid
+        """
+        records = [None] * len(lines)
+        line_numbers = array("I")
+        for record in Parser.iter_instructions(lines, line_numbers=line_numbers):
+            records[line_numbers[-1] - 1] = record
+        return records
+
+    @staticmethod
+    def defines_labels(records):
+        return any(record is not None and record[0] == Parser.LABEL for record in records)
+
+    @staticmethod
+    def variable_references(records):
+        """
+        :return: the list of the symbols referenced by the A instructions of the records, which may be variables
+        """
+        return [record[1] for record in records
+                if record is not None and record[0] == Parser.A_SYMBOL and record[1] not in SymbolTable.PREDEFINED]
+
+    def lines_of(self, flags):
+        """
+        :param flags: one of the bytearrays of line flags, e.g. self.label_lines
+        :return: a generator of (line index, address of the next word at the line) of the flagged lines, in order
+        """
+        find, count_words = flags.find, self.word_lines.count
+        line = flags.find(1)
+        previous = address = 0
+        while line >= 0:
+            address += count_words(1, previous, line)
+            yield line, address
+            previous = line
+            line = find(1, line + 1)
+
+    def scan_labels(self):
+        """
+        :return: a dictionary of the label:address pairs of the program, where the first definition of a label wins
+        """
+        labels = {}
+        records = self.records
+        for line, address in self.lines_of(self.label_lines):
+            label = records[line][1]
+            if label not in SymbolTable.PREDEFINED:
+                labels.setdefault(label, address)
+        return labels
+
+    def scan_variables(self):
+        """
+        :return: a dictionary of the variable:address pairs of the program, allocated from address 16 upwards in the
+        order the variables are first seen, as the second pass of the Assembler does
+        """
+        variables = {}
+        labels, records = self.labels, self.records
+        line = self.reference_lines.find(1)
+        while line >= 0:
+            symbol = records[line][1]
+            if symbol not in labels and symbol not in variables:
+                variables[symbol] = 16 + len(variables)
+            line = self.reference_lines.find(1, line + 1)
+        return variables
+
+    @staticmethod
+    def encode(records, symbols):
+        """
+        :param records: a list of instruction records (or None for blank and comment lines)
+        :param symbols: a dictionary of the address of every symbol of the program
+        :return: an array('H') of the words of the records
+        """
+        words = array("H")
+        for record in records:
+            if record is None or record[0] == Parser.LABEL:
+                continue
+            if record[0] == Parser.A_ADDRESS:
+                words.append(record[1])
+            elif record[0] == Parser.A_SYMBOL:
+                words.append(symbols[record[1]])
+            else:
+                words.append(Code.encode_c_instruction(record[1]))
+        return words
+
+    def patch(self, moved):
+        """
+        Patches the words of the A instructions which reference a symbol whose address moved.
+        :param moved: a set of the symbols whose address moved
+        :return: a tuple of (the first patched address, the address after the last patched one), or None if no word
+        was patched
+        """
+        words, symbols, records = self.words, self.symbols, self.records
+        first = last = None
+        for line, address in self.lines_of(self.reference_lines):
+            symbol = records[line][1]
+            if symbol in moved and words[address] != symbols[symbol]:
+                words[address] = symbols[symbol]
+                if first is None:
+                    first = address
+                last = address + 1
+        return (first, last) if first is not None else None
+
+
+class Watch:
+    """
+    Watch is a class that provides helper functions to re-assemble a program every time its source file changes, with
+    an IncrementalAssembly. The output file is patched in place, as every word has the same width in both formats (17
+    bytes of '.hack' text, or 2 bytes of '.bin'): only the span of changed words is rewritten, up to the end of the file
+    when the number of words changed.
+    """
+
+    @staticmethod
+    def write_span(words, out_filename, span, out_format="hack", byteorder="little"):
+        """
+        :param words: the array('H') of all the words of the program
+        :param out_filename: the '.hack' or '.bin' output file, holding the previous words of the program
+        :param span: a tuple of (the first changed address, the address after the last changed one)
+        """
+        if HackFile.compression(out_filename) is not None:
+            # A compressed stream cannot be patched in place: compress all of it again
+            with HackFile.open_file(out_filename, "wb") as outfile:
+                HackFile.write(words, outfile, out_format, byteorder)
+            return
+        width = 17 if out_format == "hack" else 2
+        first, last = span
+        exists = os.path.exists(out_filename)
+        if not exists:
+            first, last = 0, len(words)  # The previous output was removed, write all of it again
+        with open(out_filename, "r+b" if exists else "wb") as outfile:
+            outfile.seek(first * width)
+            HackFile.write(words[first:last], outfile, out_format, byteorder)
+            if last == len(words):
+                outfile.truncate()
+
+    @staticmethod
+    def watch(asm_file, out_filename, out_format="hack", byteorder="little", interval=0.2, diagnostics="text"):
+        """
+        Assembles a program, then polls the modification time of its source and re-assembles it incrementally on every
+        change, until interrupted. An invalid edit prints its Diagnostics, and leaves the output unchanged.
+        :param asm_file: the '.asm' file to be watched
+        :param out_filename: the '.hack' or '.bin' file to write to
+        :param interval: seconds between two polls of the source
+        :param diagnostics: "text" or "json", the format of the Diagnostics of invalid edits
+        """
+        try:
+            from .Assembler import Assembler
+        except ImportError:  # Run as a script from inside the Assembler/ directory
+            from Assembler import Assembler
+
+        assembly = None
+        modified = None
+        try:
+            while True:
+                stat = os.stat(asm_file)
+                if (stat.st_mtime_ns, stat.st_size) == modified:
+                    time.sleep(interval)
+                    continue
+                modified = (stat.st_mtime_ns, stat.st_size)
+                start = time.perf_counter()
+                with HackFile.open_file(asm_file, "rt") as file:
+                    lines = file.readlines()
+                try:
+                    if assembly is None:
+                        assembly = IncrementalAssembly(lines)
+                        span = (0, len(assembly.words))
+                    else:
+                        span = assembly.update(lines)
+                except ValueError as error:
+                    diagnosed = Assembler().diagnose(lines, asm_file)
+                    print(diagnosed.format(diagnostics) if diagnosed is not None else error, file=sys.stderr)
+                    continue
+                if span is not None:
+                    Watch.write_span(assembly.words, out_filename, span, out_format, byteorder)
+                milliseconds = (time.perf_counter() - start) * 1000
+                if span is None:
+                    print(f"{asm_file}: no instruction changed ({milliseconds:.1f}ms).")
+                else:
+                    print(f"{asm_file}: wrote {span[1] - span[0]} of {len(assembly.words)} words to {out_filename} "
+                          f"({milliseconds:.1f}ms).")
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,207 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from array import array
+
+from Assembler.Assembler import Assembler, main
+from Assembler.Diagnostics import AssemblyError
+from Assembler.HackFile import HackFile
+from Assembler.Parser import Parser
+
+PROGRAMS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Assembler")
+
+
+class TestAssemblerClass(unittest.TestCase):
+
+    @staticmethod
+    def golden(name):
+        with open(os.path.join(PROGRAMS_DIR, "in_asm", name + ".asm")) as file:
+            source = file.read()
+        return source, HackFile.read_words(os.path.join(PROGRAMS_DIR, "out_hack", name + ".hack"))
+
+    def test_assemble_source(self):
+        """
+        Asserts that programs held in memory, as a string, bytes or lines, assemble to their golden outputs.
+        """
+        assembler = Assembler()
+        for name in ("Max", "Rect", "Pong"):
+            source, words = self.golden(name)
+            self.assertEqual(assembler.assemble_source(source), words)
+            self.assertEqual(assembler.assemble_source(source.encode()), words)
+            self.assertEqual(assembler.assemble_source(io.StringIO(source)), words)
+
+    def test_readme_library_usage(self):
+        """
+        Asserts that the library usage example of the README runs as documented.
+        """
+        with open(os.path.join(PROGRAMS_DIR, "..", "README.md")) as file:
+            readme = file.read()
+        usage = readme[readme.index("### Library usage"):]
+        example = usage[usage.index("```python\n") + len("```python\n"):usage.index("```\n", usage.index("```python"))]
+        namespace = {}
+        exec(example, namespace)
+        self.assertEqual(namespace["words"], self.golden("Add")[1])
+
+    def test_iter_words(self):
+        """
+        Asserts that every kind of source streams the golden words: buffers scanned twice, re-iterable lines, and
+        one-shot iterators of lines, whose records are kept for the second pass.
+        """
+        source, words = self.golden("Pong")
+        lines = source.splitlines(keepends=True)
+        assembler = Assembler()  # Reset by each stream, so that no symbol leaks from one program into the next
+        for name, program in (("str", source), ("bytes", source.encode()), ("bytearray", bytearray(source.encode())),
+                              ("memoryview", memoryview(source.encode())), ("list", lines),
+                              ("iterator", iter(lines)), ("file", io.StringIO(source)),
+                              ("generator", (line for line in lines))):
+            self.assertEqual(array("H", assembler.iter_words(program)), words, name)
+
+    def test_assemble_to(self):
+        source, words = self.golden("Rect")
+        sink = io.BytesIO()
+        Assembler().assemble_to(source, sink, "bin", "big")
+        self.assertEqual(HackFile.parse_rom(sink.getvalue(), "big"), words)
+
+    def test_assemble_bin(self):
+        """
+        Asserts that a program is assembled to a binary ROM image of its golden words, in either byte order, and that
+        write_file refuses any other output extension.
+        """
+        _, words = self.golden("Max")
+        asm_file = os.path.join(PROGRAMS_DIR, "in_asm", "Max.asm")
+        with tempfile.TemporaryDirectory() as out_dir:
+            out_dir = os.path.join(out_dir, "")
+            for byteorder in ("little", "big"):
+                Assembler().assemble(asm_file, out_format="bin", byteorder=byteorder, out_dir=out_dir, verbose=False)
+                with open(os.path.join(out_dir, "Max.bin"), "rb") as file:
+                    data = file.read()
+                self.assertEqual(len(data), 2 * len(words))
+                self.assertEqual(HackFile.parse_rom(data, byteorder), words, byteorder)
+            with self.assertRaises(Exception):
+                Assembler().write_file(words, asm_file, out_filename=os.path.join(out_dir, "Max.txt"))
+
+    def test_diagnostics(self):
+        """
+        Asserts that every error of an invalid program is reported at once, at its line and column.
+        """
+        with self.assertRaises(AssemblyError) as context:
+            Assembler().assemble_source("@2\n  D=D+D\n(LOOP\n@LOOP\nMM=M;JXX\n")
+        self.assertEqual([(diagnostic.line, diagnostic.column, diagnostic.code)
+                          for diagnostic in context.exception.diagnostics],
+                         [(2, 5, "E005"), (3, 1, "E002"), (5, 1, "E004"), (5, 6, "E006")])
+
+    def test_symbol_address_out_of_range(self):
+        """
+        Asserts that labels and variables whose address does not fit in an A instruction are reported as E003
+        Diagnostics at their references, whether assembled in memory or streamed from a file.
+        """
+        source = "@END\n0;JMP\n" + "D=0\n" * 40000 + "(END)\n  @END\n0;JMP\n"
+        with self.assertRaises(AssemblyError) as context:
+            Assembler().assemble_source(source, filename="Long.asm")
+        self.assertEqual([(diagnostic.line, diagnostic.column, diagnostic.code)
+                          for diagnostic in context.exception.diagnostics], [(1, 1, "E003"), (40004, 3, "E003")])
+        self.assertIn("address 40002 of the symbol is larger than 32767", context.exception.diagnostics[0].message)
+
+        with tempfile.TemporaryDirectory() as out_dir:
+            asm_file = os.path.join(out_dir, "Longer.asm")
+            with open(asm_file, "w") as file:
+                file.write("D=0\n" * 0x10000 + "(END)\n@END\n0;JMP\n")  # The label does not even fit in 16 bits
+            with self.assertRaises(AssemblyError) as context:
+                Assembler().assemble(asm_file, out_dir=os.path.join(out_dir, ""), verbose=False, stream=True)
+            self.assertEqual([diagnostic.code for diagnostic in context.exception.diagnostics], ["E003"])
+
+        variables = "".join(f"@v{index}\n" for index in range(Parser.MAX_ADDRESS - 15 + 1))
+        with self.assertRaises(AssemblyError) as context:
+            Assembler().assemble_source(variables)
+        self.assertEqual([diagnostic.line for diagnostic in context.exception.diagnostics], [Parser.MAX_ADDRESS - 14])
+
+    def test_optimize(self):
+        source, words = self.golden("Pong")
+        optimized = Assembler().assemble_source(source, optimize=True)
+        self.assertLess(len(optimized), len(words))
+
+    def test_second_pass_parallel(self):
+        """
+        Asserts that the parallel second pass encodes the same words, and allocates the same variables, as the serial
+        pass, with any number of chunks.
+        """
+        source, words = self.golden("Pong")
+        serial = Assembler()
+        self.assertEqual(serial.assemble_source(source), words)
+        for jobs, chunks_per_job in ((2, 4), (3, 1)):
+            assembler = Assembler()
+            instructions = Parser.tokenize(source.splitlines())
+            assembler.first_pass(instructions)
+            self.assertEqual(assembler.second_pass_parallel(instructions, jobs, chunks_per_job), words)
+            self.assertEqual(assembler.symbol_address, serial.symbol_address)
+
+    def test_stream(self):
+        """
+        Asserts that streaming a plain file from its memory map assembles the golden words, that an empty file streams
+        to no words, and that an invalid program does not leave its partially streamed output behind.
+        """
+        source, words = self.golden("Pong")
+        self.assertEqual(Assembler().assemble_mapped(os.path.join(PROGRAMS_DIR, "in_asm", "Pong.asm")), words)
+        with tempfile.TemporaryDirectory() as out_dir:
+            out_dir = os.path.join(out_dir, "")
+            Assembler().assemble(os.path.join(PROGRAMS_DIR, "in_asm", "Pong.asm"), out_dir=out_dir, verbose=False,
+                                 stream=True)
+            self.assertEqual(HackFile.read_words(os.path.join(out_dir, "Pong.hack")), words)
+
+            empty_file = os.path.join(out_dir, "Empty.asm")
+            open(empty_file, "w").close()
+            self.assertEqual(Assembler().assemble_mapped(empty_file), array("H"))
+
+            bad_file = os.path.join(out_dir, "Bad.asm")
+            with open(bad_file, "w") as file:
+                file.write(source + "D=D+D\n")
+            with self.assertRaises(AssemblyError):
+                Assembler().assemble(bad_file, out_dir=out_dir, verbose=False, stream=True)
+            self.assertFalse(os.path.exists(os.path.join(out_dir, "Bad.hack")))
+
+    def test_compressed_files(self):
+        """
+        Asserts that compressed sources assemble, whole or streamed, to compressed outputs of the golden words.
+        """
+        source, words = self.golden("Rect")
+        with tempfile.TemporaryDirectory() as out_dir:
+            out_dir = os.path.join(out_dir, "")
+            asm_file = os.path.join(out_dir, "Rect.asm.gz")
+            with HackFile.open_file(asm_file, "wt") as file:
+                file.write(source)
+            for compress, stream in (("xz", False), ("gz", True)):
+                Assembler().assemble(asm_file, out_dir=out_dir, verbose=False, stream=stream, compress=compress)
+                self.assertEqual(HackFile.read_words(os.path.join(out_dir, "Rect.hack." + compress)), words)
+
+    def test_main(self):
+        """
+        Asserts that the command line assembles one or many programs, exits with 1 when a program is invalid, and
+        rejects the combinations of flags it cannot honour and the inputs which match no program.
+        """
+        with tempfile.TemporaryDirectory() as out_dir:
+            bad_file = os.path.join(out_dir, "Bad.asm")
+            with open(bad_file, "w") as file:
+                file.write("D=D+D\n")
+            options = ["--out-dir", out_dir, "--no-cache"]
+            with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()) as errors:
+                self.assertEqual(main([os.path.join(PROGRAMS_DIR, "in_asm", "Max.asm")] + options), 0)
+                self.assertEqual(main([os.path.join(PROGRAMS_DIR, "in_asm", "Rect*.asm"), "--format", "bin",
+                                       "--jobs", "2"] + options), 0)
+                self.assertEqual(main([bad_file, "--diagnostics", "json"] + options), 1)
+                for flags in (["--jobs", "0"], ["--optimize", "--stream"], ["--source-map", "--stream"],
+                              ["--pipeline", "--jobs", "2"], ["--queue-depth", "0"]):
+                    with self.assertRaises(SystemExit, msg=flags):
+                        main([os.path.join(PROGRAMS_DIR, "in_asm", "Max.asm")] + flags + options)
+                with self.assertRaises(SystemExit) as context:
+                    main([os.path.join(out_dir, "Missing*.asm")] + options)
+            self.assertEqual(HackFile.read_words(os.path.join(out_dir, "Max.hack")), self.golden("Max")[1])
+            self.assertEqual(HackFile.read_words(os.path.join(out_dir, "RectL.bin")), self.golden("RectL")[1])
+            self.assertIn('"code": "E005"', errors.getvalue())
+            self.assertEqual(context.exception.code, 2)
+            self.assertIn(f"error: No '.asm' file matches {os.path.join(out_dir, 'Missing*.asm')}\n", errors.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from Assembler.Batch import Batch
+from Assembler.Cache import AssemblyCache
+from Assembler.HackFile import HackFile
+
+PROGRAMS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Assembler")
+
+
+class TestBatchClass(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.in_dir = os.path.join(self.temp_dir, "in_asm")
+        self.out_dir = os.path.join(self.temp_dir, "out_hack", "")
+        os.makedirs(self.out_dir)
+        shutil.copytree(os.path.join(PROGRAMS_DIR, "in_asm"), self.in_dir)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir)
+
+    def assert_golden(self, names):
+        for name in names:
+            self.assertEqual(HackFile.read_words(os.path.join(self.out_dir, name + ".hack")),
+                             HackFile.read_words(os.path.join(PROGRAMS_DIR, "out_hack", name + ".hack")), name)
+
+    def test_expand_inputs(self):
+        os.rename(os.path.join(self.in_dir, "Max.asm"), os.path.join(self.in_dir, "Max.asm.gz"))
+        asm_files = [os.path.basename(asm_file) for asm_file in Batch.expand_inputs([self.in_dir])]
+        self.assertEqual(asm_files, ["Add.asm", "Max.asm.gz", "MaxL.asm", "Pong.asm", "PongL.asm", "Rect.asm",
+                                     "RectL.asm"])
+
+    def test_expand_globs(self):
+        asm_files = Batch.expand_inputs([os.path.join(self.in_dir, "Max*.asm"), os.path.join(self.in_dir, "Max.asm")])
+        self.assertEqual([os.path.basename(asm_file) for asm_file in asm_files], ["Max.asm", "MaxL.asm"])
+        with self.assertRaises(FileNotFoundError):
+            Batch.expand_inputs([os.path.join(self.in_dir, "Missing*.asm")])
+
+    def test_assemble_batch(self):
+        """
+        Asserts that a pool of worker processes writes the golden outputs, and reports its results in the order of the
+        programs, failures included.
+        """
+        asm_files = Batch.expand_inputs([self.in_dir]) + [os.path.join(self.in_dir, "Missing.asm")]
+        results = Batch.assemble_batch(asm_files, self.out_dir, jobs=2)
+        self.assertEqual([asm_file for asm_file, _, _ in results], asm_files)
+        self.assertEqual([error is None for _, _, error in results], [True] * 7 + [False])
+        self.assert_golden(["Add", "Max", "MaxL", "Pong", "PongL", "Rect", "RectL"])
+        summary = Batch.summary(results, 1.5).splitlines()
+        self.assertEqual(summary[0], "Assembled 8 files in 1.500s (7 succeeded, 1 failed)")
+        self.assertTrue(summary[-1].startswith("    FAILED  " + asm_files[-1] + ": FileNotFoundError"))
+
+    def test_pipeline_matches_batch(self):
+        """
+        Asserts that the pipeline writes the golden outputs, and reports its results in the order of the programs.
+        """
+        asm_files = Batch.expand_inputs([self.in_dir])
+        results, stats = Batch.assemble_pipeline(asm_files, self.out_dir, read_depth=2, write_depth=1)
+        self.assertEqual([(asm_file, error) for asm_file, _, error in results],
+                         [(asm_file, None) for asm_file in asm_files])
+        self.assert_golden(["Add", "Max", "Pong", "RectL"])
+        self.assertEqual(set(stats["utilization"]), {"read", "assemble", "write"})
+        self.assertLessEqual(stats["queues"]["read"]["max"], 2)
+        self.assertLessEqual(stats["queues"]["write"]["max"], 1)
+
+    def test_pipeline_errors_and_cache(self):
+        bad_file = os.path.join(self.in_dir, "Bad.asm")
+        with open(bad_file, "w") as file:
+            file.write("@2\nD=D+D\n")
+        asm_files = [os.path.join(self.in_dir, "Max.asm"), bad_file, os.path.join(self.in_dir, "Missing.asm"),
+                     os.path.join(self.in_dir, "Rect.asm")]
+        cache = AssemblyCache(os.path.join(self.temp_dir, "cache"))
+        for _ in range(2):  # Assembled, then fetched from the cache
+            results = Batch.assemble_pipeline(asm_files, self.out_dir, cache=cache)[0]
+            errors = [error for _, _, error in results]
+            self.assertEqual((errors[0], errors[3]), (None, None))
+            self.assertIn("Bad.asm:2:3: error[E005]", errors[1].format())
+            self.assertTrue(errors[2].startswith("FileNotFoundError"))
+            self.assert_golden(["Max", "Rect"])
+        self.assertEqual((cache.hits, cache.misses), (2, 4))
+
+    def test_pipeline_reader_failure(self):
+        """
+        Asserts that an exception of the reader outside of a single program is re-raised by the pipeline, once the
+        programs read before it are written, instead of leaving the pipeline waiting for the next source.
+        """
+        with self.assertRaises(TypeError):
+            Batch.assemble_pipeline([os.path.join(self.in_dir, "Max.asm"), None], self.out_dir)
+        self.assert_golden(["Max"])
+
+    def test_diagnostics(self):
+        """
+        Asserts that the Diagnostics of the invalid programs of a batch are kept, to be formatted as requested.
+        """
+        bad_files = []
+        for name, source in (("Bad1.asm", "D=D+D\n"), ("Bad2.asm", "@1\nMM=1\n0;JXX\n")):
+            bad_files.append(os.path.join(self.in_dir, name))
+            with open(bad_files[-1], "w") as file:
+                file.write(source)
+        results = Batch.assemble_batch([bad_files[0], os.path.join(self.in_dir, "Add.asm"), bad_files[1]],
+                                       self.out_dir)
+        self.assertEqual([diagnostic["code"] for diagnostic in json.loads(Batch.diagnostics(results, "json"))],
+                         ["E005", "E004", "E006"])
+        self.assertEqual(len(Batch.diagnostics(results).splitlines()), 3)
+        self.assertIn("FAILED  " + bad_files[1] + ": 2 errors", Batch.summary(results, 0.0))
+        self.assertIsNone(Batch.diagnostics(results[1:2]))
+
+
+if __name__ == "__main__":
+    unittest.main()
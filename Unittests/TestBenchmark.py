@@ -0,0 +1,87 @@
+import contextlib
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from Assembler.Benchmark import Benchmark, main
+from Assembler.Parser import Parser
+
+PROGRAMS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Assembler")
+
+
+class TestBenchmarkClass(unittest.TestCase):
+
+    @staticmethod
+    def result(program, lines_per_second, total_seconds=1.0):
+        return {"program": program, "lines_per_second": lines_per_second, "total_seconds": total_seconds}
+
+    def test_benchmark_program(self):
+        result = Benchmark.benchmark_program(os.path.join(PROGRAMS_DIR, "in_asm", "Max.asm"), repeat=2,
+                                             golden_filename=os.path.join(PROGRAMS_DIR, "out_hack", "Max.hack"))
+        self.assertEqual((result["program"], result["instructions"]), ("Max.asm", 16))
+        self.assertEqual(list(result["seconds"]), Benchmark.STAGES)
+        self.assertTrue(result["matches_golden"])
+        self.assertGreater(result["peak_memory_bytes"], 0)
+
+        result["matches_golden"] = False
+        lines = Benchmark.report([result]).splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[1].startswith("Max.asm") and lines[1].endswith("DIFF"))
+
+    def test_write_scaled_program(self):
+        with tempfile.TemporaryDirectory() as scaled_dir:
+            scaled_filename = os.path.join(scaled_dir, "Max100.asm")
+            Benchmark.write_scaled_program(os.path.join(PROGRAMS_DIR, "in_asm", "Max.asm"), 100, scaled_filename)
+            with open(scaled_filename) as file:
+                instructions = Parser.tokenize(file.read().splitlines())
+        self.assertEqual(sum(1 for instruction in instructions if instruction[0] != Parser.LABEL), 112)  # 7 copies
+
+    def test_regressions(self):
+        """
+        Asserts that only the programs slower than the baseline beyond the threshold are reported, skipping new and
+        too fast programs.
+        """
+        baseline = [self.result("Pong.asm", 1000), self.result("Rect.asm", 1000),
+                    self.result("Add.asm", 1000, total_seconds=0.0001)]
+        results = [self.result("Pong.asm", 850), self.result("Rect.asm", 950), self.result("Add.asm", 10),
+                   self.result("New.asm", 1)]
+        messages = Benchmark.regressions(results, baseline, threshold=0.1)
+        self.assertEqual(len(messages), 1)
+        self.assertTrue(messages[0].startswith("Pong.asm: 850 lines/s is 15.0% slower"))
+
+    def test_compression(self):
+        compression = Benchmark.compression(os.path.join(PROGRAMS_DIR, "in_asm", "Pong.asm"), repeat=1)
+        self.assertEqual([result["compression"] for result in compression], ["none", ".gz", ".xz"])
+        self.assertTrue(all(result["round_trip"] for result in compression))
+        self.assertLess(compression[1]["hack_bytes"], compression[0]["hack_bytes"])
+        self.assertNotIn("DIFF", Benchmark.compression_report(compression))
+
+    def test_main(self):
+        """
+        Asserts that the command line passes against its own results, and fails against a much faster baseline.
+        """
+        with tempfile.TemporaryDirectory() as out_dir:
+            for name in ("Max.asm", "Rect.asm"):
+                shutil.copy(os.path.join(PROGRAMS_DIR, "in_asm", name), out_dir)
+            options = ["--in-dir", out_dir, "--scaled", "--repeat", "1", "--no-startup", "--emulator-cycles", "0",
+                       "--no-compression"]
+            output = os.path.join(out_dir, "results.json")
+            with contextlib.redirect_stdout(io.StringIO()) as report:
+                self.assertEqual(main(options + ["--output", output]), 0)
+                with open(output) as file:
+                    results = json.load(file)
+                for result in results:
+                    result["lines_per_second"] *= 100
+                    result["total_seconds"] = 1.0
+                with open(output, "w") as file:
+                    json.dump(results, file)
+                self.assertEqual(main(options + ["--baseline", output]), 1)
+        self.assertEqual([result["program"] for result in results], ["Max.asm", "Rect.asm"])
+        self.assertIn("FAIL Rect.asm", report.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
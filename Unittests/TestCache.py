@@ -0,0 +1,70 @@
+import os
+import tempfile
+import time
+import unittest
+
+from Assembler.Assembler import Assembler, __version__
+from Assembler.Cache import AssemblyCache
+
+
+class TestAssemblyCacheClass(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.temp_dir.name, "cache")
+        self.asm_file = os.path.join(self.temp_dir.name, "Add.asm")
+        self.out_file = os.path.join(self.temp_dir.name, "Add.hack")
+        with open(self.asm_file, "w") as file:
+            file.write("@2\nD=A\n")
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_key_changes_with_source_version_and_options(self):
+        cache = AssemblyCache(self.cache_dir, version="1")
+        key = cache.key(self.asm_file, "hack")
+        self.assertEqual(key, cache.key(self.asm_file, "hack"))
+        self.assertNotEqual(key, cache.key(self.asm_file, "bin"))
+        self.assertNotEqual(key, AssemblyCache(self.cache_dir, version="2").key(self.asm_file, "hack"))
+        with open(self.asm_file, "a") as file:
+            file.write("@3\n")
+        self.assertNotEqual(key, cache.key(self.asm_file, "hack"))
+
+    def test_fingerprint(self):
+        """
+        Asserts that the version of the Assembler in the keys changes with the code of the modules producing its output.
+        """
+        fingerprint = AssemblyCache.fingerprint([self.asm_file])
+        self.assertEqual(fingerprint, AssemblyCache.fingerprint([self.asm_file]))
+        with open(self.asm_file, "a") as file:
+            file.write("@3\n")
+        self.assertNotEqual(fingerprint, AssemblyCache.fingerprint([self.asm_file]))
+        self.assertTrue(Assembler.cache_version().startswith(__version__ + "+"))
+
+    def test_fetch_after_store_refreshes_output(self):
+        cache = AssemblyCache(self.cache_dir)
+        key = cache.key(self.asm_file)
+        self.assertFalse(cache.fetch(key, self.out_file))
+
+        with open(self.out_file, "w") as file:
+            file.write("0000000000000010\n")
+        cache.store(key, self.out_file)
+        os.remove(self.out_file)
+
+        self.assertTrue(cache.fetch(key, self.out_file))
+        with open(self.out_file) as file:
+            self.assertEqual(file.read(), "0000000000000010\n")
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_evicts_least_recently_used_entries(self):
+        cache = AssemblyCache(self.cache_dir, max_bytes=34)
+        with open(self.out_file, "w") as file:
+            file.write("0000000000000010\n")  # 17 bytes, so only two entries fit in the cache
+        for key in ("a", "b", "c"):
+            cache.store(key, self.out_file)
+            time.sleep(0.01)
+        self.assertEqual(sorted(os.listdir(self.cache_dir)), ["b", "c"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,6 +9,47 @@ class TestParserClass(unittest.TestCase):
     def setUpClass(cls) -> None:
         cls.var = "Hello World"
 
+    def test_encode_c_instruction(self):
+        """
+        Asserts that C instructions are encoded into their final 16-bit words, in every combination of dest=comp;jump.
+        """
+        self.assertEqual(Code.encode_c_instruction("D=A"), 0b1110110000010000)
+        self.assertEqual(Code.encode_c_instruction("M=D"), 0b1110001100001000)
+        self.assertEqual(Code.encode_c_instruction("0;JMP"), 0b1110101010000111)
+        self.assertEqual(Code.encode_c_instruction("AM=M-1"), 0b1111110010101000)
+        self.assertEqual(Code.encode_c_instruction("AMD=D|M;JLT"), 0b1111010101111100)
+
+    def test_encode_c_instruction_alternate_orderings(self):
+        """
+        Asserts that alternate operand orderings of commutative Comp codes, and alternate orderings of the Dest
+        registers, are encoded the same as their canonical spellings.
+        """
+        self.assertEqual(Code.encode_c_instruction("D=A+D"), Code.encode_c_instruction("D=D+A"))
+        self.assertEqual(Code.encode_c_instruction("M=M|D"), Code.encode_c_instruction("M=D|M"))
+        self.assertEqual(Code.encode_c_instruction("D=1+M;JGT"), Code.encode_c_instruction("D=M+1;JGT"))
+        self.assertEqual(Code.encode_c_instruction("DM=M+1"), Code.encode_c_instruction("MD=M+1"))
+        self.assertEqual(Code.encode_c_instruction("DMA=0"), Code.encode_c_instruction("AMD=0"))
+
+    def test_encode_c_instruction_invalid_comp(self):
+        with self.assertRaises(ValueError):
+            Code.encode_c_instruction("D=A+M")
+
+    def test_invalid_fields(self):
+        self.assertEqual(Code.invalid_fields("DM", "A+D", "JMP"), [])
+        self.assertEqual(Code.invalid_fields("MM", "D+D", "JXX"), [("dest", "Invalid Dest code \"MM\""),
+                                                                 ("comp", "Invalid Comp code \"D+D\""),
+                                                                 ("jump", "Invalid Jump code \"JXX\"")])
+
+    def test_table_module_is_up_to_date(self):
+        """
+        Asserts that the generated CodeTable module holds the word of every legal spelling, as computed from the Code
+        tables (regenerate it with 'python Code.py' otherwise).
+        """
+        from Assembler.CodeTable import C_INSTRUCTION_WORDS
+
+        words = Code._build_c_instruction_words()
+        self.assertEqual({instruction: C_INSTRUCTION_WORDS.get(instruction) for instruction in words}, words)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,23 @@
+import json
+import unittest
+
+from Assembler.Diagnostics import Diagnostic, AssemblyError
+
+
+class TestDiagnosticsClass(unittest.TestCase):
+
+    def test_locate_column(self):
+        self.assertEqual(Diagnostic.locate_column("  AMD = D|M ; JLT\n", 0), 3)
+        self.assertEqual(Diagnostic.locate_column("  AMD = D|M ; JLT\n", 4), 9)
+        self.assertEqual(Diagnostic.locate_column("  AMD = D|M ; JLT\n", 8), 15)
+
+    def test_assembly_error_formats(self):
+        error = AssemblyError([Diagnostic("Max.asm", 9, 1, "E006", "Invalid Jump code \"JXX\""),
+                               Diagnostic("Max.asm", 3, 5, "E005", "Invalid Comp code \"D+D\"")])
+        self.assertEqual(str(error), "Max.asm:3:5: error[E005]: Invalid Comp code \"D+D\"\n"
+                                     "Max.asm:9:1: error[E006]: Invalid Jump code \"JXX\"")
+        self.assertEqual([diagnostic["line"] for diagnostic in json.loads(error.format("json"))], [3, 9])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from array import array
+
+from Assembler.Assembler import Assembler
+from Assembler.Disassembler import Disassembler, main
+from Assembler.HackFile import HackFile
+
+PROGRAMS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Assembler")
+
+
+class TestDisassemblerClass(unittest.TestCase):
+
+    def test_disassemble(self):
+        words = array("H", [2, 0b1110110000010000, 0b1111110010101000, 0b1110001100000001])
+        self.assertEqual(Disassembler.disassemble(words), ["@2", "D=A", "AM=M-1", "D;JGT"])
+        with self.assertRaises(ValueError):
+            Disassembler.disassemble(array("H", [0b1000000000000000]))
+
+    def test_disassemble_every_word(self):
+        """
+        Asserts that the vectorized lookup (for arrays, if NumPy is installed) and the plain lookup (for other
+        sequences) agree on every valid word, and that every valid word re-assembles to itself.
+        """
+        table = Disassembler.instruction_table()
+        words = array("H", [word for word in range(0x10000) if table[word] is not None])
+        instructions = Disassembler.disassemble(words)
+        self.assertEqual(instructions, Disassembler.disassemble(words.tolist()))
+        self.assertEqual(Assembler().assemble_source(instructions), words)
+
+    def test_round_trip(self):
+        with open(os.path.join(PROGRAMS_DIR, "in_asm", "Pong.asm")) as file:
+            words = Assembler().assemble_source(file)
+        self.assertEqual(Assembler().assemble_source(Disassembler.disassemble_text(words)), words)
+
+    def test_verify(self):
+        self.assertEqual(Disassembler.verify(os.path.join(PROGRAMS_DIR, "in_asm", "Max.asm"),
+                                             os.path.join(PROGRAMS_DIR, "out_hack", "Max.hack")), [])
+
+    def test_verify_mismatch(self):
+        words = HackFile.read_words(os.path.join(PROGRAMS_DIR, "out_hack", "Max.hack"))
+        words[3] ^= 1  # Still a valid instruction, but not the one of the source
+        with tempfile.TemporaryDirectory() as golden_dir:
+            hack_file = os.path.join(golden_dir, "Max.hack")
+            HackFile.write_text(words, hack_file)
+            messages = Disassembler.verify(os.path.join(PROGRAMS_DIR, "in_asm", "Max.asm"), hack_file)
+            self.assertEqual(messages, [f"{hack_file}: assembling the source differs first at ROM[3] (16 words "
+                                        f"instead of 16)"])
+            self.assertTrue(Disassembler.verify(os.path.join(golden_dir, "Missing.asm"), hack_file)[0].endswith(
+                "no source " + os.path.join(golden_dir, "Missing.asm") + " to verify against"))
+
+    def test_verify_corrupt_programs(self):
+        """
+        Asserts that a golden program with an invalid word or a malformed line, or a source which does not assemble, is
+        reported as a failure without stopping the verification of the other programs.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            golden_dir = os.path.join(temp_dir, "out_hack")
+            in_dir = os.path.join(temp_dir, "in_asm")
+            os.makedirs(golden_dir)
+            shutil.copytree(os.path.join(PROGRAMS_DIR, "in_asm"), in_dir)
+            for name in ("Add", "Max", "Pong", "Rect"):
+                shutil.copy(os.path.join(PROGRAMS_DIR, "out_hack", name + ".hack"), golden_dir)
+            with open(os.path.join(golden_dir, "Add.hack"), "a") as file:
+                file.write("1000000000000000\n")  # Not a valid instruction
+            with open(os.path.join(golden_dir, "Rect.hack"), "a") as file:
+                file.write("not a word\n")
+            with open(os.path.join(in_dir, "Max.asm"), "a") as file:
+                file.write("D=D+D\n")
+
+            messages = Disassembler.verify(os.path.join(in_dir, "Add.asm"), os.path.join(golden_dir, "Add.hack"))
+            self.assertEqual(len(messages), 2)
+            self.assertIn("cannot be disassembled: ROM[6]", messages[0])
+            with contextlib.redirect_stdout(io.StringIO()) as output:
+                self.assertEqual(main(["--verify", "--golden-dir", golden_dir, "--in-dir", in_dir]), 1)
+        lines = output.getvalue().splitlines()
+        self.assertEqual([line.split()[0] for line in lines[:4]], ["FAIL", "FAIL", "ok", "FAIL"])
+        self.assertIn("Max.asm does not assemble", output.getvalue())
+        self.assertIn("Rect.hack: cannot be read", output.getvalue())
+
+    def test_main(self):
+        """
+        Asserts that the command line disassembles compressed binary ROM images to stdout, or to '.asm' files.
+        """
+        words = HackFile.read_words(os.path.join(PROGRAMS_DIR, "out_hack", "Rect.hack"))
+        with tempfile.TemporaryDirectory() as out_dir:
+            rom_file = os.path.join(out_dir, "Rect.bin.gz")
+            HackFile.write_rom(words, rom_file, "big")
+            with contextlib.redirect_stdout(io.StringIO()) as output:
+                self.assertEqual(main([rom_file, "--byteorder", "big"]), 0)
+            self.assertEqual(main([rom_file, "--byteorder", "big", "--out-dir", out_dir]), 0)
+            with open(os.path.join(out_dir, "Rect.asm")) as file:
+                self.assertEqual(file.read(), output.getvalue())
+        self.assertEqual(Assembler().assemble_source(output.getvalue()), words)
+
+    def test_verify_command(self):
+        """
+        Asserts that --verify checks the programs in every output format, and fails when there is nothing to verify.
+        """
+        words = HackFile.read_words(os.path.join(PROGRAMS_DIR, "out_hack", "Max.hack"))
+        with tempfile.TemporaryDirectory() as golden_dir:
+            with contextlib.redirect_stdout(io.StringIO()) as output:
+                self.assertEqual(main(["--verify", "--golden-dir", golden_dir]), 1)
+                HackFile.write_rom(words, os.path.join(golden_dir, "Max.bin.gz"), "big")
+                HackFile.write_text(words, os.path.join(golden_dir, "Rect.hack"))  # Not the words of Rect.asm
+                self.assertEqual(main(["--verify", "--golden-dir", golden_dir, "--byteorder", "big"]), 1)
+                os.remove(os.path.join(golden_dir, "Rect.hack"))
+                self.assertEqual(main(["--verify", "--golden-dir", golden_dir, "--byteorder", "big"]), 0)
+        lines = output.getvalue().splitlines()
+        self.assertTrue(lines[0].startswith("No '.hack' or '.bin' program to verify"))
+        self.assertEqual([line.split()[0] for line in lines[1:3]], ["ok", "FAIL"])
+        self.assertTrue(lines[-1].startswith("  ok") and lines[-1].endswith("Max.bin.gz"))
+
+
+if __name__ == "__main__":
+    unittest.main()
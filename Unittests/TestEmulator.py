@@ -0,0 +1,83 @@
+import os
+import unittest
+from array import array
+
+from Assembler.Assembler import Assembler
+from Assembler.Code import Code
+from Assembler.Emulator import Emulator
+
+PROGRAMS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Assembler")
+
+
+class TestEmulatorClass(unittest.TestCase):
+
+    @staticmethod
+    def alu(word, d, a, m):
+        """
+        The reference ALU of the Hack CPU, computed from the zx, nx, zy, ny, f and no bits of a C instruction word.
+        """
+        x, y = d, (m if word & 0x1000 else a)
+        if word & 0x800:
+            x = 0
+        if word & 0x400:
+            x ^= 0xFFFF
+        if word & 0x200:
+            y = 0
+        if word & 0x100:
+            y ^= 0xFFFF
+        out = (x + y) & 0xFFFF if word & 0x80 else x & y
+        return out ^ 0xFFFF if word & 0x40 else out
+
+    def test_comp_codes(self):
+        """
+        Asserts that the handler of every Comp code computes what the Hack ALU does.
+        """
+        self.assertEqual(set(Emulator._comp_expressions), set(Code._comp_codes))
+        for comp in Code._comp_codes:
+            word = Code.encode_c_fields("D", comp, None)
+            for d, a, m in ((0, 0, 0), (5, 3, 9), (0xFFFF, 1, 0x8000), (0x7FFF, 0x8000, 2)):
+                ram = array("H", [0] * (a + 1))
+                ram[a] = m
+                handler = Emulator.c_handler_factory(word)(ram)
+                self.assertEqual(handler(a, d, 0), (a, self.alu(word, d, a, m), 1), comp)
+
+    def test_run_max(self):
+        emulator = Emulator.from_file(os.path.join(PROGRAMS_DIR, "out_hack", "Max.hack"))
+        emulator.ram[0], emulator.ram[1] = 3, 0xFFF9  # R0 = 3, R1 = -7
+        emulator.run()
+        self.assertTrue(emulator.halted)
+        self.assertEqual(emulator.snapshot(0, 3), array("H", [3, 0xFFF9, 3]))
+
+    def test_run_rect(self):
+        """
+        Asserts that Rect draws a rectangle 16 pixels wide and R0 rows high at the top left corner of the screen.
+        """
+        emulator = Emulator.from_file(os.path.join(PROGRAMS_DIR, "out_hack", "Rect.hack"))
+        emulator.ram[0] = 4
+        emulator.run()
+        self.assertTrue(emulator.halted)
+        screen = emulator.screen()
+        self.assertEqual([screen[row * 32] for row in range(6)], [0xFFFF] * 4 + [0, 0])
+        self.assertEqual(sum(1 for word in screen if word), 4)
+
+    def test_cycle_limit_and_snapshot(self):
+        with open(os.path.join(PROGRAMS_DIR, "in_asm", "Pong.asm")) as file:
+            emulator = Emulator(Assembler().assemble_source(file))
+        self.assertEqual(emulator.run(1000), 1000)
+        snapshot = emulator.snapshot()
+        self.assertEqual(emulator.run(500), 500)
+        self.assertEqual((emulator.cycles, emulator.halted), (1500, False))
+        emulator.restore(snapshot)
+        self.assertEqual(emulator.snapshot(), snapshot)
+
+    def test_invalid_programs(self):
+        with self.assertRaises(ValueError):
+            Emulator(array("H", [0b1000000000000000]))
+        emulator = Emulator(Assembler().assemble_source(["@32767", "D=A", "@0", "A=D+A", "A=A+1", "M=1"]))
+        with self.assertRaises(ValueError):
+            emulator.run()
+        self.assertEqual((emulator.pc, emulator.cycles), (5, 5))
+
+
+if __name__ == "__main__":
+    unittest.main()
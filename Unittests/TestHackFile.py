@@ -0,0 +1,89 @@
+import io
+import os
+import tempfile
+import unittest
+from array import array
+
+from Assembler.HackFile import HackFile
+
+
+class TestHackFileClass(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.words = array("H", [2, 0b1110110000010000, 0xFFFF])
+
+    def test_render_text(self):
+        self.assertEqual(HackFile.render_text(self.words), "0000000000000010\n1110110000010000\n1111111111111111\n")
+        self.assertEqual(HackFile.render_text(array("H")), "")
+
+    def test_render_bulk(self):
+        words = array("H", range(0, 0x10000, 7))
+        expected = "".join(f"{word:016b}\n" for word in words).encode()
+        HackFile.numpy()  # Once NumPy is imported, it vectorizes conversions of more than a few hundred words
+        self.assertEqual(HackFile.render(words), expected)  # Vectorized, if NumPy is installed
+        self.assertEqual(HackFile.render(list(words)), expected)  # Byte lookup table
+
+    def test_write_text_to_text_and_binary_sinks(self):
+        text_sink = io.StringIO()
+        HackFile.write(self.words, text_sink)
+        binary_sink = io.BytesIO()
+        HackFile.write(self.words, binary_sink)
+        self.assertEqual(text_sink.getvalue(), HackFile.render_text(self.words))
+        self.assertEqual(binary_sink.getvalue(), HackFile.render_text(self.words).encode())
+
+    def test_write_rom_byteorder(self):
+        little = io.BytesIO()
+        HackFile.write(self.words, little, "bin", "little")
+        big = io.BytesIO()
+        HackFile.write(self.words, big, "bin", "big")
+        self.assertEqual(little.getvalue(), b"\x02\x00\x10\xec\xff\xff")
+        self.assertEqual(big.getvalue(), b"\x00\x02\xec\x10\xff\xff")
+
+    def test_write_generator(self):
+        """
+        Asserts that a generator of words is written as it is consumed, one write per buffer of words, to the same
+        output as its array.
+        """
+        words = array("H", range(0, 0x10000, 3))
+        for out_format in ("hack", "bin"):
+            expected = io.BytesIO()
+            HackFile.write(words, expected, out_format, "big")
+            sink = io.BytesIO()
+            writes = []
+            sink.write = lambda data, write=sink.write: writes.append(len(data)) or write(data)
+            HackFile.write((word for word in words), sink, out_format, "big")
+            self.assertEqual(sink.getvalue(), expected.getvalue(), out_format)
+            self.assertEqual(len(writes), -(-len(words) // HackFile.STREAM_BUFFER_WORDS))
+        sink = io.BytesIO()
+        HackFile.write(iter(()), sink)
+        self.assertEqual(sink.getvalue(), b"")
+
+    def test_parse_text(self):
+        text = HackFile.render_text(self.words)
+        self.assertEqual(HackFile.parse_text(text), self.words)
+        self.assertEqual(HackFile.parse_text(text.encode()), self.words)
+        self.assertEqual(HackFile.parse_text(text.replace("\n", "\r\n")), self.words)
+        self.assertEqual(HackFile.parse_text(""), array("H"))
+
+    def test_parse_rom(self):
+        self.assertEqual(HackFile.parse_rom(b"\x02\x00\x10\xec\xff\xff", "little"), self.words)
+        self.assertEqual(HackFile.parse_rom(b"\x00\x02\xec\x10\xff\xff", "big"), self.words)
+
+    def test_compressed_files(self):
+        self.assertEqual((HackFile.compression("Pong.hack.gz"), HackFile.compression("Pong.hack")), (".gz", None))
+        self.assertEqual(HackFile.uncompressed_name("Pong.bin.xz"), "Pong.bin")
+        with tempfile.TemporaryDirectory() as out_dir:
+            for name in ("Add.hack.gz", "Add.hack.xz", "Add.bin.gz"):
+                out_filename = os.path.join(out_dir, name)
+                if ".bin" in name:
+                    HackFile.write_rom(self.words, out_filename, "big")
+                else:
+                    HackFile.write_text(self.words, out_filename)
+                self.assertEqual(HackFile.read_words(out_filename, "big"), self.words, name)
+                with open(out_filename, "rb") as file:
+                    self.assertNotIn(b"0000000000000010", file.read())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+from Assembler.Assembler import Assembler
+from Assembler.HackFile import HackFile
+from Assembler.Linker import ObjectModule, Linker, main
+from Assembler.SourceMap import SourceMap
+
+PROGRAMS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Assembler")
+
+
+class TestLinkerClass(unittest.TestCase):
+
+    def test_link_matches_assembling_the_concatenation(self):
+        """
+        Asserts that linking separately assembled modules produces the same words as assembling their concatenation,
+        with labels exported across modules and variables allocated in first-seen order.
+        """
+        main = ["@i", "M=0", "@Sys.init", "0;JMP", "(END)", "@END", "0;JMP"]
+        sys_module = ["(Sys.init)", "@j", "M=1", "@i", "M=M+1", "@END", "0;JMP"]
+        modules = [ObjectModule.from_source(main, "Main.asm"), ObjectModule.from_source(sys_module, "Sys.asm")]
+        words, symbol_table = Linker.link(modules)
+        self.assertEqual(words, Assembler().assemble_source(main + sys_module))
+        self.assertEqual((symbol_table["i"], symbol_table["j"], symbol_table["Sys.init"]), (16, 17, 6))
+
+    def test_link_pong_modules(self):
+        """
+        Asserts that Pong.asm, cut into modules anywhere, links to its golden words.
+        """
+        with open(os.path.join(PROGRAMS_DIR, "in_asm", "Pong.asm")) as file:
+            lines = file.readlines()
+        golden = HackFile.read_words(os.path.join(PROGRAMS_DIR, "out_hack", "Pong.hack"))
+        for num_modules in (2, 5):
+            size = -(-len(lines) // num_modules)
+            modules = [ObjectModule.from_source(lines[start:start + size], f"Pong{start}.asm")
+                       for start in range(0, len(lines), size)]
+            self.assertEqual(Linker.link(modules)[0], golden, num_modules)
+
+    def test_object_module_round_trip(self):
+        module = ObjectModule.from_source(["(LOOP)", "@x", "M=D", "@LOOP", "0;JMP"], "Loop.asm")
+        self.assertEqual(ObjectModule.from_dict(module.to_dict()).to_dict(), module.to_dict())
+        self.assertEqual(module.fixups, [(0, "x"), (2, "LOOP")])
+        self.assertEqual(module.variables, ["x"])
+        with tempfile.TemporaryDirectory() as out_dir:
+            object_filename = os.path.join(out_dir, "Loop" + ObjectModule.EXTENSION)
+            module.write(object_filename)
+            self.assertEqual(ObjectModule.read(object_filename).to_dict(), module.to_dict())
+        with self.assertRaises(ValueError):
+            ObjectModule.from_dict(dict(module.to_dict(), version=ObjectModule.FORMAT_VERSION + 1))
+
+    def test_build_is_incremental(self):
+        """
+        Asserts that build only assembles the modules whose source is newer than their '.hobj', and that the command
+        line links them to the program and its source map.
+        """
+        main_module = "@i\nM=0\n@Sys.init\n0;JMP\n"
+        sys_module = "(Sys.init)\n@i\nM=M+1\n@Sys.init\n0;JMP\n"
+        with tempfile.TemporaryDirectory() as out_dir:
+            asm_files = [os.path.join(out_dir, "Main.asm"), os.path.join(out_dir, "Sys.asm")]
+            for asm_file, source in zip(asm_files, (main_module, sys_module)):
+                with open(asm_file, "w") as file:
+                    file.write(source)
+            self.assertEqual(Linker.build(asm_files, out_dir)[1], asm_files)
+            self.assertEqual(Linker.build(asm_files, out_dir)[1], [])
+            later = os.path.getmtime(Linker.object_filename(asm_files[1], out_dir)) + 1
+            os.utime(asm_files[1], (later, later))
+            modules, assembled = Linker.build(asm_files, out_dir)
+            self.assertEqual(assembled, asm_files[1:])
+            self.assertEqual(Linker.link(modules)[0], Assembler().assemble_source(main_module + sys_module))
+
+            output = os.path.join(out_dir, "Program.bin")
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.assertEqual(main(["build", *asm_files, "--out-dir", out_dir, "-o", output, "--byteorder", "big",
+                                       "--source-map"]), 0)
+            self.assertEqual(HackFile.read_words(output, "big"), Assembler().assemble_source(main_module + sys_module))
+            self.assertTrue(os.path.exists(SourceMap.map_filename(output)))
+
+
+if __name__ == "__main__":
+    unittest.main()
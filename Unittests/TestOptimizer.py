@@ -0,0 +1,70 @@
+import os
+import unittest
+
+from Assembler.Assembler import Assembler
+from Assembler.Emulator import Emulator
+from Assembler.Optimizer import Optimizer
+from Assembler.Parser import Parser
+
+PROGRAMS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Assembler")
+
+
+class TestOptimizerClass(unittest.TestCase):
+
+    @staticmethod
+    def optimize(source):
+        instructions, removed = Optimizer.optimize(Parser.tokenize(source.split()))
+        return [instruction[1] if instruction[0] == Parser.C else instruction for instruction in instructions], removed
+
+    def test_redundant_and_dead_a_instructions(self):
+        self.assertEqual(self.optimize("@SP M=M+1 @SP D=M @1 @2 D=A"),
+                         ([(Parser.A_SYMBOL, "SP"), "M=M+1", "D=M", (Parser.A_ADDRESS, 2), "D=A"], 2))
+        # A is unknown after a label, and after a C instruction writing A
+        self.assertEqual(self.optimize("@SP A=M @SP D=M (LOOP) @SP D=M")[1], 0)
+
+    def test_collapse_push_then_pop(self):
+        self.assertEqual(self.optimize("@SP AM=M+1 A=A-1 M=D @SP AM=M-1 D=M"),
+                         ([(Parser.A_SYMBOL, "SP"), "A=M", "M=D"], 4))
+
+    def test_jump_to_next_instruction(self):
+        self.assertEqual(self.optimize("@NEXT 0;JMP (NEXT) @1 D=A"),
+                         ([(Parser.LABEL, "NEXT"), (Parser.A_ADDRESS, 1), "D=A"], 2))
+        self.assertEqual(self.optimize("@NEXT D;JGT (NEXT) D=M")[1], 1)  # The target reads M, so A is kept
+
+    def test_literal_jump_targets(self):
+        """
+        Asserts that jumps to literal addresses still reach their targets once instructions are removed before them.
+        """
+        source = "@1 @0 D=A @SP M=D @SP D=M @6 0;JMP"
+        words = Assembler().assemble_source(source.split(), optimize=True)
+        # "@1" is dead, and both "@SP" are redundant (A already holds 0), so "D=M" moves from address 6 to 3
+        self.assertEqual(words[-2], 3)
+
+        # Without labels, computed jumps may return to literal addresses loaded as data: left unchanged
+        self.assertEqual(self.optimize("@1 @5 D=A @R13 A=M 0;JMP")[1], 0)
+
+    @staticmethod
+    def run_optimized(name, ram):
+        with open(os.path.join(PROGRAMS_DIR, "in_asm", name + ".asm")) as file:
+            emulator = Emulator(Assembler().assemble_source(file.read(), optimize=True))
+        for address, value in ram.items():
+            emulator.ram[address] = value
+        emulator.run(100000)
+        return emulator
+
+    def test_optimized_programs_run(self):
+        """
+        Asserts that the optimized programs without labels, whose literal jump targets are labelled although no
+        instruction is removed, still compute what the programs do.
+        """
+        for r0, r1 in ((3, 9), (9, 3), (0xFFF9, 2)):
+            emulator = self.run_optimized("MaxL", {0: r0, 1: r1})
+            self.assertTrue(emulator.halted)
+            self.assertEqual(emulator.ram[2], max(r0, r1, key=lambda value: value - 0x10000 * (value >> 15)))
+        emulator = self.run_optimized("RectL", {0: 3})
+        self.assertTrue(emulator.halted)
+        self.assertEqual([emulator.screen()[row * 32] for row in range(4)], [0xFFFF] * 3 + [0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,12 @@
+import os
+import sys
 import unittest
+from array import array
 
 from Assembler.Parser import Parser
 
+PROGRAMS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Assembler")
+
 
 class TestParserClass(unittest.TestCase):
 
@@ -115,6 +120,93 @@ class TestParserClass(unittest.TestCase):
         self.assertEqual(comp_only_6, "A+1")
         self.assertEqual(comp_only_7, "M")
 
+    def test_tokenize(self):
+        """
+        Asserts that the tokenizer cleans and classifies every line once, skipping blank lines and comments, and splits
+        C instructions into their dest, comp and jump codes.
+        """
+        source = ["// Computes R0 = 2\n", "\n", "(START)\n", "   @2 // two\n", "   D=A\n", "   @R0\n", "   M=D\n",
+                  "   @START\n", "   0;JMP\n", "   AMD = D|M ; JLT\n"]
+        instructions = Parser.tokenize(source)
+        self.assertEqual(instructions, [
+            (Parser.LABEL, "START"),
+            (Parser.A_ADDRESS, 2),
+            (Parser.C, "D=A", "D", "A", None),
+            (Parser.A_SYMBOL, "R0"),
+            (Parser.C, "M=D", "M", "D", None),
+            (Parser.A_SYMBOL, "START"),
+            (Parser.C, "0;JMP", None, "0", "JMP"),
+            (Parser.C, "AMD=D|M;JLT", "AMD", "D|M", "JLT"),
+        ])
+
+    def test_tokenize_line_numbers_and_errors(self):
+        """
+        Asserts that the tokenizer tracks the source line number of every instruction, and reports every invalid line
+        to the errors callback instead of raising on the first.
+        """
+        source = ["// comment\n", "@2\n", "  @foo-bar\n", "\n", "D=A\n", "(LOOP\n", "@40000\n", "0;JMP\n"]
+        with self.assertRaises(ValueError):
+            Parser.tokenize(source)
+
+        line_numbers = array("I")
+        errors = []
+        instructions = Parser.tokenize(source, line_numbers=line_numbers,
+                                       errors=lambda *error: errors.append(error[:3]))
+        self.assertEqual([instruction[0] for instruction in instructions], [Parser.A_ADDRESS, Parser.C, Parser.C])
+        self.assertEqual(line_numbers, array("I", [2, 5, 8]))
+        self.assertEqual(errors, [(3, 3, "E001"), (6, 1, "E002"), (7, 1, "E003")])
+
+    def test_tokenize_fast_path_edge_cases(self):
+        """
+        Asserts that the fast path cleans tabs, carriage returns and comments without a space before them, and checks
+        the bounds of A instructions and labels.
+        """
+        source = ["\t@32767\t// largest address\r\n", "D=M//no space\r\n", " \t(END) // label\n", "\tA M = D + 1 \n",
+                  "@ R1\n", "@32768\n", "@\n", "()\n", "// @1\n", "   \t\r\n"]
+        errors = []
+        instructions = Parser.tokenize(source, errors=lambda *error: errors.append(error[:3]))
+        self.assertEqual(instructions, [(Parser.A_ADDRESS, 32767), (Parser.C, "D=M", "D", "M", None),
+                                        (Parser.LABEL, "END"), (Parser.C, "AM=D+1", "AM", "D+1", None),
+                                        (Parser.A_SYMBOL, "R1")])
+        self.assertEqual(errors, [(6, 1, "E003"), (7, 1, "E001"), (8, 1, "E002")])
+
+        symbols = Parser.tokenize(["@" + "".join(["LO", "OP"]) + "\n"], intern_symbols=True)
+        self.assertIs(symbols[0][1], sys.intern("LOOP"))
+
+    def test_tokenize_matches_the_parse_methods(self):
+        """
+        Asserts that the fast path classifies and splits every line of the bundled programs exactly as clean_line and
+        the precompiled patterns of the is_*/ parse_* methods do.
+        """
+        for name in ("Max.asm", "Rect.asm", "Pong.asm"):
+            with open(os.path.join(PROGRAMS_DIR, "in_asm", name)) as file:
+                lines = file.readlines()
+            expected = []
+            for line in map(Parser.clean_line, lines):
+                if not line:
+                    continue
+                if Parser.is_label_instruction(line):
+                    expected.append((Parser.LABEL, Parser.parse_label_instruction(line)))
+                elif Parser.is_a_instruction_is_address(line):
+                    expected.append((Parser.A_ADDRESS, int(Parser.parse_a_instruction_address(line))))
+                elif Parser.is_a_instruction(line):
+                    expected.append((Parser.A_SYMBOL, Parser.parse_a_instruction_variable(line)))
+                else:
+                    self.assertTrue(Parser.is_c_instruction(line), line)
+                    expected.append((Parser.C, line, Parser.parse_c_instruction_dest(line),
+                                     Parser.parse_c_instruction_comp(line), Parser.parse_c_instruction_jump(line)))
+            self.assertEqual(Parser.tokenize(lines), expected, name)
+
+    def test_is_c_instruction(self):
+        self.assertTrue(Parser.is_c_instruction(self.c_instruction_full_3))
+        self.assertTrue(Parser.is_c_instruction(self.c_instruction_comp_only_2))
+        self.assertTrue(Parser.is_c_instruction(self.c_instruction_comp_and_jump_1))
+        self.assertTrue(Parser.is_c_instruction(self.c_instruction_dest_and_comp_2))
+        self.assertFalse(Parser.is_c_instruction(self.address_1))
+        self.assertFalse(Parser.is_c_instruction(self.label_1))
+        self.assertFalse(Parser.is_c_instruction("D=M;JXX"))
+        self.assertFalse(Parser.is_c_instruction("D=M;"))
+
 
 if __name__ == "__main__":
     unittest.main()
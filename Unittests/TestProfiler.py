@@ -0,0 +1,34 @@
+import json
+import unittest
+
+from Assembler.Profiler import Profile
+
+
+class TestProfileClass(unittest.TestCase):
+
+    def test_count_instructions(self):
+        profile = Profile()
+        instructions = [(0, "LOOP"), (1, 2), (2, "LOOP"), (3, "0;JMP", None, "0", "JMP"), (2, "i")]
+        self.assertEqual(list(profile.count_instructions(instructions)), instructions)
+        self.assertEqual(profile.instructions, {"label": 1, "a_address": 1, "a_symbol": 2, "c": 1})
+
+    def test_timed_lines_keeps_slowest_lines(self):
+        profile = Profile(slowest_lines=2)
+        lines = ["@1\n", "D=A\n", "@2\n", "D=D+A\n"]
+        self.assertEqual(list(profile.timed_lines(lines)), lines)
+        slowest = profile.to_dict()["slowest_lines"]
+        self.assertEqual(len(slowest), 2)
+        self.assertGreaterEqual(slowest[0]["seconds"], slowest[1]["seconds"])
+
+    def test_json_report(self):
+        profile = Profile(out_format="json")
+        with profile.stage("first_pass"):
+            pass
+        profile.record_symbols("first_pass", 23)
+        report = json.loads(profile.report())
+        self.assertIn("first_pass", report["stages"])
+        self.assertEqual(report["symbols"], {"first_pass": 23})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import asyncio
+import os
+import unittest
+
+from Assembler.HackFile import HackFile
+from Assembler.Server import AssemblerServer, assemble_remote
+
+PROGRAMS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Assembler")
+
+
+class TestServerClass(unittest.TestCase):
+
+    @staticmethod
+    async def with_server(client):
+        """
+        Serves an AssemblerServer on a free local TCP port, runs the client coroutine function against its port, then
+        stops the server.
+        :return: the result of the client
+        """
+        started = asyncio.get_running_loop().create_future()
+        serving = asyncio.create_task(AssemblerServer(jobs=1).serve(port=0, ready=started.set_result))
+        server = await started
+        try:
+            return await client(server.sockets[0].getsockname()[1])
+        finally:
+            serving.cancel()
+            try:
+                await serving
+            except asyncio.CancelledError:
+                pass
+
+    @staticmethod
+    async def raw_request(port, request):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        try:
+            writer.write(request)
+            await writer.drain()
+            status, length = (await reader.readline()).split()
+            return status, await reader.readexactly(int(length))
+        finally:
+            await AssemblerServer.close(writer)
+
+    def test_assemble_remote(self):
+        with open(os.path.join(PROGRAMS_DIR, "in_asm", "Rect.asm")) as file:
+            source = file.read()
+        with open(os.path.join(PROGRAMS_DIR, "out_hack", "Rect.hack"), "rb") as file:
+            golden = file.read()
+
+        async def client(port):
+            text = await assemble_remote(source, port=port)
+            rom = await assemble_remote(source.encode(), "bin", "big", port=port)
+            with self.assertRaises(Exception) as context:
+                await assemble_remote("D=D+D\n", port=port)
+            return text, rom, str(context.exception)
+
+        text, rom, error = asyncio.run(self.with_server(client))
+        self.assertEqual(text, golden)
+        self.assertEqual(HackFile.parse_rom(rom, "big"), HackFile.parse_text(golden))
+        self.assertIn("E005", error)
+
+    def test_invalid_headers(self):
+        """
+        Asserts that invalid request headers get an ERR response, rather than dropping the connection.
+        """
+        async def client(port):
+            return [await self.raw_request(port, header)
+                    for header in (b"hack little -5\n@1\n", b"hack little\n", b"hack little five\n", b"txt little 1\n")]
+
+        for status, body in asyncio.run(self.with_server(client)):
+            self.assertEqual(status, b"ERR")
+            self.assertIn(b"Invalid request header", body)
+
+    def test_header_too_long(self):
+        """
+        Asserts that a header line longer than the limit of the stream (64 KiB) gets an ERR response, rather than
+        escaping the handler of the connection.
+        """
+        async def client(port):
+            return await self.raw_request(port, b"h" * (64 * 1024 + 1))
+
+        status, body = asyncio.run(self.with_server(client))
+        self.assertEqual(status, b"ERR")
+        self.assertIn(b"too long", body)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import os
+import tempfile
+import unittest
+from array import array
+
+from Assembler.Assembler import Assembler
+from Assembler.Linker import ObjectModule, Linker
+from Assembler.SourceMap import SourceMap
+
+
+class TestSourceMapClass(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.source = ["// Counts down from R0", "  @R0", "  D=M", "(LOOP)", "  @i", "  M=D", "  @END",
+                      "  D;JEQ  // done", "  D=D-1", "  @LOOP", "  0;JMP", "(END)", "  @END", "  0;JMP"]
+
+    def assemble_map(self, optimize=False):
+        with tempfile.TemporaryDirectory() as out_dir:
+            asm_file = os.path.join(out_dir, "Count.asm")
+            with open(asm_file, "w") as file:
+                file.write("\n".join(self.source))
+            Assembler().assemble(asm_file, out_dir=out_dir + "/", verbose=False, optimize=optimize, source_map=True)
+            return SourceMap.read(os.path.join(out_dir, "Count.map"))
+
+    def test_lookup(self):
+        source_map = self.assemble_map()
+        self.assertEqual(source_map.lines, array("I", [2, 3, 5, 6, 7, 8, 9, 10, 11, 13, 14]))
+        self.assertEqual(source_map.lookup(5)[1], 8)
+        self.assertTrue(source_map.lookup(5)[0].endswith("Count.asm"))
+        with self.assertRaises(ValueError):
+            source_map.lookup(11)
+        self.assertEqual((source_map.labels, source_map.variables), ({"LOOP": 2, "END": 9}, {"i": 16}))
+        self.assertEqual((source_map.address_of("END"), source_map.address_of("i"), source_map.address_of("R0")),
+                         (9, 16, None))
+        self.assertEqual((source_map.label_at(1), source_map.label_at(5), source_map.label_at(9)),
+                         (None, ("LOOP", 3), ("END", 0)))
+        self.assertTrue(source_map.describe(5).endswith("Count.asm:8 (LOOP+3)"))
+
+    def test_round_trip(self):
+        source_map = self.assemble_map()
+        self.assertEqual(SourceMap.from_dict(source_map.to_dict()).to_dict(), source_map.to_dict())
+
+    def test_optimized_lines(self):
+        """
+        Asserts that the lines of an optimized program still point at the source of its remaining instructions.
+        """
+        self.source[4:4] = ["  @R1"]  # A dead A instruction, which the Optimizer removes
+        try:
+            source_map = self.assemble_map(optimize=True)
+        finally:
+            del self.source[4]
+        self.assertEqual(source_map.lines, array("I", [2, 3, 6, 7, 8, 9, 10, 11, 12, 14, 15]))
+
+    def test_linked_source_map(self):
+        main = ["@i", "M=0", "@Sys.init", "0;JMP"]
+        sys_module = ["(Sys.init)", "  @i", "  M=M+1", "(END)", "@END", "0;JMP"]
+        modules = [ObjectModule.from_source(main, "Main.asm"), ObjectModule.from_source(sys_module, "Sys.asm")]
+        source_map = Linker.source_map(modules, Linker.link(modules)[1])
+        self.assertEqual((source_map.lookup(3), source_map.lookup(4), source_map.lookup(7)),
+                         (("Main.asm", 4), ("Sys.asm", 2), ("Sys.asm", 6)))
+        self.assertEqual((source_map.address_of("Sys.init"), source_map.address_of("i")), (4, 16))
+
+
+if __name__ == "__main__":
+    unittest.main()
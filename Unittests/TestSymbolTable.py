@@ -1,3 +1,4 @@
+import pickle
 import unittest
 
 from Assembler.SymbolTable import SymbolTable
@@ -67,6 +68,62 @@ class TestParserClass(unittest.TestCase):
         # Assert that the pre-determined symbols are initialised with the symbol table
         pass
 
+    def test_add_symbol_inserts_only_if_absent(self):
+        """
+        Testing that SymbolTable().add_symbol only adds new symbols, and never overwrites an existing symbol (neither a
+        predefined symbol nor an added one).
+        """
+        symbol_table = SymbolTable()
+        self.assertTrue(symbol_table.add_symbol("LOOP", 10))
+        self.assertFalse(symbol_table.add_symbol("LOOP", 20))
+        self.assertFalse(symbol_table.add_symbol("SCREEN", 20))
+        self.assertEqual(symbol_table.get_address("LOOP"), 10)
+        self.assertEqual(symbol_table.get_address("SCREEN"), 0x4000)
+        self.assertEqual(len(symbol_table), 24)
+
+    def test_predefined_symbols_are_shared_copy_on_write(self):
+        """
+        Testing that adding a symbol to one SymbolTable never changes the shared predefined symbols or another table.
+        """
+        symbol_table = SymbolTable()
+        symbol_table.add_symbol("sys.init", 100)
+        self.assertFalse(SymbolTable().contains("sys.init"))
+        self.assertNotIn("sys.init", SymbolTable.PREDEFINED)
+        self.assertEqual(len(SymbolTable.PREDEFINED), 23)
+
+    def test_predefined_symbols_are_overlaid(self):
+        """
+        Testing that a new SymbolTable does not copy the predefined symbols, but still looks them up.
+        """
+        symbol_table = SymbolTable()
+        symbol_table.add_symbol("LOOP", 10)
+        self.assertEqual(dict(symbol_table._symbols), {"LOOP": 10})
+        self.assertEqual(symbol_table["KBD"], 0x6000)
+        with self.assertRaises(KeyError):
+            symbol_table.get_address("END")
+
+    def test_dict_methods(self):
+        """
+        Testing that the SymbolTable can still be used like the dictionary it used to be.
+        """
+        symbol_table = SymbolTable()
+        symbol_table["i"] = 16
+        symbol_table.update({"sum": 17, "SP": 256})
+        self.assertEqual((symbol_table.get("i"), symbol_table.get("R15"), symbol_table.get("END", -1)), (16, 15, -1))
+        self.assertEqual(symbol_table.setdefault("sum", 0), 17)
+        self.assertEqual(len(symbol_table), 25)
+        self.assertEqual(dict(symbol_table.items()), {**SymbolTable.PREDEFINED, "i": 16, "sum": 17, "SP": 256})
+        self.assertEqual(list(symbol_table)[-2:], ["i", "sum"])
+
+        copy = symbol_table.copy()
+        self.assertEqual(copy, symbol_table)
+        self.assertEqual(pickle.loads(pickle.dumps(symbol_table)), symbol_table)
+        del copy["SP"]  # Restores the predefined address of SP
+        self.assertEqual((copy["SP"], symbol_table["SP"]), (0, 256))
+        self.assertEqual(symbol_table.pop("i"), 16)
+        self.assertNotIn("i", symbol_table)
+        self.assertIn("i", copy)
+
 
 
 
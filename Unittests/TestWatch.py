@@ -0,0 +1,67 @@
+import os
+import random
+import tempfile
+import unittest
+
+from Assembler.Assembler import Assembler
+from Assembler.HackFile import HackFile
+from Assembler.Watch import IncrementalAssembly, Watch
+
+PROGRAMS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Assembler")
+
+
+class TestWatchClass(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        with open(os.path.join(PROGRAMS_DIR, "in_asm", "Rect.asm")) as file:
+            cls.lines = file.readlines()
+
+    def test_diff(self):
+        old = ["a", "b", "c", "d", "e", "f", "g", "h", "i", "j"]
+        self.assertEqual(IncrementalAssembly.diff(old, list(old)), [])
+        self.assertEqual(IncrementalAssembly.diff(old, old[:2] + ["x"] + old[2:]), [(2, 2, 2, 3)])
+        self.assertEqual(IncrementalAssembly.diff(old, ["x"] + old[1:8] + ["y", "z"]), [(0, 1, 0, 1), (8, 10, 8, 10)])
+
+    def test_edits_match_full_assembly(self):
+        """
+        Asserts that the words stay identical to a full assembly through edits which move labels, allocate and free
+        variables, and define and remove labels.
+        """
+        assembly = IncrementalAssembly(self.lines)
+        self.assertEqual(assembly.words, Assembler().assemble_source(self.lines))
+        pool = ["D=D+1\n", "@new\n", "@LOOP\n", "(NEW)\n", "@NEW\n", "// comment\n", "\n", "@counter\n"]
+        random.seed(0)
+        for _ in range(200):
+            lines = list(assembly.lines)
+            index = random.randrange(len(lines) + 1)
+            if random.random() < 0.5 or len(lines) < 10:
+                lines.insert(index, random.choice(pool))
+            else:
+                del lines[index - 1]
+            span = assembly.update(lines)
+            expected = Assembler().assemble_source(lines)
+            self.assertEqual(assembly.words, expected)
+            if span is not None:
+                self.assertLessEqual(span[1], len(expected))
+
+    def test_invalid_edit_keeps_the_state(self):
+        assembly = IncrementalAssembly(self.lines)
+        words = assembly.words.tolist()
+        with self.assertRaises(ValueError):
+            assembly.update(self.lines[:5] + ["D=D+D\n"] + self.lines[5:])
+        self.assertEqual((assembly.words.tolist(), assembly.lines), (words, self.lines))
+        self.assertIsNone(assembly.update(self.lines[:5] + ["// only a comment\n"] + self.lines[5:]))
+
+    def test_write_span(self):
+        assembly = IncrementalAssembly(self.lines)
+        with tempfile.TemporaryDirectory() as out_dir:
+            out_filename = os.path.join(out_dir, "Rect.hack")
+            Watch.write_span(assembly.words, out_filename, (0, len(assembly.words)))
+            for lines in (self.lines[:10] + ["D=A\n"] + self.lines[11:], self.lines[:3] + self.lines[4:]):
+                Watch.write_span(assembly.words, out_filename, assembly.update(lines))
+                self.assertEqual(HackFile.read_words(out_filename), Assembler().assemble_source(lines))
+
+
+if __name__ == "__main__":
+    unittest.main()